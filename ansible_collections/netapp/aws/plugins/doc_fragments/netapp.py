@@ -42,6 +42,36 @@ options:
     description:
     - Should https certificates be validated?
     type: bool
+  lookup_cache_ttl:
+    required: false
+    default: 0
+    description:
+    - Time in seconds to keep the list of filesystems, pools, or snapshots in a disk cache, to speed up lookups across tasks.
+    - The cache is specific to the api_url and api_key, and is cleared when a module makes a change.
+    - The cache is disabled by default.
+    type: int
+    version_added: 20.7.0
+  lookup_cache_dir:
+    required: false
+    description:
+    - Directory for the lookup cache, used when lookup_cache_ttl is set.
+    - Defaults to ~/.ansible/netapp/aws_cvs_cache.
+    type: path
+    version_added: 20.7.0
+  http_retries:
+    required: false
+    description:
+    - Number of times a throttled (429) or unavailable (503) request is retried, with exponential backoff.
+    type: int
+    default: 3
+    version_added: 20.7.0
+  http_max_concurrency:
+    required: false
+    description:
+    - Maximum number of requests in flight to the API host at the same time.
+    type: int
+    default: 10
+    version_added: 20.7.0
 notes:
   - The modules prefixed with aws\\_cvs\\_netapp are built to Manage AWS Cloud Volumes Service .
 """
@@ -29,10 +29,13 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import hashlib
 import json
 import os
 import random
 import mimetypes
+import threading
+import time
 
 from pprint import pformat
 from ansible.module_utils import six
@@ -75,31 +78,164 @@ POW2_BYTE_MAP = dict(
 )
 
 
+# job states reported by the Jobs API
+JOB_DONE_STATES = ('done',)
+JOB_ERROR_STATES = ('error', 'failed')
+JOB_TIMEOUT = 600
+
+# default location for the lookup cache, when lookup_cache_ttl is set
+LOOKUP_CACHE_DIR = os.path.join('~', '.ansible', 'netapp', 'aws_cvs_cache')
+
+# throttling or temporary unavailability, the request can be sent again
+RETRY_STATUS_CODES = (429, 503)
+
+# limit the number of requests in flight to a host, shared by all the clients in a process
+HOST_SEMAPHORES = dict()
+HOST_SEMAPHORES_LOCK = threading.Lock()
+
+
+def get_host_semaphore(host, max_concurrency):
+    ''' return the semaphore for a host, the first client to use a host sets the limit '''
+    with HOST_SEMAPHORES_LOCK:
+        if host not in HOST_SEMAPHORES:
+            HOST_SEMAPHORES[host] = threading.BoundedSemaphore(max_concurrency)
+        return HOST_SEMAPHORES[host]
+
+
+def get_retry_delay(attempt, backoff_factor, max_backoff, retry_after=None):
+    ''' exponential backoff with full jitter, a Retry-After header in seconds takes precedence if larger '''
+    delay = random.uniform(0, min(max_backoff, backoff_factor * 2 ** attempt))
+    try:
+        delay = max(delay, min(max_backoff, float(retry_after)))
+    except (TypeError, ValueError):
+        pass
+    return delay
+
+
 def aws_cvs_host_argument_spec():
 
     return dict(
         api_url=dict(required=True, type='str'),
         validate_certs=dict(required=False, type='bool', default=True),
         api_key=dict(required=True, type='str'),
-        secret_key=dict(required=True, type='str')
+        secret_key=dict(required=True, type='str'),
+        lookup_cache_ttl=dict(required=False, type='int', default=0),
+        lookup_cache_dir=dict(required=False, type='path'),
+        http_retries=dict(required=False, type='int', default=3),
+        http_max_concurrency=dict(required=False, type='int', default=10),
     )
 
 
 class AwsCvsRestAPI(object):
-    def __init__(self, module, timeout=60):
+    def __init__(self, module, timeout=60, pool_maxsize=10, keep_alive=True, retries=3, backoff_factor=0.5,
+                 max_backoff=30, max_host_concurrency=10):
         self.module = module
         self.api_key = self.module.params['api_key']
         self.secret_key = self.module.params['secret_key']
         self.api_url = self.module.params['api_url']
         self.verify = self.module.params['validate_certs']
         self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        # retry policy for throttled requests, the module options take precedence
+        self.retries = self.get_option('http_retries', retries)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        max_host_concurrency = self.get_option('http_max_concurrency', max_host_concurrency)
+        self.host_semaphore = get_host_semaphore(self.api_url, max_host_concurrency)
+        self.session = None
+        self.session_lock = threading.Lock()
+        self.stats = dict(requests=0, retries=0, request_time=0.0, max_request_time=0.0)
+        self.stats_lock = threading.Lock()
         self.url = 'https://' + self.api_url + '/v1/'
+        self.cache_ttl = self.module.params.get('lookup_cache_ttl') or 0
+        # the cache is specific to an account
+        cache_dir = os.path.expanduser(self.module.params.get('lookup_cache_dir') or LOOKUP_CACHE_DIR)
+        account = hashlib.sha256(('%s:%s' % (self.api_url, self.api_key)).encode('utf-8')).hexdigest()
+        self.cache_dir = os.path.join(cache_dir, account)
+        # records and indexes already fetched during this run
+        self.records = dict()
+        self.indexes = dict()
         self.check_required_library()
 
+    def get_option(self, name, default):
+        value = self.module.params.get(name)
+        return default if value is None else value
+
     def check_required_library(self):
         if not HAS_REQUESTS:
             self.module.fail_json(msg=missing_required_lib('requests'))
 
+    def get_session(self):
+        ''' create a pooled session on first use, the credentials are only set once '''
+        with self.session_lock:
+            if self.session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount('https://', adapter)
+                session.verify = self.verify
+                session.headers.update({
+                    'Content-type': "application/json",
+                    'api-key': self.api_key,
+                    'secret-key': self.secret_key,
+                    'Cache-Control': "no-cache",
+                })
+                if not self.keep_alive:
+                    session.headers['Connection'] = 'close'
+                self.session = session
+        return self.session
+
+    def get_stats(self):
+        ''' report requests, retries, and time spent in requests, and how many connections were opened or reused '''
+        with self.stats_lock:
+            stats = dict(self.stats)
+        stats['new_connections'] = 0
+        stats['reused_connections'] = 0
+        if self.session is None:
+            return stats
+        pools = self.session.get_adapter(self.url).poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats['new_connections'] += pool.num_connections
+            stats['reused_connections'] += max(0, pool.num_requests - pool.num_connections)
+        return stats
+
+    def update_stats(self, elapsed, retry=False):
+        with self.stats_lock:
+            if retry:
+                self.stats['retries'] += 1
+                return
+            self.stats['requests'] += 1
+            self.stats['request_time'] += elapsed
+            self.stats['max_request_time'] = max(self.stats['max_request_time'], elapsed)
+
+    def request_with_retry(self, method, url, **kwargs):
+        ''' send a request, and send it again with a jittered backoff when throttled
+            connection errors are only retried for GET, as the request may have been processed
+        '''
+        session = self.get_session()
+        attempt = 0
+        while True:
+            start = time.time()
+            try:
+                with self.host_semaphore:
+                    response = session.request(method, url, **kwargs)
+            except requests.exceptions.ConnectionError:
+                if method != 'GET' or attempt >= self.retries:
+                    raise
+                delay = get_retry_delay(attempt, self.backoff_factor, self.max_backoff)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.retries:
+                    return response
+                delay = get_retry_delay(attempt, self.backoff_factor, self.max_backoff, response.headers.get('Retry-After'))
+            finally:
+                self.update_stats(time.time() - start)
+            attempt += 1
+            self.update_stats(0, retry=True)
+            time.sleep(delay)
+
     def send_request(self, method, api, params, json=None):
         ''' send http request and process reponse, including error conditions '''
         url = self.url + api
@@ -108,13 +244,6 @@ class AwsCvsRestAPI(object):
         json_dict = None
         json_error = None
         error_details = None
-        headers = {
-            'Content-type': "application/json",
-            'api-key': self.api_key,
-            'secret-key': self.secret_key,
-            'Cache-Control': "no-cache",
-        }
-
         def get_json(response):
             ''' extract json, and error message if present '''
             try:
@@ -129,7 +258,7 @@ class AwsCvsRestAPI(object):
                 error = None
             return json, error
         try:
-            response = requests.request(method, url, headers=headers, timeout=self.timeout, json=json)
+            response = self.request_with_retry(method, url, timeout=self.timeout, json=json, params=params)
             status_code = response.status_code
             # If the response was successful, no Exception will be raised
             json_dict, json_error = get_json(response)
@@ -153,24 +282,151 @@ class AwsCvsRestAPI(object):
 
     def post(self, api, data, params=None):
         method = 'POST'
+        self.clear_cache()
         return self.send_request(method, api, params, json=data)
 
     def patch(self, api, data, params=None):
         method = 'PATCH'
+        self.clear_cache()
         return self.send_request(method, api, params, json=data)
 
     def put(self, api, data, params=None):
         method = 'PUT'
+        self.clear_cache()
         return self.send_request(method, api, params, json=data)
 
     def delete(self, api, data, params=None):
         method = 'DELETE'
+        self.clear_cache()
         return self.send_request(method, api, params, json=data)
 
-    def get_state(self, jobId):
-        """ Method to get the state of the job """
-        method = 'GET'
-        response, status_code = self.get('Jobs/%s' % jobId)
-        while str(response['state']) not in 'done':
-            response, status_code = self.get('Jobs/%s' % jobId)
-        return 'done'
+    def get_cache_path(self, cache_key):
+        digest = hashlib.sha256(cache_key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest + '.json')
+
+    def read_cache(self, cache_key):
+        ''' return the cached records, or None if the cache is disabled, missing, or expired '''
+        if self.cache_ttl <= 0:
+            return None
+        try:
+            with open(self.get_cache_path(cache_key)) as cache_file:
+                cache = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or time.time() - cache.get('time', 0) > self.cache_ttl:
+            return None
+        return cache.get('records')
+
+    def write_cache(self, cache_key, records):
+        ''' a cache is an optimization, errors are ignored '''
+        if self.cache_ttl <= 0:
+            return
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, 0o700)
+            fd = os.open(self.get_cache_path(cache_key), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(dict(time=time.time(), records=records), cache_file)
+        except (IOError, OSError, TypeError, ValueError):
+            pass
+
+    def clear_cache(self):
+        ''' any change may invalidate the records already fetched for this account '''
+        if self.cache_ttl > 0 and os.path.isdir(self.cache_dir):
+            for filename in os.listdir(self.cache_dir):
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError:
+                    pass
+        self.records = dict()
+        self.indexes = dict()
+
+    def get_records(self, api, region=None, params=None):
+        '''
+        Return the list of records for a collection, restricted to a region if set, and an error if any
+        Records are fetched once per run, and are cached on disk for lookup_cache_ttl seconds when set
+        '''
+        cache_key = json.dumps((api, region, sorted(params.items()) if params else None))
+        if cache_key in self.records:
+            return self.records[cache_key], None
+        records = self.read_cache(cache_key)
+        if records is None:
+            records, error = self.get(api, params)
+            if error:
+                return None, error
+            records = records or list()
+            if region is not None:
+                records = [record for record in records if record.get('region', region) == region]
+            self.write_cache(cache_key, records)
+        self.records[cache_key] = records
+        return records, None
+
+    def get_index(self, api, key, region=None, params=None):
+        ''' Return a dict of records indexed by key, and an error if any '''
+        index_key = json.dumps((api, key, region, sorted(params.items()) if params else None))
+        if index_key not in self.indexes:
+            records, error = self.get_records(api, region, params)
+            if error:
+                return None, error
+            self.indexes[index_key] = dict((record[key], record) for record in records if key in record)
+        return self.indexes[index_key], None
+
+    def lookup(self, api, key, value, region=None, params=None):
+        ''' Return the record where key matches value, or None, and an error if any '''
+        index, error = self.get_index(api, key, region, params)
+        if error:
+            return None, error
+        return index.get(value), None
+
+    def get_state(self, jobId, timeout=JOB_TIMEOUT):
+        """ Method to get the state of the job, waits until the job completes or timeout seconds have elapsed """
+        state, error = self.wait_for_jobs([jobId], timeout)[jobId]
+        return state
+
+    def wait_for_jobs(self, job_ids, timeout=JOB_TIMEOUT, interval=1, max_interval=30):
+        """
+        Poll jobs until they reach a terminal state, or until timeout seconds have elapsed
+        The interval between polls starts at interval seconds, and doubles up to max_interval seconds
+        Return a dict indexed by job id, with a (state, error) tuple. error is None on success
+        """
+        results = dict((job_id, (None, None)) for job_id in job_ids)
+        pending = list(results)
+        deadline = time.time() + timeout
+        while pending:
+            for job_id in list(pending):
+                response, error = self.get('Jobs/%s' % job_id)
+                if error is not None:
+                    results[job_id] = (None, 'Error getting state for job %s: %s' % (job_id, error))
+                    pending.remove(job_id)
+                    continue
+                state = str(response.get('state'))
+                if state in JOB_DONE_STATES:
+                    results[job_id] = (state, None)
+                    pending.remove(job_id)
+                elif state in JOB_ERROR_STATES:
+                    results[job_id] = (state, 'Error: job %s failed: %s' % (job_id, response.get('stateDetails')))
+                    pending.remove(job_id)
+                else:
+                    results[job_id] = (state, None)
+            if not pending:
+                break
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                for job_id in pending:
+                    results[job_id] = (results[job_id][0], 'Error: timeout waiting for job %s, state: %s' % (job_id, results[job_id][0]))
+                break
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+        return results
+
+    def wait_on_response(self, response, timeout=JOB_TIMEOUT):
+        """
+        Wait for all the jobs reported in a POST, PUT, or DELETE response
+        Return an error message, or None if all jobs completed successfully, or if there is no job
+        """
+        try:
+            job_ids = [job['jobId'] for job in response['jobs']]
+        except (KeyError, TypeError):
+            return None
+        errors = [error for state, error in self.wait_for_jobs(job_ids, timeout).values() if error is not None]
+        return '; '.join(errors) if errors else None
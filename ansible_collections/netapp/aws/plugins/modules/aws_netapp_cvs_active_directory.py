@@ -109,6 +109,13 @@ EXAMPLES = """
 """
 
 RETURN = '''
+http_stats:
+    description:
+    - Statistics for the REST requests sent by the module, including the number of retries after throttling.
+    - request_time and max_request_time are in seconds.
+    returned: always
+    type: dict
+    sample: {"requests": 4, "retries": 1, "request_time": 1.2, "max_request_time": 0.6, "new_connections": 1, "reused_connections": 3}
 '''
 
 import ansible_collections.netapp.aws.plugins.module_utils.netapp as netapp_utils
@@ -261,7 +268,7 @@ class AwsCvsNetappActiveDir(object):
                 elif cd_action == 'delete':
                     self.delete_activedirectory()
 
-        self.module.exit_json(changed=self.na_helper.changed)
+        self.module.exit_json(changed=self.na_helper.changed, http_stats=self.restApi.get_stats())
 
 
 def main():
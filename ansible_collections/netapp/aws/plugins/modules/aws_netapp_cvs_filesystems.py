@@ -105,6 +105,20 @@ options:
                   description:
                   - Should fileSystem have read write permission or not
                   type: bool
+
+  wait_for_completion:
+    description:
+    - Whether to wait for the job started by a create, update, or delete operation to complete.
+    type: bool
+    default: true
+    version_added: 20.7.0
+
+  wait_timeout:
+    description:
+    - Time in seconds to wait for the job to complete, when wait_for_completion is set.
+    type: int
+    default: 600
+    version_added: 20.7.0
 '''
 
 EXAMPLES = """
@@ -158,6 +172,13 @@ EXAMPLES = """
 """
 
 RETURN = """
+http_stats:
+    description:
+    - Statistics for the REST requests sent by the module, including the number of retries after throttling.
+    - request_time and max_request_time are in seconds.
+    returned: always
+    type: dict
+    sample: {"requests": 4, "retries": 1, "request_time": 1.2, "max_request_time": 0.6, "new_connections": 1, "reused_connections": 3}
 """
 
 import ansible_collections.netapp.aws.plugins.module_utils.netapp as netapp_utils
@@ -203,6 +224,8 @@ class AwsCvsNetappFileSystem(object):
                     )
                 )
             ),
+            wait_for_completion=dict(required=False, type='bool', default=True),
+            wait_timeout=dict(required=False, type='int', default=600),
         ))
 
         self.module = AnsibleModule(
@@ -223,18 +246,17 @@ class AwsCvsNetappFileSystem(object):
 
         self.data = {}
         for key in self.parameters.keys():
-            self.data[key] = self.parameters[key]
+            if key not in ('wait_for_completion', 'wait_timeout'):
+                self.data[key] = self.parameters[key]
 
     def get_filesystemId(self):
         # Check given FileSystem is exists
         # Return fileSystemId is found, None otherwise
-        list_filesystem, error = self.restApi.get('FileSystems')
+        fileSystem, error = self.restApi.lookup('FileSystems', 'creationToken', self.parameters['creationToken'], self.parameters['region'])
         if error:
             self.module.fail_json(msg=error)
-
-        for FileSystem in list_filesystem:
-            if FileSystem['creationToken'] == self.parameters['creationToken']:
-                return FileSystem['fileSystemId']
+        if fileSystem is not None:
+            return fileSystem['fileSystemId']
         return None
 
     def get_filesystem(self, fileSystemId):
@@ -247,27 +269,26 @@ class AwsCvsNetappFileSystem(object):
             return filesystemInfo
         return None
 
-    def is_job_done(self, response):
-        # check jobId is present and equal to 'done'
-        # return True on success, False otherwise
+    def wait_on_job(self, response, action):
+        # check jobId is present, and wait for the job to complete
+        # return None on success, an error message otherwise
         try:
             job_id = response['jobs'][0]['jobId']
-        except TypeError:
-            job_id = None
-
-        if job_id is not None and self.restApi.get_state(job_id) == 'done':
-            return True
-        return False
+        except (TypeError, KeyError, IndexError):
+            return "Error: unexpected response on FileSystems %s: %s" % (action, str(response))
+        if not self.parameters['wait_for_completion']:
+            return None
+        state, error = self.restApi.wait_for_jobs([job_id], self.parameters['wait_timeout'])[job_id]
+        return error
 
     def create_fileSystem(self):
         # Create fileSystem
         api = 'FileSystems'
         response, error = self.restApi.post(api, self.data)
         if not error:
-            if self.is_job_done(response):
-                return
-            error = "Error: unexpected response on FileSystems create: %s" % str(response)
-        self.module.fail_json(msg=error)
+            error = self.wait_on_job(response, 'create')
+        if error:
+            self.module.fail_json(msg=error)
 
     def delete_fileSystem(self, fileSystemId):
         # Delete FileSystem
@@ -275,20 +296,18 @@ class AwsCvsNetappFileSystem(object):
         self.data = None
         response, error = self.restApi.delete(api, self.data)
         if not error:
-            if self.is_job_done(response):
-                return
-            error = "Error: unexpected response on FileSystems delete: %s" % str(response)
-        self.module.fail_json(msg=error)
+            error = self.wait_on_job(response, 'delete')
+        if error:
+            self.module.fail_json(msg=error)
 
     def update_fileSystem(self, fileSystemId):
         # Update FileSystem
         api = 'FileSystems/' + fileSystemId
         response, error = self.restApi.put(api, self.data)
         if not error:
-            if self.is_job_done(response):
-                return
-            error = "Error: unexpected response on FileSystems update: %s" % str(response)
-        self.module.fail_json(msg=error)
+            error = self.wait_on_job(response, 'update')
+        if error:
+            self.module.fail_json(msg=error)
 
     def apply(self):
         """
@@ -345,7 +364,7 @@ class AwsCvsNetappFileSystem(object):
                 else:   # modify
                     self.update_fileSystem(fileSystemId)
                     result_message = "FileSystem Updated"
-        self.module.exit_json(changed=self.na_helper.changed, msg=result_message)
+        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, http_stats=self.restApi.get_stats())
 
 
 def main():
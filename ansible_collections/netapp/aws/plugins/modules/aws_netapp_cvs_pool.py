@@ -68,6 +68,18 @@ options:
         - I(from_name) is the existing name, and I(name) the new name
         - can be used with update operation
         type: str
+    wait_for_completion:
+        description:
+        - Whether to wait for the jobs started by a create, update, or delete operation to complete.
+        type: bool
+        default: true
+        version_added: 20.7.0
+    wait_timeout:
+        description:
+        - Time in seconds to wait for the jobs to complete, when wait_for_completion is set.
+        type: int
+        default: 600
+        version_added: 20.7.0
 '''
 
 EXAMPLES = """
@@ -108,6 +120,13 @@ EXAMPLES = """
 """
 
 RETURN = '''
+http_stats:
+    description:
+    - Statistics for the REST requests sent by the module, including the number of retries after throttling.
+    - request_time and max_request_time are in seconds.
+    returned: always
+    type: dict
+    sample: {"requests": 4, "retries": 1, "request_time": 1.2, "max_request_time": 0.6, "new_connections": 1, "reused_connections": 3}
 '''
 
 import ansible_collections.netapp.aws.plugins.module_utils.netapp as netapp_utils
@@ -132,6 +151,8 @@ class NetAppAWSCVS(object):
             serviceLevel=dict(required=False, choices=['basic', 'standard', 'extreme'], type='str'),
             sizeInBytes=dict(required=False, type='int'),
             vendorID=dict(required=False, type='str'),
+            wait_for_completion=dict(required=False, type='bool', default=True),
+            wait_timeout=dict(required=False, type='int', default=600),
         ))
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
@@ -147,20 +168,10 @@ class NetAppAWSCVS(object):
         """
         Returns Pool object if exists else Return None
         """
-        pool_info = None
-
         if name is None:
             name = self.parameters['name']
 
-        pools, error = self.restApi.get('Pools')
-
-        if error is None and pools is not None:
-            for pool in pools:
-                if 'name' in pool and pool['region'] == self.parameters['region']:
-                    if pool['name'] == name:
-                        pool_info = pool
-                        break
-
+        pool_info, error = self.restApi.lookup('Pools', 'name', name, self.parameters['region'])
         return pool_info
 
     def create_aws_netapp_cvs_pool(self):
@@ -182,6 +193,8 @@ class NetAppAWSCVS(object):
         }
 
         response, error = self.restApi.post(api, pool)
+        if error is None and self.parameters['wait_for_completion']:
+            error = self.restApi.wait_on_response(response, self.parameters['wait_timeout'])
         if error is not None:
             self.module.fail_json(changed=False, msg=error)
 
@@ -200,6 +213,8 @@ class NetAppAWSCVS(object):
         }
 
         response, error = self.restApi.put(api, pool)
+        if error is None and self.parameters['wait_for_completion']:
+            error = self.restApi.wait_on_response(response, self.parameters['wait_timeout'])
         if error is not None:
             self.module.fail_json(changed=False, msg=error)
 
@@ -210,7 +225,8 @@ class NetAppAWSCVS(object):
         api = 'Pools/' + pool_id
         data = None
         response, error = self.restApi.delete(api, data)
-
+        if error is None and self.parameters['wait_for_completion']:
+            error = self.restApi.wait_on_response(response, self.parameters['wait_timeout'])
         if error is not None:
             self.module.fail_json(changed=False, msg=error)
 
@@ -254,7 +270,7 @@ class NetAppAWSCVS(object):
                 elif cd_action == 'delete':
                     self.delete_aws_netapp_cvs_pool(current['poolId'])
 
-        self.module.exit_json(changed=self.na_helper.changed)
+        self.module.exit_json(changed=self.na_helper.changed, http_stats=self.restApi.get_stats())
 
 
 def main():
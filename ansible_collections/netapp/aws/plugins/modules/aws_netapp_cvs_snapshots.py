@@ -58,6 +58,20 @@ options:
     - ID or Name of the snapshot to rename.
     - Required to create an snapshot called 'name' by renaming 'from_name'.
     type: str
+
+  wait_for_completion:
+    description:
+    - Whether to wait for the jobs started by a create, update, or delete operation to complete.
+    type: bool
+    default: true
+    version_added: 20.7.0
+
+  wait_timeout:
+    description:
+    - Time in seconds to wait for the jobs to complete, when wait_for_completion is set.
+    type: int
+    default: 600
+    version_added: 20.7.0
 '''
 
 EXAMPLES = """
@@ -93,6 +107,13 @@ EXAMPLES = """
 """
 
 RETURN = """
+http_stats:
+    description:
+    - Statistics for the REST requests sent by the module, including the number of retries after throttling.
+    - request_time and max_request_time are in seconds.
+    returned: always
+    type: dict
+    sample: {"requests": 4, "retries": 1, "request_time": 1.2, "max_request_time": 0.6, "new_connections": 1, "reused_connections": 3}
 """
 
 import ansible_collections.netapp.aws.plugins.module_utils.netapp as netapp_utils
@@ -120,7 +141,9 @@ class AwsCvsNetappSnapshot(object):
             region=dict(required=True, type='str'),
             name=dict(required=True, type='str'),
             from_name=dict(required=False, type='str'),
-            fileSystemId=dict(required=False, type='str')
+            fileSystemId=dict(required=False, type='str'),
+            wait_for_completion=dict(required=False, type='bool', default=True),
+            wait_timeout=dict(required=False, type='int', default=600),
         ))
 
         self.module = AnsibleModule(
@@ -138,35 +161,36 @@ class AwsCvsNetappSnapshot(object):
         # Calling generic AWSCVS restApi class
         self.restApi = AwsCvsRestAPI(self.module)
 
+        self.fileSystemId = None
+
         # Checking for the parameters passed and create new parameters list
         self.data = {}
         for key in self.parameters.keys():
-            self.data[key] = self.parameters[key]
+            if key not in ('wait_for_completion', 'wait_timeout'):
+                self.data[key] = self.parameters[key]
 
     def getSnapshotId(self, name):
         # Check if  snapshot exists
         # Return snpashot Id  If Snapshot is found, None otherwise
-        list_snapshots, error = self.restApi.get('Snapshots')
+        # restrict the query to the filesystem snapshots when the filesystem is known
+        api = 'Snapshots' if self.fileSystemId is None else 'FileSystems/%s/Snapshots' % self.fileSystemId
+        snapshot, error = self.restApi.lookup(api, 'name', name, self.parameters['region'])
 
         if error:
             self.module.fail_json(msg=error)
-
-        for snapshot in list_snapshots:
-            if snapshot['name'] == name:
-                return snapshot['snapshotId']
+        if snapshot is not None:
+            return snapshot['snapshotId']
         return None
 
     def getfilesystemId(self):
         # Check given FileSystem is exists
         # Return fileSystemId is found, None otherwise
-        list_filesystem, error = self.restApi.get('FileSystems')
-
-        if error:
-            self.module.fail_json(msg=error)
-        for FileSystem in list_filesystem:
-            if FileSystem['fileSystemId'] == self.parameters['fileSystemId']:
-                return FileSystem['fileSystemId']
-            elif FileSystem['creationToken'] == self.parameters['fileSystemId']:
+        # both indexes are built from the same list of filesystems
+        for key in ('fileSystemId', 'creationToken'):
+            FileSystem, error = self.restApi.lookup('FileSystems', key, self.parameters['fileSystemId'], self.parameters['region'])
+            if error:
+                self.module.fail_json(msg=error)
+            if FileSystem is not None:
                 return FileSystem['fileSystemId']
         return None
 
@@ -174,6 +198,8 @@ class AwsCvsNetappSnapshot(object):
         # Create Snapshot
         api = 'Snapshots'
         response, error = self.restApi.post(api, self.data)
+        if not error and self.parameters['wait_for_completion']:
+            error = self.restApi.wait_on_response(response, self.parameters['wait_timeout'])
         if error:
             self.module.fail_json(msg=error)
 
@@ -181,6 +207,8 @@ class AwsCvsNetappSnapshot(object):
         # Rename Snapshot
         api = 'Snapshots/' + snapshotId
         response, error = self.restApi.put(api, self.data)
+        if not error and self.parameters['wait_for_completion']:
+            error = self.restApi.wait_on_response(response, self.parameters['wait_timeout'])
         if error:
             self.module.fail_json(msg=error)
 
@@ -189,6 +217,8 @@ class AwsCvsNetappSnapshot(object):
         api = 'Snapshots/' + snapshotId
         data = None
         response, error = self.restApi.delete(api, self.data)
+        if not error and self.parameters['wait_for_completion']:
+            error = self.restApi.wait_on_response(response, self.parameters['wait_timeout'])
         if error:
             self.module.fail_json(msg=error)
 
@@ -196,13 +226,14 @@ class AwsCvsNetappSnapshot(object):
         """
         Perform pre-checks, call functions and exit
         """
+        if 'fileSystemId' in self.data:
+            self.fileSystemId = self.getfilesystemId()
         self.snapshotId = self.getSnapshotId(self.data['name'])
 
         if self.snapshotId is None and 'fileSystemId' in self.data:
-            self.fileSystemId = self.getfilesystemId()
-            self.data['fileSystemId'] = self.fileSystemId
             if self.fileSystemId is None:
                 self.module.fail_json(msg='Error: Specified filesystem id %s does not exist ' % self.data['fileSystemId'])
+            self.data['fileSystemId'] = self.fileSystemId
 
         cd_action = self.na_helper.get_cd_action(self.snapshotId, self.data)
         result_message = ""
@@ -231,7 +262,7 @@ class AwsCvsNetappSnapshot(object):
                         # If from_name is not defined, Create from scratch.
                         result_message = "Snapshot Created"
 
-        self.module.exit_json(changed=self.na_helper.changed, msg=result_message)
+        self.module.exit_json(changed=self.na_helper.changed, msg=result_message, http_stats=self.restApi.get_stats())
 
 
 def main():
@@ -13,6 +13,7 @@ from ansible_collections.netapp.aws.tests.unit.compat import unittest
 from ansible_collections.netapp.aws.tests.unit.compat.mock import patch, Mock
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
+import requests
 from requests import Response
 from ansible_collections.netapp.aws.plugins.modules.aws_netapp_cvs_filesystems \
     import AwsCvsNetappFileSystem as fileSystem_module
@@ -119,13 +120,13 @@ class TestMyModule(unittest.TestCase):
         assert exc.value.args[0]['changed']
 
     @patch('ansible_collections.netapp.aws.plugins.modules.aws_netapp_cvs_filesystems.AwsCvsNetappFileSystem.get_filesystemId')
-    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.get_state')
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.wait_for_jobs')
     @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.post')
     def test_create_aws_netapp_cvs_snapshots_pass(self, get_post_api, get_state_api, get_filesystemId):
         set_module_args(self.set_args_create_aws_netapp_cvs_filesystems())
         my_obj = fileSystem_module()
         get_filesystemId.return_value = None
-        get_state_api.return_value = 'done'
+        get_state_api.return_value = {'dummy': ('done', None)}
         response = {'jobs': [{'jobId': 'dummy'}]}
         get_post_api.return_value = response, None
         with pytest.raises(AnsibleExitJson) as exc:
@@ -135,17 +136,133 @@ class TestMyModule(unittest.TestCase):
 
     @patch('ansible_collections.netapp.aws.plugins.modules.aws_netapp_cvs_filesystems.AwsCvsNetappFileSystem.get_filesystemId')
     @patch('ansible_collections.netapp.aws.plugins.modules.aws_netapp_cvs_filesystems.AwsCvsNetappFileSystem.get_filesystem')
-    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.get_state')
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.wait_for_jobs')
     @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.delete')
     def test_delete_aws_netapp_cvs_snapshots_pass(self, get_post_api, get_state_api, get_filesystem, get_filesystemId):
         set_module_args(self.set_args_delete_aws_netapp_cvs_filesystems())
         my_obj = fileSystem_module()
         get_filesystemId.return_value = '432-432-532423-4232'
         get_filesystem.return_value = 'dummy'
-        get_state_api.return_value = 'done'
+        get_state_api.return_value = {'dummy': ('done', None)}
         response = {'jobs': [{'jobId': 'dummy'}]}
         get_post_api.return_value = response, None
         with pytest.raises(AnsibleExitJson) as exc:
             my_obj.apply()
         print('Info: test_create_aws_netapp_cvs_filesyste_pass: %s' % repr(exc.value.args[0]))
         assert exc.value.args[0]['changed']
+
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.wait_for_jobs')
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.post')
+    def test_create_aws_netapp_cvs_filesystems_wait_options(self, get_post_api, wait_for_jobs):
+        ''' the job is awaited with wait_timeout, unless wait_for_completion is false '''
+        args = self.set_args_create_aws_netapp_cvs_filesystems()
+        args['wait_timeout'] = 30
+        set_module_args(args)
+        my_obj = fileSystem_module()
+        assert 'wait_timeout' not in my_obj.data
+        get_post_api.return_value = {'jobs': [{'jobId': 'dummy'}]}, None
+        wait_for_jobs.return_value = {'dummy': ('done', None)}
+        with patch.object(my_obj, 'get_filesystemId', return_value=None):
+            with pytest.raises(AnsibleExitJson):
+                my_obj.apply()
+        wait_for_jobs.assert_called_once_with(['dummy'], 30)
+
+        args['wait_for_completion'] = False
+        set_module_args(args)
+        my_obj = fileSystem_module()
+        wait_for_jobs.reset_mock()
+        with patch.object(my_obj, 'get_filesystemId', return_value=None):
+            with pytest.raises(AnsibleExitJson):
+                my_obj.apply()
+        assert not wait_for_jobs.called
+
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.get')
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.post')
+    def test_create_aws_netapp_cvs_filesystems_job_failed(self, get_post_api, get_api):
+        ''' a failed job is reported with its details '''
+        set_module_args(self.set_args_create_aws_netapp_cvs_filesystems())
+        my_obj = fileSystem_module()
+        get_post_api.return_value = {'jobs': [{'jobId': 'dummy'}]}, None
+        get_api.side_effect = [
+            ([], None),                                                 # get_filesystemId
+            ({'state': 'error', 'stateDetails': 'no quota'}, None)      # Jobs/dummy
+        ]
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['msg'] == 'Error: job dummy failed: no quota'
+
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.post')
+    def test_create_aws_netapp_cvs_filesystems_no_job(self, get_post_api):
+        ''' a response without job is an error '''
+        set_module_args(self.set_args_create_aws_netapp_cvs_filesystems())
+        my_obj = fileSystem_module()
+        get_post_api.return_value = {'message': 'accepted'}, None
+        with patch.object(my_obj, 'get_filesystemId', return_value=None):
+            with pytest.raises(AnsibleFailJson) as exc:
+                my_obj.apply()
+        assert exc.value.args[0]['msg'].startswith('Error: unexpected response on FileSystems create')
+
+    @patch('time.sleep')
+    @patch('time.time')
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.get')
+    def test_wait_for_jobs_backoff(self, get_api, mock_time, mock_sleep):
+        ''' several jobs are tracked at once, with an increasing interval between polls '''
+        clock = [0]
+        mock_time.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda delay: clock.__setitem__(0, clock[0] + delay)
+        get_api.side_effect = [
+            ({'state': 'ongoing'}, None), ({'state': 'ongoing'}, None),     # job1, job2
+            ({'state': 'done'}, None), ({'state': 'ongoing'}, None),        # job1, job2
+            ({'state': 'ongoing'}, None),                                   # job2
+            ({'state': 'failed', 'stateDetails': 'boom'}, None)             # job2
+        ]
+        set_module_args(self.set_default_args_pass_check())
+        my_obj = fileSystem_module()
+        results = my_obj.restApi.wait_for_jobs(['job1', 'job2'])
+        assert results == {'job1': ('done', None), 'job2': ('failed', 'Error: job job2 failed: boom')}
+        assert [args[0][0] for args in mock_sleep.call_args_list] == [1, 2, 4]
+
+    @patch('time.sleep')
+    @patch('time.time')
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.get')
+    def test_wait_for_jobs_timeout(self, get_api, mock_time, mock_sleep):
+        ''' polling stops when the timeout is reached '''
+        clock = [0]
+        mock_time.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda delay: clock.__setitem__(0, clock[0] + delay)
+        get_api.return_value = {'state': 'ongoing'}, None
+        set_module_args(self.set_default_args_pass_check())
+        my_obj = fileSystem_module()
+        error = my_obj.restApi.wait_on_response({'jobs': [{'jobId': 'job1'}]}, timeout=20)
+        assert error == 'Error: timeout waiting for job job1, state: ongoing'
+        assert [args[0][0] for args in mock_sleep.call_args_list] == [1, 2, 4, 8, 5]
+
+    @patch('time.sleep')
+    def test_send_request_retries(self, mock_sleep):
+        ''' throttled requests and GET connection errors are retried, using a single session '''
+        set_module_args(self.set_default_args_pass_check())
+        my_obj = fileSystem_module()
+        response = Mock(status_code=200, headers={})
+        response.json.return_value = [{'creationToken': 'TestFilesystem'}]
+        session = my_obj.restApi.get_session()
+        assert session.headers['api-key'] == 'myapikey'
+        with patch.object(session, 'request', side_effect=[requests.exceptions.ConnectionError('reset'),
+                                                          Mock(status_code=429, headers={}), response]) as mock_request:
+            records, error = my_obj.restApi.get('FileSystems')
+        assert error is None
+        assert records == [{'creationToken': 'TestFilesystem'}]
+        assert mock_request.call_count == 3
+        stats = my_obj.restApi.get_stats()
+        assert stats['requests'] == 3
+        assert stats['retries'] == 2
+
+    @patch('time.sleep')
+    def test_send_request_no_retry_on_post_connection_error(self, mock_sleep):
+        ''' a POST may have been processed, connection errors are not retried '''
+        set_module_args(self.set_default_args_pass_check())
+        my_obj = fileSystem_module()
+        with patch.object(my_obj.restApi.get_session(), 'request', side_effect=requests.exceptions.ConnectionError('reset')) as mock_request:
+            records, error = my_obj.restApi.post('FileSystems', {})
+        assert error == 'reset'
+        assert mock_request.call_count == 1
+        assert not mock_sleep.called
@@ -261,3 +261,42 @@ class TestMyModule(unittest.TestCase):
             my_obj.apply()
         print('Info: test_delete_aws_netapp_cvs_pool_fail: %s' % repr(exc.value))
         assert exc.value.args[0]['msg'] is not None
+
+    @patch('ansible_collections.netapp.aws.plugins.modules.aws_netapp_cvs_pool.NetAppAWSCVS.get_aws_netapp_cvs_pool')
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.wait_on_response')
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.post')
+    def test_create_aws_netapp_cvs_pool_wait(self, get_post_api, wait_on_response, get_aws_api):
+        ''' jobs are awaited with wait_timeout, unless wait_for_completion is false '''
+        args = self.set_args_create_aws_netapp_cvs_pool()
+        args['wait_timeout'] = 30
+        set_module_args(args)
+        my_obj = pool_module()
+        get_aws_api.return_value = None
+        get_post_api.return_value = {'jobs': [{'jobId': 'dummy'}]}, None
+        wait_on_response.return_value = None
+        with pytest.raises(AnsibleExitJson):
+            my_obj.apply()
+        wait_on_response.assert_called_once_with({'jobs': [{'jobId': 'dummy'}]}, 30)
+
+        args['wait_for_completion'] = False
+        set_module_args(args)
+        my_obj = pool_module()
+        wait_on_response.reset_mock()
+        with pytest.raises(AnsibleExitJson):
+            my_obj.apply()
+        assert not wait_on_response.called
+
+    @patch('ansible_collections.netapp.aws.plugins.modules.aws_netapp_cvs_pool.NetAppAWSCVS.get_aws_netapp_cvs_pool')
+    def test_http_options_and_stats(self, get_aws_api):
+        ''' http_retries is used by the retry policy, and the request statistics are returned '''
+        args = self.set_args_create_aws_netapp_cvs_pool()
+        args['http_retries'] = 5
+        args['http_max_concurrency'] = 2
+        set_module_args(args)
+        my_obj = pool_module()
+        assert my_obj.restApi.retries == 5
+        get_aws_api.return_value = None
+        my_obj.module.check_mode = True
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['http_stats']['requests'] == 0
@@ -6,6 +6,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 import json
+import shutil
+import tempfile
 import pytest
 
 from ansible_collections.netapp.aws.tests.unit.compat import unittest
@@ -141,3 +143,50 @@ class TestMyModule(unittest.TestCase):
             my_obj.apply()
         print('Info: test_create_aws_netapp_cvs_snapshots_pass: %s' % repr(exc.value.args[0]))
         assert exc.value.args[0]['changed']
+
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.put')
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.get')
+    def test_rename_uses_indexed_lookups(self, get_api, put_api):
+        ''' filesystems and snapshots are listed once, snapshots are restricted to the filesystem and region '''
+        args = self.set_args_create_aws_netapp_cvs_snapshots()
+        args['fileSystemId'] = 'fs_name'
+        args['from_name'] = 'old_name'
+        set_module_args(args)
+        my_obj = snapshot_module()
+        get_api.side_effect = [
+            ([{'fileSystemId': 'fs_id', 'creationToken': 'fs_name', 'region': 'us-east-1'},
+              {'fileSystemId': 'fs_id2', 'creationToken': 'fs_name', 'region': 'us-west-1'}], None),
+            ([{'snapshotId': 'snap_id', 'name': 'old_name', 'region': 'us-east-1'},
+              {'snapshotId': 'snap_id2', 'name': 'testSnapshot', 'region': 'us-west-1'}], None)
+        ]
+        put_api.return_value = None, None
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['changed']
+        assert [args[0][0] for args in get_api.call_args_list] == ['FileSystems', 'FileSystems/fs_id/Snapshots']
+        assert put_api.call_args[0][0] == 'Snapshots/snap_id'
+
+    @patch('ansible_collections.netapp.aws.plugins.module_utils.netapp.AwsCvsRestAPI.get')
+    def test_lookup_disk_cache(self, get_api):
+        ''' records are reused across tasks when lookup_cache_ttl is set, and cleared on change '''
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = self.set_args_delete_aws_netapp_cvs_snapshots()
+        args.update(lookup_cache_ttl=60, lookup_cache_dir=tmpdir)
+        get_api.return_value = [{'snapshotId': 'snap_id', 'name': 'testSnapshot', 'region': 'us-east-1'}], None
+        for dummy in range(2):
+            set_module_args(args)
+            my_obj = snapshot_module()
+            assert my_obj.getSnapshotId('testSnapshot') == 'snap_id'
+        assert get_api.call_count == 1
+        # another account does not share the cache
+        args['api_key'] = 'otherkey'
+        set_module_args(args)
+        assert snapshot_module().getSnapshotId('testSnapshot') == 'snap_id'
+        assert get_api.call_count == 2
+        with patch.object(my_obj.restApi, 'send_request', return_value=(None, None)):
+            my_obj.restApi.delete('Snapshots/snap_id', None)
+        args['api_key'] = 'myapikey'
+        set_module_args(args)
+        assert snapshot_module().getSnapshotId('testSnapshot') == 'snap_id'
+        assert get_api.call_count == 3
@@ -4,6 +4,10 @@
 
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
+import time
+import traceback
+
+from ansible.module_utils._text import to_native
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 
@@ -15,10 +19,21 @@ try:
 except ImportError:
     HAS_AZURE = False
 
+try:
+    from msrestazure.azure_exceptions import CloudError
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+# default timeout in seconds when waiting for long running operations
+LRO_TIMEOUT = 1800
+
 
 class AzureRMNetAppModuleBase(AzureRMModuleBase):
     def __init__(self, derived_arg_spec, supports_check_mode=False):
         self._netapp_client = None
+        # long running operations submitted by the module
+        self.operations = list()
         super(AzureRMNetAppModuleBase, self).__init__(derived_arg_spec=derived_arg_spec,
                                                       supports_check_mode=supports_check_mode)
 
@@ -30,3 +45,130 @@ class AzureRMNetAppModuleBase(AzureRMModuleBase):
                                                            base_url=self._cloud_environment.endpoints.resource_manager,
                                                            api_version='2018-05-01')
         return self._netapp_client
+
+    def submit_operation(self, description, method, *args, **kwargs):
+        """
+            Start a long running operation, and keep track of its poller
+            An error when submitting the operation is recorded rather than raised
+            :return: the operation, a dict with description, poller, done, result, error and exception keys
+        """
+        operation = dict(description=description, poller=None, done=False, result=None, error=None, exception=None)
+        try:
+            operation['poller'] = method(*args, **kwargs)
+        except CloudError as error:
+            operation['done'] = True
+            operation['error'] = to_native(error)
+            operation['exception'] = traceback.format_exc()
+        self.operations.append(operation)
+        return operation
+
+    @staticmethod
+    def is_poller_done(poller):
+        # a method that did not return a poller has already completed
+        done = getattr(poller, 'done', None)
+        return done is None or bool(done())
+
+    def check_operations(self, operations):
+        """
+            Check the pollers for pending operations, without waiting
+            :return: the list of operations still pending
+        """
+        for operation in operations:
+            if operation['done'] or not self.is_poller_done(operation['poller']):
+                continue
+            operation['done'] = True
+            try:
+                result = getattr(operation['poller'], 'result', None)
+                operation['result'] = result() if result is not None else operation['poller']
+            except CloudError as error:
+                operation['error'] = to_native(error)
+                operation['exception'] = traceback.format_exc()
+        return [operation for operation in operations if not operation['done']]
+
+    def wait_for_operations(self, operations=None, timeout=LRO_TIMEOUT, interval=1, max_interval=10):
+        """
+            Wait for all pending operations, pollers are checked in a single loop so operations complete concurrently
+            The interval between checks starts at interval seconds, and doubles up to max_interval seconds
+            :return: the list of errors, empty if all operations succeeded
+        """
+        if operations is None:
+            operations = self.operations
+        deadline = time.time() + timeout
+        while True:
+            pending = self.check_operations(operations)
+            if not pending:
+                break
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                for operation in pending:
+                    operation['error'] = 'Error: timeout waiting for %s' % operation['description']
+                break
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+        return [operation['error'] for operation in operations if operation['error'] is not None]
+
+    def run_operations(self, requests, max_concurrency=10, timeout=LRO_TIMEOUT, interval=1, max_interval=10):
+        """
+            Submit operations and wait for them, with at most max_concurrency operations in progress
+            A new operation is submitted as soon as one completes, and the interval is reset when an operation completes
+            :param requests: a list of (description, method, kwargs) tuples
+            :return: the list of operations, in the order of requests
+        """
+        operations = [None] * len(requests)
+        to_submit = list(range(len(requests)))
+        in_progress = list()
+        deadline = time.time() + timeout
+        delay = interval
+        while to_submit or in_progress:
+            while to_submit and len(in_progress) < max_concurrency:
+                index = to_submit.pop(0)
+                description, method, kwargs = requests[index]
+                operations[index] = self.submit_operation(description, method, **kwargs)
+                in_progress.append(operations[index])
+            still_pending = self.check_operations(in_progress)
+            if len(still_pending) < len(in_progress):
+                delay = interval
+            in_progress = still_pending
+            if not in_progress:
+                continue
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                for operation in in_progress:
+                    operation['error'] = 'Error: timeout waiting for %s' % operation['description']
+                for index in to_submit:
+                    operations[index] = dict(description=requests[index][0], poller=None, done=False, result=None, exception=None,
+                                             error='Error: timeout before starting %s' % requests[index][0])
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_interval)
+        return operations
+
+    def run_operation(self, description, method, *args, **kwargs):
+        """
+            Submit an operation, and wait for it unless wait_for_completion is false
+            :return: the operation
+        """
+        operation = self.submit_operation(description, method, *args, **kwargs)
+        if self.module.params.get('wait_for_completion', True):
+            self.wait_for_operations([operation], timeout=self.module.params.get('wait_timeout') or LRO_TIMEOUT)
+        return operation
+
+    @staticmethod
+    def get_operation_handle(operation):
+        """
+            Report an operation, so that it can be tracked after the module exits
+            :return: a dict with description, status, error, and the Azure async operation URL when available
+        """
+        poller = operation['poller']
+        handle = dict(description=operation['description'], status=None, error=operation['error'])
+        if operation['done'] and operation['error'] is None:
+            handle['status'] = 'Succeeded'
+        elif callable(getattr(poller, 'status', None)):
+            handle['status'] = to_native(poller.status())
+        # the URL is not part of the poller public interface, report it if we can find it
+        long_running_operation = getattr(getattr(poller, '_polling_method', None), '_operation', None)
+        for attr in ('async_url', 'location_url'):
+            url = getattr(long_running_operation, attr, None)
+            if url:
+                handle[attr] = url
+        return handle
@@ -53,6 +53,19 @@ options:
             - absent
             - present
         type: str
+    wait_for_completion:
+        description:
+            - Whether to wait for the create or delete operation to complete.
+            - When false, the module returns as soon as the operation is accepted, and reports it in C(operations).
+        default: true
+        type: bool
+        version_added: "20.7.0"
+    wait_timeout:
+        description:
+            - Time in seconds to wait for the create or delete operation to complete.
+        default: 1800
+        type: int
+        version_added: "20.7.0"
 
 '''
 EXAMPLES = '''
@@ -74,6 +87,13 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+operations:
+    description:
+        - The create or delete operation, when wait_for_completion is false.
+        - Each operation reports description, status, error, and the Azure async_url when available.
+    returned: when wait_for_completion is false and a change was requested
+    type: list
+    version_added: "20.7.0"
 '''
 
 try:
@@ -82,10 +102,9 @@ except ImportError:
     # This is handled in azure_rm_common
     pass
 
-from ansible.module_utils.basic import to_native, AnsibleModule
+from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common import AzureRMNetAppModuleBase
 from ansible_collections.netapp.azure.plugins.module_utils.netapp_module import NetAppModule
-import traceback
 
 HAS_AZURE_MGMT_NETAPP = False
 try:
@@ -104,7 +123,9 @@ class AzureRMNetAppAccount(AzureRMNetAppModuleBase):
             name=dict(type='str', required=True),
             location=dict(type='str', required=False),
             state=dict(choices=['present', 'absent'], default='present', type='str'),
-            tags=dict(type='dict', required=False)
+            tags=dict(type='dict', required=False),
+            wait_for_completion=dict(type='bool', required=False, default=True),
+            wait_timeout=dict(type='int', required=False, default=1800)
         )
         self.module = AnsibleModule(
             argument_spec=self.module_arg_spec,
@@ -135,7 +156,7 @@ class AzureRMNetAppAccount(AzureRMNetAppModuleBase):
     def create_azure_netapp_account(self):
         """
             Create an Azure NetApp Account
-            :return: None
+            :return: the operation
         """
         location = ''
         tags = {}
@@ -147,42 +168,48 @@ class AzureRMNetAppAccount(AzureRMNetAppModuleBase):
             location=location,
             tags=tags
         )
-        try:
-            self.netapp_client.accounts.create_or_update(body=account_body,
-                                                         resource_group_name=self.parameters['resource_group'],
-                                                         account_name=self.parameters['name'])
-        except CloudError as error:
+        operation = self.run_operation('create account %s' % self.parameters['name'],
+                                       self.netapp_client.accounts.create_or_update, body=account_body,
+                                       resource_group_name=self.parameters['resource_group'],
+                                       account_name=self.parameters['name'])
+        if operation['error'] is not None:
             self.module.fail_json(msg='Error creating Azure NetApp account %s: %s'
-                                      % (self.parameters['name'], to_native(error)),
-                                  exception=traceback.format_exc())
+                                      % (self.parameters['name'], operation['error']),
+                                  exception=operation['exception'])
+        return operation
 
     def delete_azure_netapp_account(self):
         """
             Delete an Azure NetApp Account
-            :return: None
+            :return: the operation
         """
-        try:
-            self.netapp_client.accounts.delete(resource_group_name=self.parameters['resource_group'],
-                                               account_name=self.parameters['name'])
-        except CloudError as error:
+        operation = self.run_operation('delete account %s' % self.parameters['name'],
+                                       self.netapp_client.accounts.delete, resource_group_name=self.parameters['resource_group'],
+                                       account_name=self.parameters['name'])
+        if operation['error'] is not None:
             self.module.fail_json(msg='Error deleting Azure NetApp account %s: %s'
-                                      % (self.parameters['name'], to_native(error)),
-                                  exception=traceback.format_exc())
+                                      % (self.parameters['name'], operation['error']),
+                                  exception=operation['exception'])
+        return operation
 
     def exec_module(self, **kwargs):
         current = self.get_azure_netapp_account()
         cd_action = self.na_helper.get_cd_action(current, self.parameters)
 
+        operation = None
         if self.na_helper.changed:
             if self.module.check_mode:
                 pass
             else:
                 if cd_action == 'create':
-                    self.create_azure_netapp_account()
+                    operation = self.create_azure_netapp_account()
                 elif cd_action == 'delete':
-                    self.delete_azure_netapp_account()
+                    operation = self.delete_azure_netapp_account()
 
-        self.module.exit_json(changed=self.na_helper.changed)
+        results = dict(changed=self.na_helper.changed)
+        if operation is not None and not self.parameters['wait_for_completion']:
+            results['operations'] = [self.get_operation_handle(operation)]
+        self.module.exit_json(**results)
 
 
 def main():
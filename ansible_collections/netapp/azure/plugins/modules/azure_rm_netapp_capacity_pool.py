@@ -64,6 +64,19 @@ options:
         default: present
         choices: ['present', 'absent']
         type: str
+    wait_for_completion:
+        description:
+            - Whether to wait for the create, modify, or delete operation to complete.
+            - When false, the module returns as soon as the operation is accepted, and reports it in C(operations).
+        default: true
+        type: bool
+        version_added: "20.7.0"
+    wait_timeout:
+        description:
+            - Time in seconds to wait for the create, modify, or delete operation to complete.
+        default: 1800
+        type: int
+        version_added: "20.7.0"
 
 '''
 EXAMPLES = '''
@@ -96,6 +109,13 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+operations:
+    description:
+        - The create, modify, or delete operation, when wait_for_completion is false.
+        - Each operation reports description, status, error, and the Azure async_url when available.
+    returned: when wait_for_completion is false and a change was requested
+    type: list
+    version_added: "20.7.0"
 '''
 
 try:
@@ -104,10 +124,9 @@ except ImportError:
     # This is handled in azure_rm_common
     pass
 
-from ansible.module_utils.basic import to_native, AnsibleModule
+from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common import AzureRMNetAppModuleBase
 from ansible_collections.netapp.azure.plugins.module_utils.netapp_module import NetAppModule
-import traceback
 
 AZURE_OBJECT_CLASS = 'NetAppAccount'
 HAS_AZURE_MGMT_NETAPP = False
@@ -132,6 +151,8 @@ class AzureRMNetAppCapacityPool(AzureRMNetAppModuleBase):
             state=dict(choices=['present', 'absent'], default='present', type='str'),
             size=dict(type='int', required=False, default=1),
             service_level=dict(type='str', required=False, choices=['Standard', 'Premium', 'Ultra']),
+            wait_for_completion=dict(type='bool', required=False, default=True),
+            wait_timeout=dict(type='int', required=False, default=1800)
         )
         self.module = AnsibleModule(
             argument_spec=self.module_arg_spec,
@@ -163,26 +184,28 @@ class AzureRMNetAppCapacityPool(AzureRMNetAppModuleBase):
     def create_azure_netapp_capacity_pool(self):
         """
             Create a capacity pool for the given Azure NetApp Account
-            :return: None
+            :return: the operation
         """
         capacity_pool_body = CapacityPool(
             location=self.parameters['location'],
             size=self.parameters['size'] * SIZE_POOL,
             service_level=self.parameters['service_level']
         )
-        try:
-            self.netapp_client.pools.create_or_update(body=capacity_pool_body, resource_group_name=self.parameters['resource_group'],
-                                                      account_name=self.parameters['account_name'],
-                                                      pool_name=self.parameters['name'])
-        except CloudError as error:
+        operation = self.run_operation('create capacity pool %s' % self.parameters['name'],
+                                       self.netapp_client.pools.create_or_update, body=capacity_pool_body,
+                                       resource_group_name=self.parameters['resource_group'],
+                                       account_name=self.parameters['account_name'],
+                                       pool_name=self.parameters['name'])
+        if operation['error'] is not None:
             self.module.fail_json(msg='Error creating capacity pool %s for Azure NetApp account %s: %s'
-                                      % (self.parameters['name'], self.parameters['account_name'], to_native(error)),
-                                  exception=traceback.format_exc())
+                                      % (self.parameters['name'], self.parameters['account_name'], operation['error']),
+                                  exception=operation['exception'])
+        return operation
 
     def modify_azure_netapp_capacity_pool(self, modify):
         """
             Modify a capacity pool for the given Azure NetApp Account
-            :return: None
+            :return: the operation
         """
         capacity_pool_body = CapacityPool(
             location=self.parameters['location'],
@@ -190,27 +213,30 @@ class AzureRMNetAppCapacityPool(AzureRMNetAppModuleBase):
         )
         if 'size' in modify:
             capacity_pool_body.size = modify['size'] * SIZE_POOL
-        try:
-            self.netapp_client.pools.update(body=capacity_pool_body, resource_group_name=self.parameters['resource_group'],
-                                            account_name=self.parameters['account_name'],
-                                            pool_name=self.parameters['name'])
-        except CloudError as error:
+        operation = self.run_operation('modify capacity pool %s' % self.parameters['name'],
+                                       self.netapp_client.pools.update, body=capacity_pool_body,
+                                       resource_group_name=self.parameters['resource_group'],
+                                       account_name=self.parameters['account_name'],
+                                       pool_name=self.parameters['name'])
+        if operation['error'] is not None:
             self.module.fail_json(msg='Error modifying capacity pool %s for Azure NetApp account %s: %s'
-                                      % (self.parameters['name'], self.parameters['account_name'], to_native(error)),
-                                  exception=traceback.format_exc())
+                                      % (self.parameters['name'], self.parameters['account_name'], operation['error']),
+                                  exception=operation['exception'])
+        return operation
 
     def delete_azure_netapp_capacity_pool(self):
         """
             Delete a capacity pool for the given Azure NetApp Account
-            :return: None
+            :return: the operation
         """
-        try:
-            self.netapp_client.pools.delete(resource_group_name=self.parameters['resource_group'],
-                                            account_name=self.parameters['account_name'], pool_name=self.parameters['name'])
-        except CloudError as error:
+        operation = self.run_operation('delete capacity pool %s' % self.parameters['name'],
+                                       self.netapp_client.pools.delete, resource_group_name=self.parameters['resource_group'],
+                                       account_name=self.parameters['account_name'], pool_name=self.parameters['name'])
+        if operation['error'] is not None:
             self.module.fail_json(msg='Error deleting capacity pool %s for Azure NetApp account %s: %s'
-                                      % (self.parameters['name'], self.parameters['name'], to_native(error)),
-                                  exception=traceback.format_exc())
+                                      % (self.parameters['name'], self.parameters['name'], operation['error']),
+                                  exception=operation['exception'])
+        return operation
 
     def exec_module(self, **kwargs):
         modify = {}
@@ -224,18 +250,22 @@ class AzureRMNetAppCapacityPool(AzureRMNetAppModuleBase):
             current['name'] = self.parameters['name']
             modify = self.na_helper.get_modified_attributes(current, self.parameters)
 
+        operation = None
         if self.na_helper.changed:
             if self.module.check_mode:
                 pass
             else:
                 if cd_action == 'create':
-                    self.create_azure_netapp_capacity_pool()
+                    operation = self.create_azure_netapp_capacity_pool()
                 elif cd_action == 'delete':
-                    self.delete_azure_netapp_capacity_pool()
+                    operation = self.delete_azure_netapp_capacity_pool()
                 elif modify:
-                    self.modify_azure_netapp_capacity_pool(modify)
+                    operation = self.modify_azure_netapp_capacity_pool(modify)
 
-        self.module.exit_json(changed=self.na_helper.changed)
+        results = dict(changed=self.na_helper.changed)
+        if operation is not None and not self.parameters['wait_for_completion']:
+            results['operations'] = [self.get_operation_handle(operation)]
+        self.module.exit_json(**results)
 
 
 def main():
@@ -0,0 +1,316 @@
+#!/usr/bin/python
+#
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'certified'}
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_netapp_info
+
+short_description: Gather information about NetApp Azure Files accounts, capacity pools, volumes and snapshots
+version_added: "20.7.0"
+author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
+
+description:
+    - Walk NetApp accounts, capacity pools, volumes and snapshots in one or more resource groups.
+    - The list requests for each level run concurrently, across resource groups, accounts, pools and volumes.
+    - The result can be cached in a file, to be reused by the following tasks.
+
+options:
+    resource_groups:
+        description:
+            - Names of the resource groups.
+        required: true
+        type: list
+        elements: str
+    gather_subset:
+        description:
+            - The objects to report.
+            - C(all) reports accounts, capacity_pools, volumes and snapshots.
+            - Listing volumes requires listing accounts and capacity pools, but they are only reported if selected.
+            - An empty list is rejected.
+        default: ['all']
+        type: list
+        elements: str
+        choices: ['all', 'accounts', 'capacity_pools', 'volumes', 'snapshots']
+    fields:
+        description:
+            - Only report these attributes for each object, for instance C(name), C(location), C(usage_threshold).
+            - The name is always reported.
+            - All attributes are reported by default.
+        type: list
+        elements: str
+    max_concurrency:
+        description:
+            - Maximum number of list requests in progress at the same time.
+        default: 8
+        type: int
+    cache_file:
+        description:
+            - Path to a file used to cache the information, when cache_ttl is set.
+        type: path
+    cache_ttl:
+        description:
+            - Time in seconds the cached information is valid.
+            - The cache is only used if the resource groups, gather_subset, and fields options match.
+            - The cache is disabled by default.
+        default: 0
+        type: int
+
+requirements:
+    - python >= 2.7
+    - azure >= 2.0.0
+    - Python azure-mgmt. Install using 'pip install azure-mgmt'
+    - Python azure-mgmt-netapp. Install using 'pip install azure-mgmt-netapp'
+    - For authentication with Azure NetApp log in before you run your tasks or playbook with C(az login).
+
+notes:
+    - The modules prefixed with azure_rm_netapp are built to support the Cloud Volume Services for Azure NetApp Files.
+'''
+EXAMPLES = '''
+
+- name: Gather volume capacity for two resource groups
+  azure_rm_netapp_info:
+    resource_groups:
+      - myResourceGroup
+      - myOtherResourceGroup
+    gather_subset: volumes
+    fields:
+      - usage_threshold
+      - service_level
+  register: anf_info
+
+- name: Gather all information, and reuse it for 10 minutes
+  azure_rm_netapp_info:
+    resource_groups: myResourceGroup
+    cache_file: /tmp/anf_info.json
+    cache_ttl: 600
+
+'''
+
+RETURN = '''
+netapp_info:
+    description:
+        - Lists of accounts, capacity_pools, volumes and snapshots, depending on gather_subset.
+        - Each object reports its resource_group, and its name as reported by Azure, eg account/pool/volume for a volume.
+    returned: always
+    type: dict
+    sample: {"volumes": [{"name": "tests-netapp/tests-pool/tests-volume", "resource_group": "myResourceGroup",
+                          "usage_threshold": 107374182400}]}
+cached:
+    description: Whether the information was read from the cache file.
+    returned: always
+    type: bool
+'''
+
+import datetime
+import json
+import os
+import threading
+import time
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+from ansible.module_utils.basic import to_native, AnsibleModule
+from ansible.module_utils.six.moves import queue
+from ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common import AzureRMNetAppModuleBase, HAS_AZURE
+from ansible_collections.netapp.azure.plugins.module_utils.netapp_module import NetAppModule
+
+SUBSETS = ['accounts', 'capacity_pools', 'volumes', 'snapshots']
+
+
+def to_json_value(value):
+    ''' dates are reported in ISO format, whether they come from Azure or from the cache '''
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+
+class AzureRMNetAppInfo(AzureRMNetAppModuleBase):
+
+    def __init__(self):
+
+        self.module_arg_spec = dict(
+            resource_groups=dict(type='list', elements='str', required=True),
+            gather_subset=dict(type='list', elements='str', default=['all'], choices=['all'] + SUBSETS),
+            fields=dict(type='list', elements='str', required=False),
+            max_concurrency=dict(type='int', required=False, default=8),
+            cache_file=dict(type='path', required=False),
+            cache_ttl=dict(type='int', required=False, default=0)
+        )
+        self.module = AnsibleModule(
+            argument_spec=self.module_arg_spec,
+            supports_check_mode=True
+        )
+        self.na_helper = NetAppModule()
+        self.parameters = self.na_helper.set_parameters(self.module.params)
+
+        if HAS_AZURE is False:
+            self.module.fail_json(msg="the python Azure-mgmt-NetApp module is required")
+        super(AzureRMNetAppInfo, self).__init__(derived_arg_spec=self.module_arg_spec, supports_check_mode=True)
+
+    def get_subsets(self):
+        """
+            :return: the list of subsets to report, and the deepest level to walk
+        """
+        if 'all' in self.parameters['gather_subset']:
+            subsets = list(SUBSETS)
+        else:
+            subsets = [subset for subset in SUBSETS if subset in self.parameters['gather_subset']]
+        if not subsets:
+            self.module.fail_json(msg='Error: gather_subset must list at least one of: %s' % ', '.join(['all'] + SUBSETS))
+        return subsets, max(SUBSETS.index(subset) for subset in subsets)
+
+    def to_dict(self, item, resource_group):
+        """
+            Convert an Azure model to a dict, keeping the selected fields
+            :return: dict
+        """
+        info = item.as_dict() if hasattr(item, 'as_dict') else dict(vars(item))
+        if self.parameters.get('fields'):
+            info = dict((key, value) for key, value in info.items() if key in self.parameters['fields'] or key == 'name')
+        info['resource_group'] = resource_group
+        return info
+
+    def list_worker(self, tasks, results):
+        """
+            Run list requests until a None task is received
+            Each task is a (key, method, args) tuple, and the result is a (records, error) tuple indexed by key
+        """
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            key, method, args = task
+            try:
+                results[key] = (list(method(*args)), None)
+            except CloudError as error:
+                results[key] = (None, to_native(error))
+            except Exception as error:  # pylint: disable=broad-except
+                # report any other error, rather than leaving the task without result
+                results[key] = (None, repr(error))
+
+    def run_list_requests(self, requests):
+        """
+            Run list requests concurrently, with up to max_concurrency workers
+            :param requests: a list of (key, method, args) tuples
+            :return: a dict of records lists indexed by key
+        """
+        results = dict()
+        if self.parameters['max_concurrency'] <= 1 or len(requests) <= 1:
+            tasks = queue.Queue()
+            for request in requests:
+                tasks.put(request)
+            tasks.put(None)
+            self.list_worker(tasks, results)
+        else:
+            tasks = queue.Queue()
+            workers = list()
+            for dummy in range(min(self.parameters['max_concurrency'], len(requests))):
+                worker = threading.Thread(target=self.list_worker, args=(tasks, results))
+                worker.daemon = True
+                worker.start()
+                workers.append(worker)
+            for request in requests:
+                tasks.put(request)
+            for dummy in workers:
+                tasks.put(None)
+            for worker in workers:
+                worker.join()
+        for key, method, args in requests:
+            records, error = results[key]
+            if error is not None:
+                self.module.fail_json(msg='Error listing %s: %s' % ('/'.join(key), error))
+        return dict((key, results[key][0]) for key, method, args in requests)
+
+    @staticmethod
+    def get_short_name(item):
+        # Azure reports the name of a child resource as parent/child
+        return item.name.split('/')[-1]
+
+    def get_netapp_info(self):
+        """
+            Walk accounts, capacity pools, volumes and snapshots, one level at a time
+            :return: dict with a list of objects for each subset
+        """
+        subsets, depth = self.get_subsets()
+        client = self.netapp_client
+        collections = [client.accounts, client.pools, client.volumes, client.snapshots]
+        info = dict((subset, list()) for subset in subsets)
+        # each parent is identified by a tuple: resource group, account, pool, volume
+        parents = [(resource_group,) for resource_group in self.parameters['resource_groups']]
+        for level in range(depth + 1):
+            requests = [(parent, collections[level].list, parent) for parent in parents]
+            records = self.run_list_requests(requests)
+            children = list()
+            for parent in parents:
+                for item in records[parent]:
+                    if SUBSETS[level] in info:
+                        info[SUBSETS[level]].append(self.to_dict(item, parent[0]))
+                    children.append(parent + (self.get_short_name(item),))
+            parents = children
+        return json.loads(json.dumps(info, default=to_json_value))
+
+    def get_cache_key(self):
+        return dict(subscription_id=self.netapp_client.config.subscription_id,
+                    resource_groups=sorted(self.parameters['resource_groups']),
+                    gather_subset=sorted(self.parameters['gather_subset']),
+                    fields=sorted(self.parameters.get('fields') or []))
+
+    def read_cache(self):
+        """
+            :return: the cached information, or None if the cache is disabled, missing, expired, or for other options
+        """
+        if self.parameters['cache_ttl'] <= 0 or self.parameters.get('cache_file') is None:
+            return None
+        try:
+            with open(self.parameters['cache_file']) as cache_file:
+                cache = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get('key') != self.get_cache_key() \
+                or time.time() - cache.get('time', 0) > self.parameters['cache_ttl']:
+            return None
+        return cache.get('info')
+
+    def write_cache(self, info):
+        """
+            A cache is an optimization, errors are ignored
+        """
+        if self.parameters['cache_ttl'] <= 0 or self.parameters.get('cache_file') is None:
+            return
+        try:
+            fd = os.open(self.parameters['cache_file'], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(dict(key=self.get_cache_key(), time=time.time(), info=info), cache_file)
+        except (IOError, OSError, TypeError, ValueError):
+            pass
+
+    def exec_module(self, **kwargs):
+        info = self.read_cache()
+        cached = info is not None
+        if not cached:
+            info = self.get_netapp_info()
+            self.write_cache(info)
+        self.module.exit_json(changed=False, cached=cached, netapp_info=info)
+
+
+def main():
+    AzureRMNetAppInfo()
+
+
+if __name__ == '__main__':
+    main()
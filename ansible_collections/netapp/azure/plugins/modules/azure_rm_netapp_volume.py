@@ -87,6 +87,19 @@ options:
         default: present
         choices: ['present', 'absent']
         type: str
+    wait_for_completion:
+        description:
+            - Whether to wait for the create or delete operation to complete.
+            - When false, the module returns as soon as the operation is accepted, and reports it in C(operations).
+        default: true
+        type: bool
+        version_added: "20.7.0"
+    wait_timeout:
+        description:
+            - Time in seconds to wait for the create or delete operation to complete.
+        default: 1800
+        type: int
+        version_added: "20.7.0"
 
 '''
 EXAMPLES = '''
@@ -105,6 +118,18 @@ EXAMPLES = '''
     service_level: Ultra
     size: 100
 
+- name: Create Azure NetApp volume, without waiting for the volume to be ready
+  azure_rm_netapp_volume:
+    resource_group: myResourceGroup
+    account_name: tests-netapp
+    pool_name: tests-pool
+    name: tests-volume3
+    location: eastus
+    file_path: tests-volume3
+    virtual_network: myVirtualNetwork
+    subnet_id: test
+    wait_for_completion: false
+
 - name: Delete Azure NetApp volume
   azure_rm_netapp_volume:
     state: absent
@@ -120,6 +145,13 @@ mount_path:
     description: Returns mount_path of the Volume
     returned: always
     type: str
+operations:
+    description:
+        - The create or delete operation, when wait_for_completion is false.
+        - Each operation reports description, status, error, and the Azure async_url when available.
+    returned: when wait_for_completion is false and a change was requested
+    type: list
+    version_added: "20.7.0"
 
 '''
 
@@ -129,10 +161,9 @@ except ImportError:
     # This is handled in azure_rm_common
     pass
 
-from ansible.module_utils.basic import to_native, AnsibleModule
+from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common import AzureRMNetAppModuleBase
 from ansible_collections.netapp.azure.plugins.module_utils.netapp_module import NetAppModule
-import traceback
 
 AZURE_OBJECT_CLASS = 'NetAppAccount'
 HAS_AZURE_MGMT_NETAPP = False
@@ -161,7 +192,9 @@ class AzureRMNetAppVolume(AzureRMNetAppModuleBase):
             virtual_network=dict(type='str', required=False),
             size=dict(type='int', required=False),
             vnet_resource_group_for_subnet=dict(type='str', required=False),
-            service_level=dict(type='str', required=False, choices=['Premium', 'Standard', 'Ultra'])
+            service_level=dict(type='str', required=False, choices=['Premium', 'Standard', 'Ultra']),
+            wait_for_completion=dict(type='bool', required=False, default=True),
+            wait_timeout=dict(type='int', required=False, default=1800)
         )
         self.module = AnsibleModule(
             argument_spec=self.module_arg_spec,
@@ -192,7 +225,7 @@ class AzureRMNetAppVolume(AzureRMNetAppModuleBase):
     def create_azure_netapp_volume(self):
         """
             Create a volume for the given Azure NetApp Account
-            :return: None
+            :return: the create operation
         """
         volume_body = Volume(
             location=self.parameters['location'],
@@ -205,53 +238,56 @@ class AzureRMNetAppVolume(AzureRMNetAppModuleBase):
                          else self.parameters['vnet_resource_group_for_subnet'],
                          self.parameters['virtual_network'], self.parameters['subnet_id'])
         )
-        try:
-            result = self.netapp_client.volumes.create_or_update(body=volume_body, resource_group_name=self.parameters['resource_group'],
-                                                                 account_name=self.parameters['account_name'],
-                                                                 pool_name=self.parameters['pool_name'], volume_name=self.parameters['name'])
-            # waiting till the status turns Succeeded
-            while result.done() is not True:
-                result.result(10)
-        except CloudError as error:
+        operation = self.run_operation('create volume %s' % self.parameters['name'],
+                                       self.netapp_client.volumes.create_or_update, body=volume_body,
+                                       resource_group_name=self.parameters['resource_group'],
+                                       account_name=self.parameters['account_name'],
+                                       pool_name=self.parameters['pool_name'], volume_name=self.parameters['name'])
+        if operation['error'] is not None:
             self.module.fail_json(msg='Error creating volume %s for Azure NetApp account %s and subnet ID %s: %s'
-                                      % (self.parameters['name'], self.parameters['account_name'], self.parameters['subnet_id'], to_native(error)),
-                                  exception=traceback.format_exc())
+                                      % (self.parameters['name'], self.parameters['account_name'], self.parameters['subnet_id'], operation['error']),
+                                  exception=operation['exception'])
+        return operation
 
     def delete_azure_netapp_volume(self):
         """
             Delete a volume for the given Azure NetApp Account
-            :return: None
+            :return: the delete operation
         """
-        try:
-            result = self.netapp_client.volumes.delete(resource_group_name=self.parameters['resource_group'],
-                                                       account_name=self.parameters['account_name'],
-                                                       pool_name=self.parameters['pool_name'], volume_name=self.parameters['name'])
-            # waiting till the status turns Succeeded
-            while result.done() is not True:
-                result.result(10)
-        except CloudError as error:
+        operation = self.run_operation('delete volume %s' % self.parameters['name'],
+                                       self.netapp_client.volumes.delete, resource_group_name=self.parameters['resource_group'],
+                                       account_name=self.parameters['account_name'],
+                                       pool_name=self.parameters['pool_name'], volume_name=self.parameters['name'])
+        if operation['error'] is not None:
             self.module.fail_json(msg='Error deleting volume %s for Azure NetApp account %s: %s'
-                                      % (self.parameters['name'], self.parameters['account_name'], to_native(error)),
-                                  exception=traceback.format_exc())
+                                      % (self.parameters['name'], self.parameters['account_name'], operation['error']),
+                                  exception=operation['exception'])
+        return operation
 
     def exec_module(self, **kwargs):
         current = self.get_azure_netapp_volume()
         cd_action = self.na_helper.get_cd_action(current, self.parameters)
+        operation = None
 
         if self.na_helper.changed:
             if self.module.check_mode:
                 pass
             else:
                 if cd_action == 'create':
-                    self.create_azure_netapp_volume()
+                    operation = self.create_azure_netapp_volume()
                 elif cd_action == 'delete':
-                    self.delete_azure_netapp_volume()
+                    operation = self.delete_azure_netapp_volume()
 
+        results = dict(changed=self.na_helper.changed)
+        if operation is not None and not self.parameters['wait_for_completion']:
+            results['operations'] = [self.get_operation_handle(operation)]
         return_info = ''
-        if self.parameters['state'] == 'present':
+        # the mount target is not known until the volume is created
+        if self.parameters['state'] == 'present' and (operation is None or operation['done']):
             return_info = self.get_azure_netapp_volume()
             return_info = ('%s:/%s' % (return_info.mount_targets[0].ip_address, return_info.creation_token)) if return_info is not None else ''
-        self.module.exit_json(changed=self.na_helper.changed, msg=str(return_info))
+        results['msg'] = str(return_info)
+        self.module.exit_json(**results)
 
 
 def main():
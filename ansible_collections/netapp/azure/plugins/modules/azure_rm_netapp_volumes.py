@@ -0,0 +1,335 @@
+#!/usr/bin/python
+#
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'certified'}
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_netapp_volumes
+
+short_description: Manage a list of NetApp Azure Files Volumes in a single task
+version_added: "20.7.0"
+author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
+
+description:
+    - Create, resize, and delete a list of NetApp Azure volumes in a capacity pool.
+    - The existing volumes are listed once, and changes are computed locally.
+    - Create, resize, and delete operations run concurrently, up to max_concurrency operations at a time.
+    - Use azure_rm_netapp_volume to manage a single volume.
+extends_documentation_fragment:
+    - netapp.azure.netapp.azure_rm_netapp
+
+options:
+    pool_name:
+        description:
+            - The name of the capacity pool.
+        required: true
+        type: str
+    account_name:
+        description:
+            - The name of the NetApp account.
+        required: true
+        type: str
+    location:
+        description:
+            - Resource location.
+            - Required to create volumes.
+        type: str
+    subnet_id:
+        description:
+            - The Azure Resource URI for a delegated subnet. Must have the delegation Microsoft.NetApp/volumes.
+            - Provide name of the subnet ID.
+            - Required to create volumes.
+        type: str
+    virtual_network:
+        description:
+            - The name of the virtual network required for the subnet to create a volume.
+            - Required to create volumes.
+        type: str
+    vnet_resource_group_for_subnet:
+        description:
+            - Only required if virtual_network to be used is of different resource_group.
+            - Name of the resource group for virtual_network and subnet_id to be used.
+        type: str
+    volumes:
+        description:
+            - List of volumes to manage.
+        type: list
+        elements: dict
+        required: true
+        suboptions:
+            name:
+                description:
+                    - The name of the volume.
+                required: true
+                type: str
+            state:
+                description:
+                    - Whether the volume should exist or not.
+                default: present
+                choices: ['present', 'absent']
+                type: str
+            file_path:
+                description:
+                    - A unique file path for the volume. Used when creating mount targets.
+                    - Defaults to the volume name.
+                type: str
+            size:
+                description:
+                    - Provisioned size of the volume (in GiB).
+                    - default is 100GiB when creating a volume.
+                    - An existing volume is resized if its size is different.
+                type: int
+            service_level:
+                description:
+                    - The service level of the file system.
+                    - default is Premium.
+                    - Only used when creating a volume.
+                type: str
+                choices: ['Premium', 'Standard', 'Ultra']
+    max_concurrency:
+        description:
+            - Maximum number of create, resize, or delete operations in progress at the same time.
+            - Not used when wait_for_completion is false, as all operations are started at once.
+        default: 10
+        type: int
+    wait_for_completion:
+        description:
+            - Whether to wait for the operations to complete.
+            - When false, the module returns as soon as the operations are accepted.
+        default: true
+        type: bool
+    wait_timeout:
+        description:
+            - Time in seconds to wait for all the operations to complete.
+        default: 1800
+        type: int
+'''
+EXAMPLES = '''
+
+- name: Create Azure NetApp volumes
+  azure_rm_netapp_volumes:
+    resource_group: myResourceGroup
+    account_name: tests-netapp
+    pool_name: tests-pool
+    location: eastus
+    virtual_network: myVirtualNetwork
+    subnet_id: test
+    volumes:
+      - name: clone-001
+        size: 100
+      - name: clone-002
+        size: 200
+        service_level: Ultra
+    max_concurrency: 20
+
+- name: Resize and delete Azure NetApp volumes
+  azure_rm_netapp_volumes:
+    resource_group: myResourceGroup
+    account_name: tests-netapp
+    pool_name: tests-pool
+    volumes:
+      - name: clone-001
+        size: 300
+      - name: clone-002
+        state: absent
+
+'''
+
+RETURN = '''
+volumes:
+    description:
+        - Action taken for each volume, in the order of the volumes option.
+        - The status of the operation is reported when wait_for_completion is false.
+    returned: always
+    type: list
+    sample: [{"name": "clone-001", "action": "modify", "modify": {"size": 300}},
+             {"name": "clone-002", "action": "delete"},
+             {"name": "clone-003", "action": null}]
+'''
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+from ansible.module_utils.basic import to_native, AnsibleModule
+from ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common import AzureRMNetAppModuleBase
+from ansible_collections.netapp.azure.plugins.module_utils.netapp_module import NetAppModule
+
+HAS_AZURE_MGMT_NETAPP = False
+try:
+    from azure.mgmt.netapp.models import Volume, VolumePatch
+    HAS_AZURE_MGMT_NETAPP = True
+except ImportError:
+    HAS_AZURE_MGMT_NETAPP = False
+
+ONE_GIB = 1073741824
+
+
+class AzureRMNetAppVolumes(AzureRMNetAppModuleBase):
+
+    def __init__(self):
+
+        self.module_arg_spec = dict(
+            resource_group=dict(type='str', required=True),
+            pool_name=dict(type='str', required=True),
+            account_name=dict(type='str', required=True),
+            location=dict(type='str', required=False),
+            subnet_id=dict(type='str', required=False),
+            virtual_network=dict(type='str', required=False),
+            vnet_resource_group_for_subnet=dict(type='str', required=False),
+            volumes=dict(type='list', elements='dict', required=True, options=dict(
+                name=dict(type='str', required=True),
+                state=dict(choices=['present', 'absent'], default='present', type='str'),
+                file_path=dict(type='str', required=False),
+                size=dict(type='int', required=False),
+                service_level=dict(type='str', required=False, choices=['Premium', 'Standard', 'Ultra'])
+            )),
+            max_concurrency=dict(type='int', required=False, default=10),
+            wait_for_completion=dict(type='bool', required=False, default=True),
+            wait_timeout=dict(type='int', required=False, default=1800)
+        )
+        self.module = AnsibleModule(
+            argument_spec=self.module_arg_spec,
+            supports_check_mode=True
+        )
+        self.na_helper = NetAppModule()
+        self.parameters = self.na_helper.set_parameters(self.module.params)
+
+        if HAS_AZURE_MGMT_NETAPP is False:
+            self.module.fail_json(msg="the python Azure-mgmt-NetApp module is required")
+        super(AzureRMNetAppVolumes, self).__init__(derived_arg_spec=self.module_arg_spec, supports_check_mode=True)
+
+    def get_desired_volumes(self):
+        """
+            Remove unset options, and check for duplicate names
+            :return: list of volumes
+        """
+        volumes = list()
+        names = set()
+        for volume in self.parameters['volumes']:
+            desired = dict((key, value) for key, value in volume.items() if value is not None)
+            if desired['name'] in names:
+                self.module.fail_json(msg='Error: volume %s is listed more than once' % desired['name'])
+            names.add(desired['name'])
+            volumes.append(desired)
+        return volumes
+
+    def get_azure_netapp_volumes(self):
+        """
+            List the volumes in the capacity pool, with a single paged request
+            :return: dict of volumes indexed by name
+        """
+        volumes = dict()
+        try:
+            for volume in self.netapp_client.volumes.list(self.parameters['resource_group'], self.parameters['account_name'],
+                                                          self.parameters['pool_name']):
+                # the name is reported as account/pool/volume
+                name = volume.name.split('/')[-1]
+                volumes[name] = dict(name=name, size=volume.usage_threshold // ONE_GIB, file_path=volume.creation_token,
+                                     service_level=volume.service_level)
+        except CloudError as error:
+            self.module.fail_json(msg='Error listing volumes for Azure NetApp account %s and pool %s: %s'
+                                      % (self.parameters['account_name'], self.parameters['pool_name'], to_native(error)))
+        return volumes
+
+    def get_subnet_id(self):
+        return '/subscriptions/%s/resourceGroups/%s/providers/Microsoft.Network/virtualNetworks/%s/subnets/%s' \
+               % (self.netapp_client.config.subscription_id,
+                  self.parameters['resource_group'] if self.parameters.get('vnet_resource_group_for_subnet') is None
+                  else self.parameters['vnet_resource_group_for_subnet'],
+                  self.parameters['virtual_network'], self.parameters['subnet_id'])
+
+    def get_request(self, result):
+        """
+            Build the create, delete, or modify request for a volume
+            :return: a (description, method, kwargs) tuple
+        """
+        kwargs = dict(resource_group_name=self.parameters['resource_group'], account_name=self.parameters['account_name'],
+                      pool_name=self.parameters['pool_name'], volume_name=result['name'])
+        desired = result['desired']
+        if result['action'] == 'create':
+            kwargs['body'] = Volume(
+                location=self.parameters['location'],
+                creation_token=desired.get('file_path', desired['name']),
+                service_level=desired.get('service_level', 'Premium'),
+                usage_threshold=desired.get('size', 100) * ONE_GIB,
+                subnet_id=self.get_subnet_id()
+            )
+            method = self.netapp_client.volumes.create_or_update
+        elif result['action'] == 'delete':
+            method = self.netapp_client.volumes.delete
+        else:
+            kwargs['body'] = VolumePatch(usage_threshold=result['modify']['size'] * ONE_GIB)
+            method = self.netapp_client.volumes.update
+        return '%s volume %s' % (result['action'], result['name']), method, kwargs
+
+    def apply_actions(self, results):
+        """
+            Start all the operations, wait for them unless wait_for_completion is false, and record errors in results
+            :return: None
+        """
+        pending = [result for result in results if result['action'] is not None and 'error' not in result]
+        requests = [self.get_request(result) for result in pending]
+        if self.parameters['wait_for_completion']:
+            operations = self.run_operations(requests, max_concurrency=self.parameters['max_concurrency'],
+                                             timeout=self.parameters['wait_timeout'])
+        else:
+            operations = [self.submit_operation(description, method, **kwargs) for description, method, kwargs in requests]
+        for result, operation in zip(pending, operations):
+            if operation['error'] is not None:
+                result['error'] = 'Error %s volume %s: %s' % (
+                    dict(create='creating', delete='deleting', modify='modifying')[result['action']], result['name'], operation['error'])
+            elif not self.parameters['wait_for_completion']:
+                result['status'] = self.get_operation_handle(operation)['status']
+
+    def exec_module(self, **kwargs):
+        current_volumes = self.get_azure_netapp_volumes()
+        results = list()
+        for desired in self.get_desired_volumes():
+            current = current_volumes.get(desired['name'])
+            result = dict(name=desired['name'], action=None, desired=desired)
+            cd_action = self.na_helper.get_cd_action(current, desired)
+            if cd_action is not None:
+                result['action'] = cd_action
+            elif current is not None and desired['state'] == 'present' and desired.get('size') not in (None, current['size']):
+                result['action'] = 'modify'
+                result['modify'] = dict(size=desired['size'])
+            if cd_action == 'create' and None in [self.parameters.get(key) for key in ('location', 'subnet_id', 'virtual_network')]:
+                result['error'] = 'Error creating volume %s: location, subnet_id and virtual_network are required' % desired['name']
+            results.append(result)
+
+        if not self.module.check_mode:
+            self.apply_actions(results)
+
+        changed = False
+        errors = list()
+        for result in results:
+            del result['desired']
+            if result['action'] is not None and 'error' not in result:
+                changed = True
+            if 'error' in result:
+                errors.append(result['error'])
+        if errors:
+            self.module.fail_json(msg='Error managing %d volume(s): %s' % (len(errors), '; '.join(errors)),
+                                  volumes=results, changed=changed)
+        self.module.exit_json(changed=changed, volumes=results)
+
+
+def main():
+    AzureRMNetAppVolumes()
+
+
+if __name__ == '__main__':
+    main()
@@ -167,3 +167,41 @@ class TestMyModule(unittest.TestCase):
             my_obj.exec_module()
         assert exc.value.args[0]['changed']
         mock_delete.assert_called_with()
+
+    @patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.netapp_client')
+    @patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.__init__')
+    @patch('ansible_collections.netapp.azure.plugins.modules.azure_rm_netapp_account.AzureRMNetAppAccount.get_azure_netapp_account')
+    def test_create_without_waiting(self, mock_get, mock_base, client_f):
+        ''' the operation is reported, and the poller is not waited on '''
+        data = self.set_default_args()
+        data['wait_for_completion'] = False
+        set_module_args(data)
+        mock_get.return_value = None
+        mock_base.return_value = None
+        my_obj = account_module()
+        my_obj.operations = list()
+        poller = Mock()
+        poller.done.return_value = False
+        poller.status.return_value = 'InProgress'
+        my_obj.netapp_client.accounts.create_or_update.return_value = poller
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.exec_module()
+        assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['operations'][0]['status'] == 'InProgress'
+        assert not poller.result.called
+
+    @patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.netapp_client')
+    @patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.__init__')
+    def test_create_error_reports_exception(self, mock_base, client_f):
+        ''' the traceback of the CloudError is reported '''
+        set_module_args(self.set_default_args())
+        mock_base.return_value = None
+        my_obj = account_module()
+        my_obj.operations = list()
+        invalid = Response()
+        invalid.status_code = 400
+        my_obj.netapp_client.accounts.create_or_update.side_effect = CloudError(response=invalid, error='failed')
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.create_azure_netapp_account()
+        assert 'failed' in exc.value.args[0]['msg']
+        assert 'CloudError' in exc.value.args[0]['exception']
@@ -0,0 +1,187 @@
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests Azure Ansible module: azure_rm_netapp_info'''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import datetime
+import json
+import os
+import shutil
+import tempfile
+import pytest
+
+from ansible_collections.netapp.azure.tests.unit.compat import unittest
+from ansible_collections.netapp.azure.tests.unit.compat.mock import patch, Mock
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from requests import Response
+
+from ansible_collections.netapp.azure.plugins.modules.azure_rm_netapp_info \
+    import AzureRMNetAppInfo as info_module
+
+HAS_AZURE_CLOUD_ERROR_IMPORT = True
+try:
+    from msrestazure.azure_exceptions import CloudError
+except ImportError:
+    HAS_AZURE_CLOUD_ERROR_IMPORT = False
+
+if not HAS_AZURE_CLOUD_ERROR_IMPORT:
+    pytestmark = pytest.mark.skip('skipping as missing required azure_exceptions')
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+def azure_object(name, **kwargs):
+    item = Mock()
+    item.name = name
+    info = dict(name=name, location='eastus')
+    info.update(kwargs)
+    item.as_dict.return_value = info
+    return item
+
+
+class MockAzureClient(object):
+    ''' mock netapp client, with 2 accounts per resource group, 2 pools per account, 1 volume per pool and 1 snapshot per volume '''
+
+    def __init__(self, errors=None):
+        self.calls = list()
+        self.errors = errors or dict()
+        self.accounts = Mock(list=self.list_accounts)
+        self.pools = Mock(list=self.list_pools)
+        self.volumes = Mock(list=self.list_volumes)
+        self.snapshots = Mock(list=self.list_snapshots)
+        self.config = Mock(subscription_id='subscription')
+
+    def record(self, api, args):
+        self.calls.append((api,) + args)
+        if api in self.errors:
+            invalid = Response()
+            invalid.status_code = 400
+            raise CloudError(response=invalid, error=self.errors[api])
+
+    def list_accounts(self, *args):
+        self.record('accounts', args)
+        return [azure_object('%s_acc%d' % (args[0], index)) for index in range(2)]
+
+    def list_pools(self, *args):
+        self.record('pools', args)
+        return [azure_object('%s/pool%d' % (args[1], index), size=4398046511104) for index in range(2)]
+
+    def list_volumes(self, *args):
+        self.record('volumes', args)
+        return [azure_object('%s/%s/vol' % args[1:3], usage_threshold=107374182400,
+                             creation_date=datetime.datetime(2020, 7, 1))]
+
+    def list_snapshots(self, *args):
+        self.record('snapshots', args)
+        return [azure_object('%s/%s/%s/snap' % args[1:4])]
+
+
+class TestMyModule(unittest.TestCase):
+    ''' a group of related Unit Tests '''
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule,
+                                                 exit_json=exit_json,
+                                                 fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+
+    def call_exec_module(self, args, client, exc_class=AnsibleExitJson):
+        set_module_args(args)
+        with patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.__init__',
+                   return_value=None):
+            my_obj = info_module()
+        with patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.netapp_client',
+                   client):
+            with pytest.raises(exc_class) as exc:
+                my_obj.exec_module()
+        return exc.value.args[0]
+
+    def test_module_fail_when_required_args_missing(self):
+        ''' required arguments are reported as errors '''
+        with pytest.raises(AnsibleFailJson) as exc:
+            set_module_args({})
+            info_module()
+        print('Info: %s' % exc.value.args[0]['msg'])
+
+    def test_all(self):
+        ''' all levels are walked, for all resource groups '''
+        client = MockAzureClient()
+        result = self.call_exec_module(dict(resource_groups=['rg1', 'rg2']), client)
+        info = result['netapp_info']
+        assert not result['changed']
+        assert not result['cached']
+        assert len(info['accounts']) == 4
+        assert len(info['capacity_pools']) == 8
+        assert len(info['volumes']) == 8
+        assert len(info['snapshots']) == 8
+        assert info['volumes'][0]['creation_date'] == '2020-07-01T00:00:00'
+        assert ('snapshots', 'rg2', 'rg2_acc1', 'pool1', 'vol') in client.calls
+        assert len(client.calls) == 2 + 4 + 8 + 8
+
+    def test_subset_and_fields(self):
+        ''' only the required levels are walked, and only the selected fields are reported '''
+        client = MockAzureClient()
+        args = dict(resource_groups=['rg1'], gather_subset=['volumes'], fields=['usage_threshold'], max_concurrency=1)
+        info = self.call_exec_module(args, client)['netapp_info']
+        assert list(info) == ['volumes']
+        assert info['volumes'][0] == dict(name='rg1_acc0/pool0/vol', usage_threshold=107374182400, resource_group='rg1')
+        assert not [call for call in client.calls if call[0] == 'snapshots']
+
+    def test_error(self):
+        ''' errors are reported with the parent object '''
+        client = MockAzureClient(errors=dict(pools='denied'))
+        result = self.call_exec_module(dict(resource_groups=['rg1'], gather_subset='capacity_pools'), client, AnsibleFailJson)
+        assert result['msg'].startswith('Error listing rg1/rg1_acc')
+        assert 'denied' in result['msg']
+
+    def test_empty_gather_subset(self):
+        ''' an empty gather_subset is rejected '''
+        client = MockAzureClient()
+        result = self.call_exec_module(dict(resource_groups=['rg1'], gather_subset=[]), client, AnsibleFailJson)
+        assert result['msg'].startswith('Error: gather_subset must list at least one of')
+        assert not client.calls
+
+    def test_cache(self):
+        ''' the cache is used when the options match, and not expired '''
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = dict(resource_groups=['rg1'], gather_subset='accounts', cache_file=os.path.join(tmpdir, 'cache.json'), cache_ttl=60)
+        client = MockAzureClient()
+        assert not self.call_exec_module(args, client)['cached']
+        result = self.call_exec_module(args, client)
+        assert result['cached']
+        assert len(result['netapp_info']['accounts']) == 2
+        assert len(client.calls) == 1
+        args['gather_subset'] = 'capacity_pools'
+        assert not self.call_exec_module(args, client)['cached']
@@ -173,3 +173,73 @@ class TestMyModule(unittest.TestCase):
             my_obj.exec_module()
         assert exc.value.args[0]['changed']
         mock_delete.assert_called_with()
+
+    @patch('time.sleep')
+    @patch('time.time')
+    @patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.__init__')
+    def test_wait_for_operations(self, mock_base, mock_time, mock_sleep):
+        ''' pollers are checked in a single loop, with an increasing interval '''
+        clock = [0]
+        mock_time.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda delay: clock.__setitem__(0, clock[0] + delay)
+        set_module_args(self.set_default_args())
+        mock_base.return_value = None
+        my_obj = volume_module()
+        my_obj.operations = list()
+        poller1 = Mock()
+        poller1.done.side_effect = [False, True]
+        poller2 = Mock()
+        poller2.done.side_effect = [False, False, True]
+        invalid = Response()
+        invalid.status_code = 400
+        poller2.result.side_effect = CloudError(response=invalid, error='failed')
+        first = my_obj.submit_operation('op1', Mock(return_value=poller1))
+        second = my_obj.submit_operation('op2', Mock(return_value=poller2))
+        errors = my_obj.wait_for_operations()
+        assert first['done'] and first['error'] is None
+        assert second['done'] and 'failed' in second['error']
+        assert first['exception'] is None
+        assert 'CloudError' in second['exception']
+        assert errors == [second['error']]
+        assert [args[0][0] for args in mock_sleep.call_args_list] == [1, 2]
+
+    @patch('time.sleep')
+    @patch('time.time')
+    @patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.__init__')
+    def test_wait_for_operations_timeout(self, mock_base, mock_time, mock_sleep):
+        ''' pending operations are reported on timeout '''
+        clock = [0]
+        mock_time.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda delay: clock.__setitem__(0, clock[0] + delay)
+        set_module_args(self.set_default_args())
+        mock_base.return_value = None
+        my_obj = volume_module()
+        my_obj.operations = list()
+        poller = Mock()
+        poller.done.return_value = False
+        my_obj.submit_operation('create volume test1', Mock(return_value=poller))
+        assert my_obj.wait_for_operations(timeout=30) == ['Error: timeout waiting for create volume test1']
+        assert [args[0][0] for args in mock_sleep.call_args_list] == [1, 2, 4, 8, 10, 5]
+
+    @patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.netapp_client')
+    @patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.__init__')
+    @patch('ansible_collections.netapp.azure.plugins.modules.azure_rm_netapp_volume.AzureRMNetAppVolume.get_azure_netapp_volume')
+    def test_create_without_waiting(self, mock_get, mock_base, client_f):
+        ''' the operation is reported, and the poller is not waited on '''
+        data = self.set_default_args()
+        data['wait_for_completion'] = False
+        set_module_args(data)
+        mock_get.return_value = None
+        mock_base.return_value = None
+        my_obj = volume_module()
+        my_obj.operations = list()
+        poller = Mock()
+        poller.done.return_value = False
+        poller.status.return_value = 'InProgress'
+        my_obj.netapp_client.volumes.create_or_update.return_value = poller
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.exec_module()
+        assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['operations'][0]['status'] == 'InProgress'
+        assert exc.value.args[0]['msg'] == ''
+        assert not poller.result.called
@@ -0,0 +1,239 @@
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests Azure Ansible module: azure_rm_netapp_volumes'''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import json
+import pytest
+
+from ansible_collections.netapp.azure.tests.unit.compat import unittest
+from ansible_collections.netapp.azure.tests.unit.compat.mock import patch, Mock
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from requests import Response
+
+from ansible_collections.netapp.azure.plugins.modules.azure_rm_netapp_volumes \
+    import AzureRMNetAppVolumes as volumes_module
+
+HAS_AZURE_CLOUD_ERROR_IMPORT = True
+try:
+    from msrestazure.azure_exceptions import CloudError
+except ImportError:
+    HAS_AZURE_CLOUD_ERROR_IMPORT = False
+
+if not HAS_AZURE_CLOUD_ERROR_IMPORT:
+    pytestmark = pytest.mark.skip('skipping as missing required azure_exceptions')
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+def volume_info(name, size=100):
+    volume = Mock()
+    volume.name = 'azure/azure/%s' % name
+    volume.usage_threshold = size * 1073741824
+    volume.creation_token = name
+    volume.service_level = 'Premium'
+    return volume
+
+
+class MockPoller(object):
+    ''' poller completing after a number of checks, and tracking how many operations are in progress '''
+    in_progress = 0
+    max_in_progress = 0
+
+    def __init__(self, checks=1, error=None):
+        self.checks = checks
+        self.error = error
+        MockPoller.in_progress += 1
+        MockPoller.max_in_progress = max(MockPoller.max_in_progress, MockPoller.in_progress)
+
+    def done(self):
+        self.checks -= 1
+        if self.checks == 0:
+            MockPoller.in_progress -= 1
+        return self.checks <= 0
+
+    def result(self):
+        if self.error is not None:
+            invalid = Response()
+            invalid.status_code = 400
+            raise CloudError(response=invalid, error=self.error)
+
+
+class TestMyModule(unittest.TestCase):
+    ''' a group of related Unit Tests '''
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule,
+                                                 exit_json=exit_json,
+                                                 fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        MockPoller.in_progress = 0
+        MockPoller.max_in_progress = 0
+
+    @staticmethod
+    def set_default_args(volumes, **kwargs):
+        args = dict(
+            resource_group='azure',
+            account_name='azure',
+            pool_name='azure',
+            location='abc',
+            subnet_id='azure',
+            virtual_network='azure',
+            volumes=volumes
+        )
+        args.update(kwargs)
+        return args
+
+    def call_exec_module(self, args, current, exc_class=AnsibleExitJson):
+        set_module_args(args)
+        with patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.__init__',
+                   return_value=None):
+            my_obj = volumes_module()
+        my_obj.operations = list()
+        client = Mock()
+        client.volumes.list.return_value = current
+        client.volumes.create_or_update.return_value = MockPoller()
+        client.volumes.delete.return_value = MockPoller()
+        client.volumes.update.return_value = Mock(spec=[])
+        with patch('time.sleep'):
+            with patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.netapp_client',
+                       client):
+                with pytest.raises(exc_class) as exc:
+                    my_obj.exec_module()
+        return exc.value.args[0], client
+
+    def test_module_fail_when_required_args_missing(self):
+        ''' required arguments are reported as errors '''
+        with pytest.raises(AnsibleFailJson) as exc:
+            set_module_args({})
+            volumes_module()
+        print('Info: %s' % exc.value.args[0]['msg'])
+
+    def test_check_mode(self):
+        ''' volumes are listed once, and no operation is started in check mode '''
+        volumes = [dict(name='vol1', size=100), dict(name='vol2', size=200), dict(name='vol3', state='absent'),
+                   dict(name='vol4'), dict(name='vol5', state='absent')]
+        args = self.set_default_args(volumes, _ansible_check_mode=True)
+        result, client = self.call_exec_module(args, [volume_info('vol1'), volume_info('vol2'), volume_info('vol3')])
+        assert result['changed']
+        assert [volume['action'] for volume in result['volumes']] == [None, 'modify', 'delete', 'create', None]
+        assert result['volumes'][1]['modify'] == dict(size=200)
+        client.volumes.list.assert_called_once_with('azure', 'azure', 'azure')
+        assert not client.volumes.create_or_update.called
+        assert not client.volumes.get.called
+
+    def test_create_modify_delete(self):
+        ''' operations are started and completed '''
+        volumes = [dict(name='vol1', size=300), dict(name='vol2', state='absent'), dict(name='vol3', file_path='path3')]
+        result, client = self.call_exec_module(self.set_default_args(volumes), [volume_info('vol1'), volume_info('vol2')])
+        assert result['changed']
+        assert [volume['action'] for volume in result['volumes']] == ['modify', 'delete', 'create']
+        assert client.volumes.update.call_args[1]['body'].usage_threshold == 300 * 1073741824
+        assert client.volumes.delete.call_args[1]['volume_name'] == 'vol2'
+        assert client.volumes.create_or_update.call_args[1]['body'].creation_token == 'path3'
+
+    def test_max_concurrency(self):
+        ''' no more than max_concurrency operations are in progress '''
+        volumes = [dict(name='vol%d' % index) for index in range(7)]
+        args = self.set_default_args(volumes, max_concurrency=3)
+        set_module_args(args)
+        with patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.__init__',
+                   return_value=None):
+            my_obj = volumes_module()
+        my_obj.operations = list()
+        client = Mock()
+        client.volumes.list.return_value = []
+        client.volumes.create_or_update.side_effect = lambda **kwargs: MockPoller(checks=3)
+        with patch('time.sleep'):
+            with patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.netapp_client',
+                       client):
+                with pytest.raises(AnsibleExitJson) as exc:
+                    my_obj.exec_module()
+        assert exc.value.args[0]['changed']
+        assert client.volumes.create_or_update.call_count == 7
+        assert MockPoller.max_in_progress == 3
+        assert MockPoller.in_progress == 0
+
+    def test_errors_are_reported_per_volume(self):
+        ''' other volumes are still processed when one fails '''
+        volumes = [dict(name='vol1', state='absent'), dict(name='vol2'), dict(name='vol3')]
+        set_module_args(self.set_default_args(volumes))
+        with patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.__init__',
+                   return_value=None):
+            my_obj = volumes_module()
+        my_obj.operations = list()
+        client = Mock()
+        client.volumes.list.return_value = [volume_info('vol1')]
+        client.volumes.delete.return_value = MockPoller(error='in use')
+        client.volumes.create_or_update.return_value = MockPoller()
+        with patch('time.sleep'):
+            with patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.netapp_client',
+                       client):
+                with pytest.raises(AnsibleFailJson) as exc:
+                    my_obj.exec_module()
+        result = exc.value.args[0]
+        assert result['changed']
+        assert 'in use' in result['volumes'][0]['error']
+        assert 'error' not in result['volumes'][1]
+        assert result['msg'].startswith('Error managing 1 volume(s)')
+
+    def test_create_without_location(self):
+        ''' location, subnet_id and virtual_network are required to create volumes '''
+        args = self.set_default_args([dict(name='vol1')])
+        del args['location']
+        result, client = self.call_exec_module(args, [], AnsibleFailJson)
+        assert 'location, subnet_id and virtual_network are required' in result['volumes'][0]['error']
+        assert not client.volumes.create_or_update.called
+
+    def test_no_wait(self):
+        ''' all operations are started, and their status is reported '''
+        volumes = [dict(name='vol%d' % index) for index in range(4)]
+        args = self.set_default_args(volumes, wait_for_completion=False, max_concurrency=2)
+        set_module_args(args)
+        with patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.__init__',
+                   return_value=None):
+            my_obj = volumes_module()
+        my_obj.operations = list()
+        client = Mock()
+        client.volumes.list.return_value = []
+        poller = Mock()
+        poller.done.return_value = False
+        poller.status.return_value = 'InProgress'
+        client.volumes.create_or_update.return_value = poller
+        with patch('ansible_collections.netapp.azure.plugins.module_utils.azure_rm_netapp_common.AzureRMNetAppModuleBase.netapp_client',
+                   client):
+            with pytest.raises(AnsibleExitJson) as exc:
+                my_obj.exec_module()
+        assert client.volumes.create_or_update.call_count == 4
+        assert [volume['status'] for volume in exc.value.args[0]['volumes']] == ['InProgress'] * 4
@@ -14,15 +14,22 @@ except Exception:
     HAS_SF_SDK = False
 
 
+# number of volumes returned by a single list_volumes call when looking up a volume by name
+VOLUME_PAGE_SIZE = 1000
+
+
 def has_sf_sdk():
     return HAS_SF_SDK
 
 
 class NaElementSWModule(object):
 
-    def __init__(self, elem):
+    def __init__(self, elem, volume_page_size=VOLUME_PAGE_SIZE):
         self.elem_connect = elem
         self.parameters = dict()
+        self.volume_page_size = volume_page_size
+        # name to ID index for the volumes already listed with this connection, for each account
+        self.volume_index = dict()
 
     def get_volume(self, volume_id):
         """
@@ -53,13 +60,44 @@ class NaElementSWModule(object):
             :return: Volume ID of the first matching volume if found. None if not found.
             :rtype: int
         """
-        volume_list = self.elem_connect.list_volumes_for_account(account_id=account_id)
+        index = self.get_volume_index(account_id)
+        if vol_name not in index['names']:
+            # when all pages were already listed, this looks for volumes created since then
+            self.index_volumes_page(account_id)
+            while vol_name not in index['names'] and not index['complete']:
+                self.index_volumes_page(account_id)
+        return index['names'].get(vol_name)
+
+    def get_volume_index(self, account_id):
+        """
+            Return the name to ID index for the volumes of an account
+            next_start is the first volume ID not listed yet, complete is set when the last page was reached
+        """
+        return self.volume_index.setdefault(account_id, dict(names=dict(), next_start=0, complete=False))
+
+    def index_volumes_page(self, account_id):
+        """
+            List the next page of volumes for an account, in volume ID order, and add the active volumes to the index
+            The first volume is kept when several active volumes share the same name
+        """
+        index = self.get_volume_index(account_id)
+        volume_list = self.elem_connect.list_volumes(start_volume_id=index['next_start'], limit=self.volume_page_size,
+                                                     accounts=[account_id])
         for volume in volume_list.volumes:
-            if volume.name == vol_name:
-                # return volume_id
-                if str(volume.delete_time) == "":
-                    return volume.volume_id
-        return None
+            if str(volume.delete_time) == "":
+                index['names'].setdefault(volume.name, volume.volume_id)
+            index['next_start'] = max(index['next_start'], volume.volume_id + 1)
+        index['complete'] = len(volume_list.volumes) < self.volume_page_size
+
+    def clear_volume_index(self, account_id=None):
+        """
+            Forget the indexed volumes, for an account or for all accounts
+            To be called after a volume is deleted or renamed
+        """
+        if account_id is None:
+            self.volume_index = dict()
+        else:
+            self.volume_index.pop(account_id, None)
 
     def volume_id_exists(self, volume_id):
         """
@@ -0,0 +1,253 @@
+#!/usr/bin/python
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+'''
+Element Software Info
+'''
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'certified'}
+
+
+DOCUMENTATION = '''
+
+module: na_elementsw_info
+
+short_description: NetApp Element Software Info
+extends_documentation_fragment:
+    - netapp.elementsw.netapp.solidfire
+version_added: '20.7.0'
+author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
+description:
+    - Collect volumes, accounts, access groups, initiators, schedules, drives and nodes on Element Software Cluster.
+    - Volumes, accounts, access groups and initiators are listed one page at a time.
+    - The selected subsets are listed concurrently, using the same connection.
+    - For each subset, records are indexed by ID, and IDs are indexed by name.
+
+options:
+    gather_subset:
+        description:
+        - List of subsets to collect.
+        - C(all) collects every subset.
+        type: list
+        elements: str
+        default: ['all']
+        choices: ['all', 'access_groups', 'accounts', 'drives', 'initiators', 'nodes', 'schedules', 'volumes']
+    max_records:
+        description:
+        - Maximum number of records returned in a single call, for the subsets that support paging.
+        type: int
+        default: 1000
+    max_concurrency:
+        description:
+        - Maximum number of subsets collected at the same time.
+        type: int
+        default: 4
+'''
+
+EXAMPLES = """
+
+- name: Collect all information
+  na_elementsw_info:
+    hostname: "{{ elementsw_hostname }}"
+    username: "{{ elementsw_username }}"
+    password: "{{ elementsw_password }}"
+  register: elementsw_info
+
+- name: Collect volumes and accounts, and look up a volume ID by name
+  na_elementsw_info:
+    hostname: "{{ elementsw_hostname }}"
+    username: "{{ elementsw_username }}"
+    password: "{{ elementsw_password }}"
+    gather_subset:
+      - volumes
+      - accounts
+  register: elementsw_info
+
+- debug:
+    msg: "{{ elementsw_info.info.volumes_by_name['ansible_vol'] }}"
+"""
+
+RETURN = """
+
+info:
+    description:
+    - For each subset, a dictionary of records indexed by ID, as reported by the Element API.
+    - For each subset except drives, a <subset>_by_name dictionary with the list of IDs for each name.
+    - Names are not unique for volumes, as a deleted volume keeps its name until it is purged.
+    returned: always
+    type: dict
+    sample: {
+        "volumes": {"1": {"volumeID": 1, "name": "ansible_vol", "accountID": 1}},
+        "volumes_by_name": {"ansible_vol": [1]},
+        "accounts": {"1": {"accountID": 1, "username": "ansible"}},
+        "accounts_by_name": {"ansible": [1]}
+    }
+"""
+
+import threading
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
+from ansible.module_utils.six.moves import queue
+import ansible_collections.netapp.elementsw.plugins.module_utils.netapp as netapp_utils
+
+HAS_SF_SDK = netapp_utils.has_sf_sdk()
+
+# api: list method, records: attribute holding the records in the result,
+# key and name: attributes used for the indexes, start: paging argument if the API supports paging
+SUBSETS = dict(
+    volumes=dict(api='list_volumes', records='volumes', key='volume_id', name='name', start='start_volume_id'),
+    accounts=dict(api='list_accounts', records='accounts', key='account_id', name='username', start='start_account_id'),
+    access_groups=dict(api='list_volume_access_groups', records='volume_access_groups', key='volume_access_group_id',
+                       name='name', start='start_volume_access_group_id'),
+    initiators=dict(api='list_initiators', records='initiators', key='initiator_id', name='initiator_name',
+                    start='start_initiator_id'),
+    schedules=dict(api='list_schedules', records='schedules', key='schedule_id', name='name', start=None),
+    drives=dict(api='list_drives', records='drives', key='drive_id', name=None, start=None),
+    nodes=dict(api='list_active_nodes', records='nodes', key='node_id', name='name', start=None)
+)
+
+
+class ElementSWInfo(object):
+    """
+    Element Software Info
+    """
+
+    def __init__(self):
+        self.argument_spec = netapp_utils.ontap_sf_host_argument_spec()
+        self.argument_spec.update(dict(
+            gather_subset=dict(required=False, type='list', elements='str', default=['all'],
+                               choices=['all'] + sorted(SUBSETS)),
+            max_records=dict(required=False, type='int', default=1000),
+            max_concurrency=dict(required=False, type='int', default=4)
+        ))
+
+        self.module = AnsibleModule(
+            argument_spec=self.argument_spec,
+            supports_check_mode=True
+        )
+
+        self.parameters = self.module.params
+        if self.parameters['max_records'] < 1:
+            self.module.fail_json(msg='Error: max_records must be greater than 0')
+
+        if HAS_SF_SDK is False:
+            self.module.fail_json(msg="Unable to import the SolidFire Python SDK")
+        else:
+            self.sfe = netapp_utils.create_sf_connection(module=self.module)
+
+    def get_subsets(self):
+        if 'all' in self.parameters['gather_subset']:
+            return sorted(SUBSETS)
+        return sorted(set(self.parameters['gather_subset']))
+
+    @staticmethod
+    def to_dict(record):
+        ''' SDK objects are reported with the API names, eg volumeID '''
+        if hasattr(record, 'to_json'):
+            return record.to_json()
+        return dict(vars(record))
+
+    def list_records(self, subset):
+        """
+            List all records for a subset, one page at a time when the API supports paging
+            Records are returned in ID order, so the next page starts after the last ID
+            :return: list of SDK objects
+        """
+        config = SUBSETS[subset]
+        method = getattr(self.sfe, config['api'])
+        if config['start'] is None:
+            return list(getattr(method(), config['records']))
+        records = list()
+        start = 0
+        while True:
+            kwargs = {config['start']: start, 'limit': self.parameters['max_records']}
+            page = list(getattr(method(**kwargs), config['records']))
+            records.extend(page)
+            if len(page) < self.parameters['max_records']:
+                return records
+            start = getattr(page[-1], config['key']) + 1
+
+    def get_subset_info(self, subset):
+        """
+            :return: dict with the records indexed by ID, and the IDs indexed by name
+        """
+        config = SUBSETS[subset]
+        info = {subset: dict()}
+        if config['name'] is not None:
+            info[subset + '_by_name'] = dict()
+        for record in self.list_records(subset):
+            record_id = getattr(record, config['key'])
+            info[subset][str(record_id)] = self.to_dict(record)
+            if config['name'] is not None:
+                info[subset + '_by_name'].setdefault(getattr(record, config['name']), list()).append(record_id)
+        return info
+
+    def info_worker(self, tasks, results):
+        """
+            Collect subsets until a None task is received
+            The result is a (info, error) tuple indexed by subset
+        """
+        while True:
+            subset = tasks.get()
+            if subset is None:
+                return
+            try:
+                results[subset] = (self.get_subset_info(subset), None)
+            except Exception as exception_object:  # pylint: disable=broad-except
+                # the SDK does not use a specific exception
+                results[subset] = (None, to_native(exception_object))
+
+    def get_info(self):
+        """
+            Collect the selected subsets, with up to max_concurrency workers sharing the connection
+            :return: dict
+        """
+        subsets = self.get_subsets()
+        results = dict()
+        tasks = queue.Queue()
+        for subset in subsets:
+            tasks.put(subset)
+        if self.parameters['max_concurrency'] <= 1 or len(subsets) <= 1:
+            tasks.put(None)
+            self.info_worker(tasks, results)
+        else:
+            workers = list()
+            for dummy in range(min(self.parameters['max_concurrency'], len(subsets))):
+                worker = threading.Thread(target=self.info_worker, args=(tasks, results))
+                worker.daemon = True
+                worker.start()
+                workers.append(worker)
+            for dummy in workers:
+                tasks.put(None)
+            for worker in workers:
+                worker.join()
+        info = dict()
+        for subset in subsets:
+            subset_info, error = results[subset]
+            if error is not None:
+                self.module.fail_json(msg='Error listing %s: %s' % (subset, error))
+            info.update(subset_info)
+        return info
+
+    def apply(self):
+        self.module.exit_json(changed=False, info=self.get_info())
+
+
+def main():
+    """
+    Main function
+    """
+    na_elementsw_info = ElementSWInfo()
+    na_elementsw_info.apply()
+
+
+if __name__ == '__main__':
+    main()
@@ -277,6 +277,7 @@ class ElementOSVolume(object):
             self.sfe.delete_volume(volume_id=volume_id)
             self.sfe.purge_deleted_volume(volume_id=volume_id)
             # Delete method will delete and also purge the volume instead of moving the volume state to inactive.
+            self.elementsw_helper.clear_volume_index(self.account_id)
 
         except Exception as err:
             # Throwing the exact error message instead of generic error message
@@ -297,6 +298,8 @@ class ElementOSVolume(object):
                                    qos=self.qos,
                                    total_size=self.size,
                                    attributes=self.attributes)
+            # the volume may have moved to another account
+            self.elementsw_helper.clear_volume_index()
 
         except Exception as err:
             # Throwing the exact error message instead of generic error message
@@ -80,7 +80,7 @@ class MockSFConnection(object):
         access_group_list = self.Bunch(volume_access_groups=access_groups)
         return access_group_list
 
-    def list_volumes_for_account(self, *args, **kwargs):  # pylint: disable=unused-argument
+    def list_volumes(self, *args, **kwargs):  # pylint: disable=unused-argument
         ''' build volume list: volume.name, volume.id '''
         volume = self.Bunch(name='element_volumename', volume_id=VOLUME_ID, delete_time='')
         volumes = [volume]
@@ -0,0 +1,184 @@
+''' unit test for Ansible module: na_elementsw_info.py '''
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import pytest
+
+from ansible_collections.netapp.elementsw.tests.unit.compat import unittest
+from ansible_collections.netapp.elementsw.tests.unit.compat.mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import ansible_collections.netapp.elementsw.plugins.module_utils.netapp as netapp_utils
+
+if not netapp_utils.has_sf_sdk():
+    pytestmark = pytest.mark.skip('skipping as missing required SolidFire Python SDK')
+
+from ansible_collections.netapp.elementsw.plugins.modules.na_elementsw_info \
+    import ElementSWInfo as my_module  # module under test
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class MockSFConnection(object):
+    ''' mock connection to ElementSW host '''
+
+    class Bunch(object):  # pylint: disable=too-few-public-methods
+        ''' create object with arbitrary attributes '''
+        def __init__(self, **kw):
+            ''' called with (k1=v1, k2=v2), creates obj.k1, obj.k2 with values v1, v2 '''
+            setattr(self, '__dict__', kw)
+
+    def __init__(self, volumes=3, force_error=False):
+        ''' save arguments '''
+        self.volumes = [self.Bunch(volume_id=index, name='vol%d' % (index % 2)) for index in range(1, volumes + 1)]
+        self.force_error = force_error
+        self.calls = list()
+
+    def list_volumes(self, start_volume_id=0, limit=None):
+        ''' return the volumes with an ID greater or equal to start_volume_id, up to limit '''
+        self.calls.append(('list_volumes', start_volume_id, limit))
+        volumes = [volume for volume in self.volumes if volume.volume_id >= start_volume_id]
+        return self.Bunch(volumes=volumes[:limit])
+
+    def list_accounts(self, start_account_id=0, limit=None):
+        ''' build account list '''
+        self.calls.append(('list_accounts', start_account_id, limit))
+        if self.force_error:
+            raise OSError('some_error_in_list_accounts')
+        return self.Bunch(accounts=[self.Bunch(account_id=1, username='ansible')])
+
+    def list_volume_access_groups(self, start_volume_access_group_id=0, limit=None):
+        ''' build access_group list '''
+        self.calls.append(('list_volume_access_groups', start_volume_access_group_id, limit))
+        return self.Bunch(volume_access_groups=[self.Bunch(volume_access_group_id=2, name='group')])
+
+    def list_initiators(self, start_initiator_id=0, limit=None):
+        ''' build initiator list '''
+        self.calls.append(('list_initiators', start_initiator_id, limit))
+        return self.Bunch(initiators=[self.Bunch(initiator_id=3, initiator_name='iqn.1998-01.com.vmware:esx-01')])
+
+    def list_schedules(self):
+        ''' build schedule list '''
+        self.calls.append(('list_schedules',))
+        return self.Bunch(schedules=[self.Bunch(schedule_id=4, name='daily')])
+
+    def list_drives(self):
+        ''' build drive list '''
+        self.calls.append(('list_drives',))
+        return self.Bunch(drives=[self.Bunch(drive_id=5, serial='scsi-SATA')])
+
+    def list_active_nodes(self):
+        ''' build node list '''
+        self.calls.append(('list_active_nodes',))
+        return self.Bunch(nodes=[self.Bunch(node_id=6, name='node1')])
+
+
+class TestMyModule(unittest.TestCase):
+    ''' a group of related Unit Tests '''
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule,
+                                                 exit_json=exit_json,
+                                                 fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+
+    @staticmethod
+    def set_default_args(**kwargs):
+        args = dict(
+            hostname='10.253.168.129',
+            username='namburu',
+            password='SFlab1234',
+        )
+        args.update(kwargs)
+        return args
+
+    @patch('ansible_collections.netapp.elementsw.plugins.module_utils.netapp.create_sf_connection')
+    def call_apply(self, args, connection, mock_create_sf_connection, exc_class=AnsibleExitJson):
+        mock_create_sf_connection.return_value = connection
+        set_module_args(args)
+        my_obj = my_module()
+        with pytest.raises(exc_class) as exc:
+            my_obj.apply()
+        return exc.value.args[0]
+
+    def test_module_fail_when_required_args_missing(self):
+        ''' required arguments are reported as errors '''
+        with pytest.raises(AnsibleFailJson) as exc:
+            set_module_args({})
+            my_module()
+        print('Info: %s' % exc.value.args[0]['msg'])
+
+    def test_all_subsets(self):
+        ''' every subset is collected and indexed '''
+        connection = MockSFConnection()
+        result = self.call_apply(self.set_default_args(), connection)
+        assert not result['changed']
+        info = result['info']
+        assert sorted(info['volumes']) == ['1', '2', '3']
+        assert info['volumes_by_name'] == {'vol0': [2], 'vol1': [1, 3]}
+        assert info['accounts_by_name'] == {'ansible': [1]}
+        assert info['access_groups_by_name'] == {'group': [2]}
+        assert info['initiators_by_name'] == {'iqn.1998-01.com.vmware:esx-01': [3]}
+        assert info['schedules_by_name'] == {'daily': [4]}
+        assert info['drives']['5']['serial'] == 'scsi-SATA'
+        assert 'drives_by_name' not in info
+        assert info['nodes_by_name'] == {'node1': [6]}
+
+    def test_paging(self):
+        ''' volumes are listed one page at a time, starting after the last ID '''
+        connection = MockSFConnection(volumes=5)
+        result = self.call_apply(self.set_default_args(gather_subset=['volumes'], max_records=2), connection)
+        assert sorted(result['info']['volumes']) == ['1', '2', '3', '4', '5']
+        assert connection.calls == [('list_volumes', 0, 2), ('list_volumes', 3, 2), ('list_volumes', 5, 2)]
+        assert 'accounts' not in result['info']
+
+    def test_paging_stops_on_full_page(self):
+        ''' an empty page is requested when the last page is full '''
+        connection = MockSFConnection(volumes=4)
+        result = self.call_apply(self.set_default_args(gather_subset=['volumes'], max_records=2), connection)
+        assert len(result['info']['volumes']) == 4
+        assert len(connection.calls) == 3
+
+    def test_concurrent_subsets(self):
+        ''' workers share the connection '''
+        connection = MockSFConnection()
+        result = self.call_apply(self.set_default_args(max_concurrency=3), connection)
+        assert len(result['info']) == 13
+        assert len(connection.calls) == 7
+
+    def test_error(self):
+        ''' an error in one subset is reported '''
+        connection = MockSFConnection(force_error=True)
+        result = self.call_apply(self.set_default_args(gather_subset=['accounts', 'volumes'], max_concurrency=2), connection,
+                                 exc_class=AnsibleFailJson)
+        assert result['msg'] == 'Error listing accounts: some_error_in_list_accounts'
@@ -0,0 +1,91 @@
+# Copyright (c) 2020 NetApp
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for module_utils netapp_elementsw_module.py '''
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.netapp.elementsw.tests.unit.compat import unittest
+from ansible_collections.netapp.elementsw.plugins.module_utils.netapp_elementsw_module import NaElementSWModule
+
+
+class MockSFConnection(object):
+    ''' mock connection to ElementSW host, listing volumes in ID order '''
+
+    class Bunch(object):  # pylint: disable=too-few-public-methods
+        ''' create object with arbitrary attributes '''
+        def __init__(self, **kw):
+            ''' called with (k1=v1, k2=v2), creates obj.k1, obj.k2 with values v1, v2 '''
+            setattr(self, '__dict__', kw)
+
+    def __init__(self, volumes):
+        ''' volumes is a list of (volume_id, name, account_id, delete_time) tuples '''
+        self.volumes = [self.Bunch(volume_id=volume_id, name=name, account_id=account_id, delete_time=delete_time)
+                        for volume_id, name, account_id, delete_time in volumes]
+        self.calls = list()
+
+    def list_volumes(self, start_volume_id=0, limit=None, accounts=None):
+        ''' return up to limit volumes for the accounts, starting at start_volume_id '''
+        self.calls.append((start_volume_id, limit, accounts))
+        volumes = [volume for volume in self.volumes
+                   if volume.volume_id >= start_volume_id and (accounts is None or volume.account_id in accounts)]
+        return self.Bunch(volumes=volumes[:limit])
+
+    def add_volume(self, volume_id, name, account_id):
+        self.volumes.append(self.Bunch(volume_id=volume_id, name=name, account_id=account_id, delete_time=''))
+
+
+class TestMyModule(unittest.TestCase):
+    ''' a group of related Unit Tests '''
+
+    def setUp(self):
+        volumes = [(index, 'vol%d' % index, 1, '') for index in range(1, 11)]
+        volumes.append((11, 'vol2', 1, ''))
+        volumes.append((12, 'other', 2, ''))
+        # a deleted volume keeps its name until it is purged
+        volumes.insert(0, (0, 'vol5', 1, '2020-06-01T00:00:00Z'))
+        self.connection = MockSFConnection(volumes)
+        self.helper = NaElementSWModule(self.connection, volume_page_size=3)
+
+    def test_get_volume_id_stops_on_match(self):
+        ''' pages are listed until the volume is found '''
+        assert self.helper.get_volume_id('vol2', 1) == 2
+        assert self.connection.calls == [(0, 3, [1])]
+        assert self.helper.get_volume_id('vol5', 1) == 5
+        assert self.connection.calls == [(0, 3, [1]), (3, 3, [1])]
+
+    def test_get_volume_id_uses_index(self):
+        ''' names already listed do not require another call '''
+        assert self.helper.get_volume_id('vol4', 1) == 4
+        calls = len(self.connection.calls)
+        assert self.helper.get_volume_id('vol1', 1) == 1
+        assert self.helper.get_volume_id('vol3', 1) == 3
+        assert len(self.connection.calls) == calls
+
+    def test_get_volume_id_not_found(self):
+        ''' all pages are listed, and new volumes are found on a later call '''
+        assert self.helper.get_volume_id('new', 1) is None
+        assert [call[0] for call in self.connection.calls] == [0, 3, 6, 9, 12]
+        self.connection.add_volume(13, 'new', 1)
+        assert self.helper.get_volume_id('new', 1) == 13
+        assert self.connection.calls[-1] == (12, 3, [1])
+        assert self.helper.get_volume_id('vol2', 1) == 2
+
+    def test_get_volume_id_per_account(self):
+        ''' each account has its own index '''
+        assert self.helper.get_volume_id('other', 1) is None
+        assert self.helper.get_volume_id('other', 2) == 12
+        assert self.helper.get_volume_id('vol1', 2) is None
+
+    def test_volume_exists_by_name(self):
+        ''' volume_exists uses the index '''
+        assert self.helper.volume_exists('vol10', 1) == 10
+        assert self.helper.volume_exists('vol9', 1) == 9
+        assert len(self.connection.calls) == 4
+
+    def test_clear_volume_index(self):
+        ''' volumes are listed again after the index is cleared '''
+        assert self.helper.get_volume_id('vol1', 1) == 1
+        self.helper.clear_volume_index(1)
+        assert self.helper.get_volume_id('vol1', 1) == 1
+        assert len(self.connection.calls) == 2
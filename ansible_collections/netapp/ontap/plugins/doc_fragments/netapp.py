@@ -89,6 +89,41 @@ options:
       - Supported keys and values are subject to change without notice.  Unknown keys are ignored.
       type: dict
       version_added: "20.5.0"
+  cache_ttl:
+      description:
+      - Number of seconds properties discovered on the cluster are cached on disk, and reused by later tasks.
+      - Cached properties are REST availability (with use_rest set to Auto), the ONTAPI version, and the admin vserver name.
+      - Entries are keyed by hostname, http_port, and username or certificate file.
+      - 0 disables the cache.
+      type: int
+      default: 0
+      version_added: "20.7.0"
+  cache_dir:
+      description:
+      - Directory for the on-disk cache, used when cache_ttl is set.
+      - Defaults to ~/.ansible/tmp/netapp_ontap_cache, created with mode 0700.
+      - Cached values are ignored if the directory or cache file is not owned by the current user, or is writable by group or others.
+      type: path
+      version_added: "20.7.0"
+  cache_invalidate:
+      description:
+      - If set to C(yes), cached entries are ignored, and refreshed with the values discovered during this task.
+      type: bool
+      default: no
+      version_added: "20.7.0"
+  ems_logging:
+      description:
+      - Controls how the modules log usage events to EMS and AutoSupport.
+      - immediate -- the event is sent before the module performs its work.
+      - deferred -- the event is queued, and sent after the module has completed its work.
+      - With deferred, the event is still sent by the module process before it exits, so the task does not complete sooner.
+      - Deferred only ensures that the module work is not delayed or blocked by EMS logging.
+      - off -- no event is sent.
+      - With deferred or off, the admin vserver lookup required by cluster scoped events is also deferred or skipped.
+      type: str
+      default: immediate
+      choices: ['immediate', 'deferred', 'off']
+      version_added: "20.7.0"
 
 
 requirements:
@@ -103,5 +138,8 @@ requirements:
 
 notes:
   - The modules prefixed with na\\_ontap are built to support the ONTAP storage platform.
+  - With C(ansible_connection=httpapi) and C(ansible_network_os=netapp.ontap.ontap), ZAPI and REST calls are sent through a
+    persistent connection, and authentication and discovered capabilities are reused across tasks.
+    Credentials are then taken from C(ansible_user) and C(ansible_password).
 
 '''
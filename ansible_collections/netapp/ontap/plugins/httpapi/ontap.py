@@ -0,0 +1,81 @@
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' HttpApi plugin for NetApp ONTAP, keeps a persistent connection across tasks '''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
+httpapi: ontap
+short_description: HttpApi Plugin for NetApp ONTAP
+description:
+  - This HttpApi plugin provides a persistent connection to a NetApp ONTAP cluster.
+  - ZAPI and REST calls from the netapp.ontap modules are sent through this connection,
+    so authentication and discovered capabilities are reused across tasks.
+  - Use with C(ansible_connection=httpapi) and C(ansible_network_os=netapp.ontap.ontap).
+version_added: "20.7.0"
+'''
+
+import base64
+import json
+
+from ansible.module_utils._text import to_bytes, to_text
+from ansible.module_utils.six.moves.urllib.parse import urlencode
+from ansible.plugins.httpapi import HttpApiBase
+
+ZAPI_PATH = '/servlets/netapp.servlets.admin.XMLrequest_filer'
+REST_PATH = '/api/'
+
+
+class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        # capabilities discovered by a module are shared with the following tasks
+        self._capabilities = dict()
+
+    def login(self, username, password):
+        ''' ONTAP uses basic authentication, send the header with every request rather than waiting for a challenge '''
+        if username is None or password is None:
+            return
+        credentials = base64.b64encode(to_bytes('%s:%s' % (username, password)))
+        self.connection._auth = {'Authorization': 'Basic %s' % to_text(credentials)}
+
+    def update_auth(self, response, response_text):
+        ''' keep the basic authentication header set in login '''
+        return None
+
+    def send_request(self, data, method='GET', path='', params=None, headers=None):
+        ''' send a REST request, and return the status code and the json body if any '''
+        url = REST_PATH + path
+        if params:
+            url += '?' + urlencode(params, doseq=True)
+        request_headers = {'Content-Type': 'application/json'}
+        if headers:
+            request_headers.update(headers)
+        if data is not None:
+            data = json.dumps(data)
+        response, response_data = self.connection.send(url, data, method=method, headers=request_headers)
+        body = to_text(response_data.getvalue())
+        try:
+            json_dict = json.loads(body) if body else None
+        except ValueError:
+            json_dict = None
+        if method == 'OPTIONS' and not json_dict:
+            # OPTIONS provides the list of supported verbs
+            json_dict = {'Allow': response.headers.get('Allow')}
+        return response.getcode(), json_dict
+
+    def invoke_zapi(self, request):
+        ''' post a ZAPI request (complete netapp xml document), and return the raw xml response '''
+        headers = {'Content-Type': 'text/xml', 'charset': 'utf-8'}
+        response, response_data = self.connection.send(ZAPI_PATH, request, method='POST', headers=headers)
+        return to_text(response_data.getvalue())
+
+    def get_capability(self, name):
+        ''' return a cached capability (eg is_rest, cserver), or None if not discovered yet '''
+        return self._capabilities.get(name)
+
+    def set_capability(self, name, value):
+        self._capabilities[name] = value
@@ -30,9 +30,19 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import atexit
+import hashlib
+import json
 import os
+import stat
+import tempfile
+import threading
 import time
+import traceback
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils._text import to_bytes, to_native, to_text
+from ansible.module_utils.connection import Connection, ConnectionError
+from ansible.module_utils.six.moves import queue
 
 try:
     from ansible.module_utils.ansible_release import __version__ as ansible_version
@@ -125,6 +135,10 @@ def na_ontap_host_argument_spec():
         feature_flags=dict(required=False, type='dict', default=dict()),
         cert_filepath=dict(required=False, type='str'),
         key_filepath=dict(required=False, type='str'),
+        cache_ttl=dict(required=False, type='int', default=0),
+        cache_dir=dict(required=False, type='path'),
+        cache_invalidate=dict(required=False, type='bool', default=False),
+        ems_logging=dict(required=False, type='str', default='immediate', choices=['immediate', 'deferred', 'off']),
     )
 
 
@@ -185,6 +199,91 @@ def set_auth_method(module, username, password, cert_filepath, key_filepath):
     return auth_method
 
 
+def get_ontap_cache(module):
+    ''' return an on-disk cache if enabled with cache_ttl, None otherwise '''
+    if module.params.get('cache_ttl'):
+        return OntapCache(module)
+    return None
+
+
+class OntapCache(object):
+    ''' on-disk cache for properties discovered on a cluster, keyed by hostname and credentials identity
+        entries older than cache_ttl seconds are ignored
+        with cache_invalidate, entries are ignored and refreshed
+    '''
+    def __init__(self, module):
+        self.module = module
+        self.ttl = module.params.get('cache_ttl') or 0
+        self.invalidate = module.params.get('cache_invalidate')
+        cache_dir = module.params.get('cache_dir')
+        if cache_dir is None:
+            # per user, a shared temporary directory could be pre-created or poisoned by another user
+            cache_dir = os.path.join(os.path.expanduser('~'), '.ansible', 'tmp', 'netapp_ontap_cache')
+        # the password is not part of the key, but the user or certificate is
+        identity = module.params.get('username') or module.params.get('cert_filepath')
+        key = '%s:%s:%s' % (module.params['hostname'], module.params.get('http_port'), identity)
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        self.cache_dir = cache_dir
+        self.filepath = os.path.join(cache_dir, 'ontap_%s.json' % digest)
+
+    @staticmethod
+    def is_trusted(path):
+        ''' only trust a file or directory owned by the current user, and not writable by group or others '''
+        try:
+            stats = os.stat(path)
+        except (IOError, OSError):
+            return False
+        if hasattr(os, 'getuid') and stats.st_uid != os.getuid():
+            return False
+        return not stats.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    def read(self):
+        if not self.is_trusted(self.cache_dir) or not self.is_trusted(self.filepath):
+            return dict()
+        try:
+            with open(self.filepath, 'r') as f:
+                entries = json.load(f)
+        except (IOError, OSError, ValueError):
+            return dict()
+        return entries if isinstance(entries, dict) else dict()
+
+    def get_capability(self, name):
+        if self.invalidate:
+            return None
+        entry = self.read().get(name)
+        if not isinstance(entry, dict) or time.time() - entry.get('time', 0) > self.ttl:
+            return None
+        return entry.get('value')
+
+    def set_capability(self, name, value):
+        ''' a failure to write the cache is not an error, the value is discovered again on the next run '''
+        entries = self.read()
+        entries[name] = dict(value=value, time=time.time())
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, 0o700)
+                os.chmod(self.cache_dir, 0o700)
+            if not self.is_trusted(self.cache_dir):
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            # atomic, as concurrent tasks may target the same cluster
+            os.rename(tmp_path, self.filepath)
+        except (IOError, OSError):
+            pass
+
+
+def get_httpapi_connection(module):
+    ''' return a connection to the persistent httpapi process when running with ansible_connection=httpapi
+        otherwise return None, and each module connects directly to the cluster
+    '''
+    socket_path = getattr(module, '_socket_path', None)
+    if socket_path:
+        return Connection(socket_path)
+    return None
+
+
 def setup_na_ontap_zapi(module, vserver=None):
     hostname = module.params['hostname']
     username = module.params['username']
@@ -195,11 +294,18 @@ def setup_na_ontap_zapi(module, vserver=None):
     version = module.params['ontapi']
     cert_filepath = module.params['cert_filepath']
     key_filepath = module.params['key_filepath']
-    auth_method = set_auth_method(module, username, password, cert_filepath, key_filepath)
+    httpapi = get_httpapi_connection(module)
+    if httpapi is None:
+        auth_method = set_auth_method(module, username, password, cert_filepath, key_filepath)
+    else:
+        # authentication is handled by the persistent connection
+        auth_method = None
 
     if HAS_NETAPP_LIB:
         # set up zapi
-        if auth_method != 'basic_auth':
+        if httpapi is not None:
+            server = OntapZAPIHttpApi(hostname, httpapi)
+        elif auth_method != 'basic_auth':
             # override NaServer in netapp-lib to enable certificate authentication
             server = OntapZAPICx(hostname, module=module, username=username, password=password,
                                  validate_certs=validate_certs, cert_filepath=cert_filepath,
@@ -234,13 +340,72 @@ def setup_na_ontap_zapi(module, vserver=None):
         server.set_transport_type(transport_type)
         server.set_port(port)
         server.set_server_type('FILER')
+        server.ontap_cache = get_ontap_cache(module)
+        server.ems_logging = module.params.get('ems_logging') or 'immediate'
         return server
     else:
         module.fail_json(msg="the python NetApp-Lib module is required")
 
 
+# EMS events queued with ems_logging: deferred, sent when the module exits
+EMS_QUEUE = list()
+
+
 def ems_log_event(source, server, name="Ansible", id="12345", version=COLLECTION_VERSION,
                   category="Information", event="setup", autosupport="false"):
+    """ log an EMS event, depending on ems_logging:
+        immediate: send the event now
+        deferred: send the event when the module exits, so it is not on the critical path of the task
+        off: do not send the event
+    """
+    kwargs = dict(name=name, id=id, version=version, category=category, event=event, autosupport=autosupport)
+    ems_logging = getattr(server, 'ems_logging', 'immediate')
+    if ems_logging == 'off':
+        return
+    if ems_logging == 'deferred':
+        defer_ems_event(lambda: send_ems_event(source, server, **kwargs))
+        return
+    send_ems_event(source, server, **kwargs)
+
+
+def ems_log_event_cserver(source, server, module, **kwargs):
+    """ log an EMS event on the admin vserver
+        with ems_logging set to deferred or off, the admin vserver is only looked up if and when the event is sent
+    """
+    ems_logging = module.params.get('ems_logging') or 'immediate'
+    if ems_logging == 'off':
+        return
+
+    def log_event():
+        cserver = setup_na_ontap_zapi(module=module, vserver=get_cserver(server))
+        send_ems_event(source, cserver, **kwargs)
+
+    if ems_logging == 'deferred':
+        defer_ems_event(log_event)
+        return
+    results = get_cserver(server)
+    cserver = setup_na_ontap_zapi(module=module, vserver=results)
+    ems_log_event(source, cserver, **kwargs)
+
+
+def defer_ems_event(log_event):
+    if not EMS_QUEUE:
+        atexit.register(flush_ems_events)
+    EMS_QUEUE.append(log_event)
+
+
+def flush_ems_events():
+    """ send queued EMS events, errors are ignored as EMS logging is best effort """
+    while EMS_QUEUE:
+        log_event = EMS_QUEUE.pop(0)
+        try:
+            log_event()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+
+def send_ems_event(source, server, name="Ansible", id="12345", version=COLLECTION_VERSION,
+                   category="Information", event="setup", autosupport="false"):
     ems_log = zapi.NaElement('ems-autosupport-log')
     # Host name invoking the API.
     ems_log.add_new_child("computer-name", name)
@@ -276,7 +441,33 @@ def get_cserver_zapi(server):
     return None
 
 
+def get_cached_value(connection, name, discover):
+    ''' return a discovered cluster property (eg is_rest, cserver, ontapi)
+        the persistent httpapi connection and the on-disk cache are searched first, if they are configured
+        on a miss, discover() is called, and the value is saved unless it is None
+    '''
+    stores = [store for store in (getattr(connection, 'httpapi', None), getattr(connection, 'ontap_cache', None))
+              if store is not None]
+    missed = list()
+    value = None
+    for store in stores:
+        value = store.get_capability(name)
+        if value is not None:
+            break
+        missed.append(store)
+    if value is None:
+        value = discover()
+    if value is not None:
+        for store in missed:
+            store.set_capability(name, value)
+    return value
+
+
 def get_cserver(connection, is_rest=False):
+    return get_cached_value(connection, 'cserver', lambda: _get_cserver(connection, is_rest))
+
+
+def _get_cserver(connection, is_rest):
     if not is_rest:
         return get_cserver_zapi(connection)
 
@@ -297,6 +488,251 @@ def get_cserver(connection, is_rest=False):
     return None
 
 
+def wait_for_condition(poll, timeout, interval=1, max_interval=30):
+    ''' call poll until it reports done, or until timeout seconds have elapsed
+        poll returns a tuple (done, result)
+        the interval between calls starts at interval seconds, and doubles up to max_interval seconds
+        with timeout set to None, there is no deadline
+        returns the last (done, result) tuple
+    '''
+    deadline = None if timeout is None else time.time() + timeout
+    while True:
+        done, result = poll()
+        if done:
+            return done, result
+        if deadline is not None:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return done, result
+            interval = min(interval, remaining)
+        time.sleep(interval)
+        interval = min(interval * 2, max_interval)
+
+
+def get_zapi_records(server, zapi_iter, max_records=None, enable_tunneling=True):
+    ''' generator invoking an iter ZAPI, and following next-tag until all the pages are read
+        each record in attributes-list is yielded as soon as its page is received
+        zapi_iter is updated with max-records and with the tag for the next page
+        raises NaApiError on error
+    '''
+    if max_records is not None:
+        zapi_iter.add_new_child('max-records', str(max_records))
+    while True:
+        result = server.invoke_successfully(zapi_iter, enable_tunneling=enable_tunneling)
+        attributes_list = result.get_child_by_name('attributes-list')
+        if attributes_list is not None:
+            for record in attributes_list.get_children():
+                yield record
+        next_tag = result.get_child_content('next-tag')
+        if next_tag is None:
+            return
+        tag = zapi_iter.get_child_by_name('tag')
+        if tag is None:
+            zapi_iter.add_new_child('tag', next_tag, True)
+        else:
+            tag.set_content(next_tag)
+
+
+class OntapWorkerPool(object):
+    ''' run tasks in worker threads, each worker with its own ZAPI connection
+        get_server returns the connection of the current worker, or default outside of the workers
+        a worker that fails to connect exits, and leaves its tasks to the connected workers
+        connection errors are only reported for each task if no worker managed to connect
+        a None task tells a worker to exit
+    '''
+
+    def __init__(self, module, max_workers, vserver=None):
+        self.module = module
+        self.max_workers = max_workers
+        self.vserver = vserver
+        self.worker_data = threading.local()
+        self.tasks = queue.Queue()
+        self.workers = list()
+        self.lock = threading.Lock()
+        self.connecting = 0
+        self.connected = 0
+        self.connections_done = threading.Event()
+
+    def get_server(self, default=None):
+        return getattr(self.worker_data, 'server', default)
+
+    def connect(self):
+        ''' connect the current worker, and wait for all the workers to try, return the error if this worker failed '''
+        connection_error = None
+        try:
+            self.worker_data.server = setup_na_ontap_zapi(module=self.module, vserver=self.vserver)
+        except Exception as exc:  # pylint: disable=broad-except
+            connection_error = exc
+        with self.lock:
+            self.connecting -= 1
+            if connection_error is None:
+                self.connected += 1
+            if self.connecting == 0:
+                self.connections_done.set()
+        if connection_error is not None:
+            self.connections_done.wait()
+        return connection_error
+
+    def worker(self, function, on_connection_error, connect):
+        connection_error = self.connect() if connect else None
+        if connection_error is not None and self.connected:
+            return
+        while True:
+            task = self.tasks.get()
+            if task is None:
+                return
+            if connection_error is not None:
+                on_connection_error(task, connection_error)
+                continue
+            function(task)
+
+    def start(self, function, on_connection_error, count, connect=True):
+        ''' start count workers, calling function for each task
+            if no worker can connect, on_connection_error(task, exc) is called for each task instead
+        '''
+        self.connecting = count
+        self.connected = 0
+        self.connections_done.clear()
+        for dummy in range(count):
+            worker = threading.Thread(target=self.worker, args=(function, on_connection_error, connect))
+            worker.daemon = True
+            worker.start()
+            self.workers.append(worker)
+
+    def put(self, task):
+        self.tasks.put(task)
+
+    def stop(self):
+        ''' wait for the queued tasks to complete, and for the workers to exit '''
+        for dummy in self.workers:
+            self.tasks.put(None)
+        for worker in self.workers:
+            worker.join()
+        self.workers = list()
+        # workers that failed to connect exited without consuming their None task
+        self.tasks = queue.Queue()
+
+    def run(self, function, tasks, on_connection_error, connect=True):
+        ''' call function for each task, with up to max_workers workers
+            tasks are run in the calling thread when there is a single worker or a single task
+            function is expected to record errors rather than raise them
+        '''
+        if self.max_workers <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                function(task)
+            return
+        self.start(function, on_connection_error, min(self.max_workers, len(tasks)), connect)
+        for task in tasks:
+            self.put(task)
+        self.stop()
+
+
+ZAPI_JOB_RUNNING_STATES = ('initial', 'queued', 'running', 'waiting')
+ZAPI_JOB_TERMINAL_STATES = ('success', 'failure')
+
+
+class OntapJobWaiter(object):
+    ''' wait for one or more ZAPI jobs to complete
+        if running as cluster admin, a job is owned by the cluster vserver rather than the target vserver
+        the connection to the job owner is created once, and reused for later jobs
+    '''
+
+    def __init__(self, module, server):
+        self.module = module
+        self.server = server
+        self.owner_server = None
+
+    @staticmethod
+    def get_job_info(job_info):
+        results = {
+            'job-progress': job_info.get_child_content('job-progress'),
+            'job-state': job_info.get_child_content('job-state'),
+            'job-completion': job_info.get_child_content('job-completion')
+        }
+        return results
+
+    def get_jobs(self, job_ids, server):
+        ''' return a dict of job details indexed by job id, using job-get for a single job or job-get-iter '''
+        if len(job_ids) == 1:
+            job_get = zapi.NaElement('job-get')
+            job_get.add_new_child('job-id', str(job_ids[0]))
+        else:
+            job_get = zapi.NaElement('job-get-iter')
+            query = zapi.NaElement('query')
+            job_info = zapi.NaElement('job-info')
+            job_info.add_new_child('job-id', '|'.join(str(job_id) for job_id in job_ids))
+            query.add_child_elem(job_info)
+            job_get.add_child_elem(query)
+        jobs = dict()
+        try:
+            if len(job_ids) == 1:
+                result = server.invoke_successfully(job_get, enable_tunneling=True)
+                attributes = result.get_child_by_name('attributes')
+                job_info = attributes.get_child_by_name('job-info') if attributes is not None else None
+                return dict() if job_info is None else {str(job_ids[0]): self.get_job_info(job_info)}
+            for job_info in get_zapi_records(server, job_get, max_records=len(job_ids)):
+                jobs[job_info.get_child_content('job-id')] = self.get_job_info(job_info)
+        except zapi.NaApiError as error:
+            if to_native(error.code) == "15661":
+                # Not found
+                return jobs
+            self.module.fail_json(msg='Error fetching job info: %s' % to_native(error),
+                                  exception=traceback.format_exc())
+        return jobs
+
+    def get_jobs_from_owner(self, job_ids):
+        server = self.owner_server or self.server
+        jobs = self.get_jobs(job_ids, server)
+        missing = [job_id for job_id in job_ids if job_id not in jobs]
+        if missing and self.owner_server is None:
+            cserver = get_cserver(self.server)
+            self.owner_server = setup_na_ontap_zapi(module=self.module, vserver=cserver)
+            jobs.update(self.get_jobs(missing, self.owner_server))
+        return jobs
+
+    def wait_for_jobs(self, job_ids, timeout, interval=1, max_interval=30):
+        ''' poll all jobs with a single call, until they complete or until timeout seconds have elapsed
+            return a dict indexed by job id, with an error message or None on success
+        '''
+        job_ids = [str(job_id) for job_id in job_ids]
+        results = dict()
+
+        def poll():
+            pending = [job_id for job_id in job_ids
+                       if job_id not in results or results[job_id]['job-state'] in ZAPI_JOB_RUNNING_STATES]
+            jobs = self.get_jobs_from_owner(pending)
+            for job_id in pending:
+                job = jobs.get(job_id)
+                if job is None:
+                    results[job_id] = {'job-state': None, 'error': 'cannot locate job with id: %d' % int(job_id)}
+                elif job['job-state'] in ZAPI_JOB_RUNNING_STATES + ZAPI_JOB_TERMINAL_STATES:
+                    results[job_id] = job
+                else:
+                    self.module.fail_json(msg='Unexpected job status in: %s' % repr(job))
+            done = all(results[job_id]['job-state'] not in ZAPI_JOB_RUNNING_STATES for job_id in job_ids)
+            return done, None
+
+        wait_for_condition(poll, timeout, interval, max_interval)
+        errors = dict()
+        for job_id in job_ids:
+            job = results[job_id]
+            if job['job-state'] == 'success':
+                errors[job_id] = None
+            elif job['job-state'] in ZAPI_JOB_RUNNING_STATES:
+                errors[job_id] = 'job completion exceeded expected timer of: %s seconds' % timeout
+            elif 'error' in job:
+                errors[job_id] = job['error']
+            elif job['job-completion'] is not None:
+                errors[job_id] = job['job-completion']
+            else:
+                errors[job_id] = job['job-progress']
+        return errors
+
+    def wait_for_job(self, job_id, timeout, interval=1, max_interval=30):
+        ''' wait for a single job, and return an error message or None on success '''
+        return self.wait_for_jobs([job_id], timeout, interval, max_interval)[str(job_id)]
+
+
 if HAS_NETAPP_LIB:
     class OntapZAPICx(zapi.NaServer):
         def __init__(self, hostname=None, server_type=zapi.NaServer.SERVER_TYPE_FILER,
@@ -333,9 +769,29 @@ if HAS_NETAPP_LIB:
                 self.module.fail_json(msg=msg)
             return zapi.urllib.request.HTTPSHandler(context=context)
 
+    class OntapZAPIHttpApi(zapi.NaServer):
+        ''' send ZAPI requests through the persistent httpapi connection '''
+        def __init__(self, hostname, httpapi):
+            super(OntapZAPIHttpApi, self).__init__(hostname)
+            self.httpapi = httpapi
+
+        def invoke_elem(self, na_element, enable_tunneling=False):
+            if not na_element or not isinstance(na_element, zapi.NaElement):
+                raise ValueError('NaElement must be supplied to invoke API')
+            dummy, request_element = self._create_request(na_element, enable_tunneling)
+            try:
+                response = self.httpapi.invoke_zapi(to_text(request_element.to_string()))
+            except ConnectionError as exc:
+                raise zapi.NaApiError('Connection error', repr(exc))
+            return self._get_result(to_bytes(response))
+
+
+JOB_TERMINAL_STATES = ('success', 'failure')
+JOB_PAUSED_STATES = ('paused',)
+
 
 class OntapRestAPI(object):
-    def __init__(self, module, timeout=60):
+    def __init__(self, module, timeout=60, pool_maxsize=10, keep_alive=True):
         self.module = module
         self.username = self.module.params['username']
         self.password = self.module.params['password']
@@ -345,6 +801,12 @@ class OntapRestAPI(object):
         self.key_filepath = self.module.params['key_filepath']
         self.verify = self.module.params['validate_certs']
         self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.session = None
+        self.request_count = 0
+        self.httpapi = get_httpapi_connection(module)
+        self.ontap_cache = get_ontap_cache(module)
         port = self.module.params['http_port']
         if port is None:
             self.url = 'https://' + self.hostname + '/api/'
@@ -352,13 +814,52 @@ class OntapRestAPI(object):
             self.url = 'https://%s:%d/api/' % (self.hostname, port)
         self.errors = list()
         self.debug_logs = list()
-        self.auth_method = set_auth_method(self.module, self.username, self.password, self.cert_filepath, self.key_filepath)
+        if self.httpapi is None:
+            self.auth_method = set_auth_method(self.module, self.username, self.password, self.cert_filepath, self.key_filepath)
+        else:
+            # authentication is handled by the persistent connection
+            self.auth_method = 'httpapi'
         self.check_required_library()
 
     def check_required_library(self):
         if not HAS_REQUESTS:
             self.module.fail_json(msg=missing_required_lib('requests'))
 
+    def get_session(self):
+        ''' create a pooled session on first use, auth and cert state are only set once '''
+        if self.session is not None:
+            return self.session
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+        session.mount('https://', adapter)
+        session.verify = self.verify
+        if self.auth_method == 'single_cert':
+            session.cert = self.cert_filepath
+        elif self.auth_method == 'cert_key':
+            session.cert = (self.cert_filepath, self.key_filepath)
+        elif self.auth_method == 'basic_auth':
+            session.auth = (self.username, self.password)
+        else:
+            raise KeyError(self.auth_method)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        self.session = session
+        return session
+
+    def get_pool_stats(self):
+        ''' report how many requests were sent, and how many connections were opened or reused '''
+        stats = dict(requests=self.request_count, new_connections=0, reused_connections=0)
+        if self.session is None:
+            return stats
+        pools = self.session.get_adapter(self.url).poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats['new_connections'] += pool.num_connections
+            stats['reused_connections'] += max(0, pool.num_requests - pool.num_connections)
+        return stats
+
     def send_request(self, method, api, params, json=None, return_status_code=False, accept=None,
                      vserver_name=None, vserver_uuid=None):
         ''' send http request and process reponse, including error conditions '''
@@ -389,18 +890,16 @@ class OntapRestAPI(object):
             error = json.get('error')
             return json, error
 
-        if self.auth_method == 'single_cert':
-            kwargs = dict(cert=self.cert_filepath)
-        elif self.auth_method == 'cert_key':
-            kwargs = dict(cert=(self.cert_filepath, self.key_filepath))
-        elif self.auth_method == 'basic_auth':
-            kwargs = dict(auth=(self.username, self.password))
-        else:
-            raise KeyError(self.auth_method)
+        if self.httpapi is not None:
+            status_code, json_dict, error_details = self.send_request_httpapi(method, api, params, json, headers)
+            if return_status_code:
+                return status_code, json_dict, error_details
+            return json_dict, error_details
 
+        session = self.get_session()
         try:
-            response = requests.request(method, url, verify=self.verify, params=params,
-                                        timeout=self.timeout, json=json, headers=headers, **kwargs)
+            self.request_count += 1
+            response = session.request(method, url, params=params, timeout=self.timeout, json=json, headers=headers)
             content = response.content  # for debug purposes
             status_code = response.status_code
             # If the response was successful, no Exception will be raised
@@ -422,6 +921,7 @@ class OntapRestAPI(object):
             self.log_error(status_code, 'Endpoint error: %d: %s' % (status_code, json_error))
             error_details = json_error
         self.log_debug(status_code, content)
+        self.log_debug('pool', self.get_pool_stats())
         if not json_dict and method == 'OPTIONS':
             # OPTIONS provides the list of supported verbs
             json_dict['Allow'] = response.headers['Allow']
@@ -429,13 +929,30 @@ class OntapRestAPI(object):
             return status_code, json_dict, error_details
         return json_dict, error_details
 
-    def wait_on_job(self, job, timeout=600, increment=60):
+    def send_request_httpapi(self, method, api, params, json, headers):
+        ''' send the request through the persistent httpapi connection '''
+        json_dict = None
+        error_details = None
         try:
-            url = job['_links']['self']['href'].split('api/')[1]
-        except Exception as err:
-            self.log_error(0, 'URL Incorrect format: %s\n Job: %s' % (err, job))
-        # Expecting job to be in the following format
-        """
+            status_code, json_dict = self.httpapi.send_request(json, method=method, path=api, params=params, headers=headers)
+        except ConnectionError as err:
+            self.log_error(None, 'Connection error: %s' % err)
+            return None, None, str(err)
+        json_error = json_dict.get('error') if isinstance(json_dict, dict) else None
+        if json_error is not None:
+            self.log_error(status_code, 'Endpoint error: %d: %s' % (status_code, json_error))
+            error_details = json_error
+        elif status_code >= 400:
+            error_details = 'HTTP error: %d' % status_code
+            self.log_error(status_code, error_details)
+        self.log_debug(status_code, json_dict)
+        if error_details is not None:
+            json_dict = None
+        return status_code, json_dict, error_details
+
+    def wait_on_job(self, job, timeout=600, increment=60):
+        ''' wait for a job to complete, and return its message and an error if any
+            job is expected to be in the following format, with or without the outer job key
         {'job':
             {'uuid': 'fde79888-692a-11ea-80c2-005056b39fe7',
             '_links':
@@ -444,47 +961,89 @@ class OntapRestAPI(object):
                 }
             }
         }
+        '''
+        job_json, error = self.wait_on_jobs([job], timeout, increment)[0]
+        message = job_json.get('message') if job_json else None
+        return message, error
+
+    @staticmethod
+    def get_job_uuid(job):
+        ''' return the job uuid, from the uuid key or from the self link '''
+        if 'job' in job:
+            job = job['job']
+        if job.get('uuid'):
+            return job['uuid']
+        return job['_links']['self']['href'].split('api/cluster/jobs/')[1]
+
+    def wait_on_jobs(self, jobs, timeout=600, increment=60, interval=0.5):
+        ''' poll jobs until they reach a terminal state or are paused, or until timeout seconds have elapsed
+            polling starts after interval seconds, the interval is doubled after each poll, up to increment seconds
+            several jobs are polled together with a single cluster/jobs query
+            return a list of (job_json, error) in the same order as jobs
+        '''
+        # a job looks like this
         """
-        keep_running = True
-        error = None
-        message = None
-        runtime = 0
-        while keep_running:
-            # Will run every every <increment> seconds for <timeout> seconds
-            job_json, job_error = self.get(url, None)
-            if job_error:
-                error = job_error
-                break
-            # a job looks like this
-            """
-            {
-              "uuid": "cca3d070-58c6-11ea-8c0c-005056826c14",
-              "description": "POST /api/cluster/metrocluster",
-              "state": "failure",
-              "message": "There are not enough disks in Pool1.",
-              "code": 2432836,
-              "start_time": "2020-02-26T10:35:44-08:00",
-              "end_time": "2020-02-26T10:47:38-08:00",
-              "_links": {
-                "self": {
-                  "href": "/api/cluster/jobs/cca3d070-58c6-11ea-8c0c-005056826c14"
-                }
-              }
+        {
+          "uuid": "cca3d070-58c6-11ea-8c0c-005056826c14",
+          "description": "POST /api/cluster/metrocluster",
+          "state": "failure",
+          "message": "There are not enough disks in Pool1.",
+          "code": 2432836,
+          "start_time": "2020-02-26T10:35:44-08:00",
+          "end_time": "2020-02-26T10:47:38-08:00",
+          "_links": {
+            "self": {
+              "href": "/api/cluster/jobs/cca3d070-58c6-11ea-8c0c-005056826c14"
             }
-            """
-            if job_json['state'] != 'running':
-                keep_running = False
-            else:
-                # Would like to post a message to user (not sure how)
-                pass
-            message = job_json['message']
-            runtime += increment
-            if runtime >= timeout:
-                keep_running = False
-                if job_json['state'] != 'success':
+          }
+        }
+        """
+        results = dict()
+        pending = list()
+        uuids = list()
+        for job in jobs:
+            try:
+                uuid = self.get_job_uuid(job)
+            except (KeyError, IndexError, AttributeError, TypeError) as err:
+                self.log_error(0, 'URL Incorrect format: %s\n Job: %s' % (err, job))
+                uuid = None
+                results[uuid] = (None, 'URL Incorrect format: %s' % err)
+            uuids.append(uuid)
+            if uuid is not None and uuid not in pending:
+                pending.append(uuid)
+
+        deadline = time.time() + timeout
+        while pending:
+            time.sleep(max(0, min(interval, deadline - time.time())))
+            for uuid, job_json, error in self.get_jobs(pending):
+                if error is not None or job_json.get('state') in JOB_TERMINAL_STATES:
+                    results[uuid] = (job_json, error)
+                    pending.remove(uuid)
+                elif job_json.get('state') in JOB_PAUSED_STATES:
+                    # a paused job does not progress on its own, report its message rather than waiting for the timeout
+                    results[uuid] = (job_json, job_json.get('message') or 'Job paused')
+                    pending.remove(uuid)
+                else:
+                    results[uuid] = (job_json, None)
+            if pending and time.time() >= deadline:
+                for uuid in pending:
                     self.log_error(0, 'Timeout error: Process still running')
-            time.sleep(increment)
-        return message, error
+                    results[uuid] = (results[uuid][0], 'Timeout error: Process still running after %s seconds' % timeout)
+                break
+            interval = min(interval * 2, increment)
+        return [results[uuid] for uuid in uuids]
+
+    def get_jobs(self, uuids):
+        ''' return a list of (uuid, job_json, error), using a single call '''
+        if len(uuids) == 1:
+            job_json, error = self.get('cluster/jobs/%s' % uuids[0], None)
+            return [(uuids[0], job_json, error)]
+        params = dict(uuid='|'.join(uuids), fields='uuid,state,message,code')
+        response, error = self.get('cluster/jobs', params)
+        if error is not None:
+            return [(uuid, None, error) for uuid in uuids]
+        records = dict((record['uuid'], record) for record in response.get('records', []))
+        return [(uuid, records.get(uuid), None if uuid in records else 'Job not found') for uuid in uuids]
 
     def get(self, api, params):
         method = 'GET'
@@ -517,13 +1076,21 @@ class OntapRestAPI(object):
         if self.use_rest == 'Never' or used_unsupported_rest_properties:
             # force ZAPI if requested or if some parameter requires it
             return False, None
+        return get_cached_value(self, 'is_rest', self.probe_rest) or False, None
+
+    def probe_rest(self):
+        ''' return True if REST is available, False if not
+            return None if the answer should not be cached (eg connection, authentication or server error)
+        '''
         method = 'HEAD'
         api = 'svm/svms'
         status_code, dummy, error = self.send_request(method, api, params=None, return_status_code=True)
         if status_code == 200:
-            return True, None
+            return True
         self.log_error(status_code, str(error))
-        return False, None
+        if status_code is None or status_code in (401, 403) or status_code >= 500:
+            return None
+        return False
 
     def is_rest(self, used_unsupported_rest_properties=None):
         ''' only return error if there is a reason to '''
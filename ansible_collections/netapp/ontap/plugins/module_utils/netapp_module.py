@@ -31,8 +31,9 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+from collections import Counter
+
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
-from copy import deepcopy
 
 
 def cmp(a, b):
@@ -57,6 +58,47 @@ def cmp(a, b):
     return (a > b) - (a < b)
 
 
+def hashable_key(item):
+    '''
+    return a hashable representation of item, so that lists can be compared using a Counter
+    dicts, lists and sets are converted recursively, anything else that is not hashable uses its repr
+    '''
+    if isinstance(item, dict):
+        return (dict, tuple(sorted(((hashable_key(key), hashable_key(value)) for key, value in item.items()), key=repr)))
+    if isinstance(item, (list, tuple)):
+        return (list, tuple(hashable_key(x) for x in item))
+    if isinstance(item, (set, frozenset)):
+        return (set, frozenset(hashable_key(x) for x in item))
+    try:
+        hash(item)
+    except TypeError:
+        return (repr, repr(item))
+    return item
+
+
+def list_item_key(item):
+    ''' key used to compare list elements, strings are compared without case as in cmp '''
+    if isinstance(item, str):
+        return item.lower()
+    return hashable_key(item)
+
+
+def list_diff(from_list, to_list):
+    '''
+    return the elements in from_list that are not matched by an element in to_list
+    duplicates are matched one for one, and the order of from_list is preserved
+    '''
+    remaining = Counter(list_item_key(item) for item in to_list)
+    diff = list()
+    for item in from_list:
+        key = list_item_key(item)
+        if remaining[key] > 0:
+            remaining[key] -= 1
+        else:
+            diff.append(item)
+    return diff
+
+
 class NetAppModule(object):
     '''
     Common class for NetApp modules
@@ -210,24 +252,10 @@ class NetAppModule(object):
             :return: list of attributes to be modified
             :rtype: list
         '''
-        current_copy = deepcopy(current)
-        desired_copy = deepcopy(desired)
-
         # get what in desired and not in current
-        desired_diff_list = list()
-        for item in desired:
-            if item in current_copy:
-                current_copy.remove(item)
-            else:
-                desired_diff_list.append(item)
-
+        desired_diff_list = list_diff(desired, current)
         # get what in current but not in desired
-        current_diff_list = list()
-        for item in current:
-            if item in desired_copy:
-                desired_copy.remove(item)
-            else:
-                current_diff_list.append(item)
+        current_diff_list = list_diff(current, desired)
 
         if desired_diff_list or current_diff_list:
             # there are changes
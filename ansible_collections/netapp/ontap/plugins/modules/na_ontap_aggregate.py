@@ -220,7 +220,6 @@ EXAMPLES = """
 RETURN = """
 
 """
-import time
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule
@@ -273,7 +272,6 @@ class NetAppOntapAggregate(object):
         )
 
         self.na_helper = NetAppModule()
-        self.using_vserver_msg = None   # This module should be run as cluster admin
         self.parameters = self.na_helper.set_parameters(self.module.params)
         if self.parameters.get('mirror_disks') is not None and self.parameters.get('disks') is None:
             self.module.fail_json(mgs="mirror_disks require disks options to be set")
@@ -304,8 +302,9 @@ class NetAppOntapAggregate(object):
                 pass
             else:
                 msg = to_native(error)
-                if self.using_vserver_msg is not None:
-                    msg += '.  Added info: %s.' % self.using_vserver_msg
+                using_vserver_msg = self.get_using_vserver_msg()
+                if using_vserver_msg is not None:
+                    msg += '.  Added info: %s.' % using_vserver_msg
                 self.module.fail_json(msg=msg, exception=traceback.format_exc())
         return result
 
@@ -446,15 +445,11 @@ class NetAppOntapAggregate(object):
         try:
             self.server.invoke_successfully(aggr_create, enable_tunneling=False)
             if self.parameters.get('wait_for_online'):
-                # round off time_out
-                retries = (self.parameters['time_out'] + 5) / 10
-                current = self.get_aggr()
-                status = None if current is None else current['service_state']
-                while status != 'online' and retries > 0:
-                    time.sleep(10)
-                    retries = retries - 1
+                def poll():
                     current = self.get_aggr()
-                    status = None if current is None else current['service_state']
+                    return current is not None and current['service_state'] == 'online', None
+
+                netapp_utils.wait_for_condition(poll, self.parameters['time_out'], max_interval=10)
         except netapp_utils.zapi.NaApiError as error:
             self.module.fail_json(msg="Error provisioning aggregate %s: %s"
                                       % (self.parameters['name'], to_native(error)),
@@ -536,21 +531,24 @@ class NetAppOntapAggregate(object):
                                   (self.parameters['name'], to_native(error)),
                                   exception=traceback.format_exc())
 
+    def get_using_vserver_msg(self):
+        """
+        Only called on error, so the admin vserver is not looked up on the success path
+        :return: an additional error message if not running as cluster admin, None otherwise
+        """
+        try:
+            cserver = netapp_utils.get_cserver(self.server)
+        except netapp_utils.zapi.NaApiError:
+            cserver = None
+        return netapp_utils.ERROR_MSG['no_cserver'] if cserver is None else None
+
     def asup_log_for_cserver(self, event_name):
         """
-        Fetch admin vserver for the given cluster
-        Create and Autosupport log event with the given module name
+        Create and Autosupport log event with the given module name on the admin vserver
         :param event_name: Name of the event log
         :return: None
         """
-        cserver = netapp_utils.get_cserver(self.server)
-        if cserver is None:
-            server = self.server
-            self.using_vserver_msg = netapp_utils.ERROR_MSG['no_cserver']
-            event_name += ':error_no_cserver'
-        else:
-            server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=cserver)
-        netapp_utils.ems_log_event(event_name, server)
+        netapp_utils.ems_log_event_cserver(event_name, self.server, self.module)
 
     def apply(self):
         """
@@ -247,9 +247,7 @@ class NetAppONTAPasup(object):
             self.module.fail_json(msg='%s' % to_native(error), exception=traceback.format_exc())
 
     def autosupport_log(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_autosupport", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_autosupport", self.server, self.module)
 
     def apply(self):
         """
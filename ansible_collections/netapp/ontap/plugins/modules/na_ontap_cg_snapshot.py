@@ -60,8 +60,16 @@ EXAMPLES = """
 """
 
 RETURN = """
+timing:
+    description:
+    - Elapsed time in seconds for the snapshot existence check, and for cg-start and cg-commit when they are issued.
+    - The existence check uses a single query for all volumes, before the volumes are fenced by cg-start.
+    returned: always
+    type: dict
+    sample: {"snapshot_check": 0.052, "cg_start": 1.204, "cg_commit": 0.311}
 """
 
+import time
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule
@@ -103,6 +111,7 @@ class NetAppONTAPCGSnapshot(object):
         self.timeout = parameters['timeout']
         self.snapmirror_label = parameters['snapmirror_label']
         self.cgid = None
+        self.timing = dict()
 
         if HAS_NETAPP_LIB is False:
             self.module.fail_json(
@@ -111,39 +120,27 @@ class NetAppONTAPCGSnapshot(object):
             self.server = netapp_utils.setup_na_ontap_zapi(
                 module=self.module, vserver=self.vserver)
 
-    def does_snapshot_exist(self, volume):
+    def get_volumes_with_snapshot(self):
         """
-        This is duplicated from na_ontap_snapshot
-        Checks to see if a snapshot exists or not
-        :return: Return True if a snapshot exists, false if it dosn't
+        Checks which volumes already have the snapshot, using a single snapshot-get-iter query for all volumes
+        :return: set of volume names
         """
-        # TODO: Remove this method and import snapshot module and
-        # call get after re-factoring __init__ across all the modules
-        # we aren't importing now, since __init__ does a lot of Ansible setup
         snapshot_obj = netapp_utils.zapi.NaElement("snapshot-get-iter")
-        desired_attr = netapp_utils.zapi.NaElement("desired-attributes")
-        snapshot_info = netapp_utils.zapi.NaElement('snapshot-info')
-        comment = netapp_utils.zapi.NaElement('comment')
-        # add more desired attributes that are allowed to be modified
-        snapshot_info.add_child_elem(comment)
-        desired_attr.add_child_elem(snapshot_info)
-        snapshot_obj.add_child_elem(desired_attr)
-        # compose query
-        query = netapp_utils.zapi.NaElement("query")
-        snapshot_info_obj = netapp_utils.zapi.NaElement("snapshot-info")
-        snapshot_info_obj.add_new_child("name", self.snapshot)
-        snapshot_info_obj.add_new_child("volume", volume)
-        snapshot_info_obj.add_new_child("vserver", self.vserver)
-        query.add_child_elem(snapshot_info_obj)
-        snapshot_obj.add_child_elem(query)
-        result = self.server.invoke_successfully(snapshot_obj, True)
-        return_value = None
-        if result.get_child_by_name('num-records') and \
-                int(result.get_child_content('num-records')) == 1:
-            attributes_list = result.get_child_by_name('attributes-list')
-            snap_info = attributes_list.get_child_by_name('snapshot-info')
-            return_value = {'comment': snap_info.get_child_content('comment')}
-        return return_value
+        snapshot_obj.translate_struct({
+            'desired-attributes': {'snapshot-info': {'volume': None}},
+            'query': {'snapshot-info': {'name': self.snapshot,
+                                        'volume': '|'.join(self.volumes),
+                                        'vserver': self.vserver}}
+        })
+        volumes = set()
+        try:
+            for snap_info in netapp_utils.get_zapi_records(self.server, snapshot_obj, max_records=len(self.volumes)):
+                volumes.add(snap_info.get_child_content('volume'))
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg="Error fetching snapshot %s: %s" %
+                                  (self.snapshot, to_native(error)),
+                                  exception=traceback.format_exc())
+        return volumes
 
     def cgcreate(self):
         """
@@ -168,15 +165,18 @@ class NetAppONTAPCGSnapshot(object):
         cgstart.add_new_child("timeout", self.timeout)
         volume_list = netapp_utils.zapi.NaElement("volumes")
         cgstart.add_child_elem(volume_list)
+        start_time = time.time()
+        existing = self.get_volumes_with_snapshot()
+        self.timing['snapshot_check'] = round(time.time() - start_time, 3)
         for vol in self.volumes:
-            snapshot_exists = self.does_snapshot_exist(vol)
-            if snapshot_exists is None:
+            if vol not in existing:
                 snapshot_started = True
                 volume_list.add_new_child("volume-name", vol)
         if snapshot_started:
             if self.snapmirror_label:
                 cgstart.add_new_child("snapmirror-label",
                                       self.snapmirror_label)
+            start_time = time.time()
             try:
                 cgresult = self.server.invoke_successfully(
                     cgstart, enable_tunneling=True)
@@ -186,6 +186,7 @@ class NetAppONTAPCGSnapshot(object):
                 self.module.fail_json(msg="Error creating CG snapshot %s: %s" %
                                       (self.snapshot, to_native(error)),
                                       exception=traceback.format_exc())
+            self.timing['cg_start'] = round(time.time() - start_time, 3)
         return snapshot_started
 
     def cg_commit(self):
@@ -194,6 +195,7 @@ class NetAppONTAPCGSnapshot(object):
         """
         cgcommit = netapp_utils.zapi.NaElement.create_node_with_children(
             'cg-commit', **{'cg-id': self.cgid})
+        start_time = time.time()
         try:
             self.server.invoke_successfully(cgcommit,
                                             enable_tunneling=True)
@@ -201,13 +203,14 @@ class NetAppONTAPCGSnapshot(object):
             self.module.fail_json(msg="Error committing CG snapshot %s: %s" %
                                   (self.snapshot, to_native(error)),
                                   exception=traceback.format_exc())
+        self.timing['cg_commit'] = round(time.time() - start_time, 3)
 
     def apply(self):
         '''Applies action from playbook'''
         netapp_utils.ems_log_event("na_ontap_cg_snapshot", self.server)
         if not self.module.check_mode:
             changed = self.cgcreate()
-        self.module.exit_json(changed=changed)
+        self.module.exit_json(changed=changed, timing=self.timing)
 
 
 def main():
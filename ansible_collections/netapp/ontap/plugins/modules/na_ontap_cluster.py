@@ -277,9 +277,7 @@ class NetAppONTAPCluster(object):
         Autosupport log for cluster
         :return:
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_cluster", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_cluster", self.server, self.module)
 
     def apply(self):
         """
@@ -108,9 +108,7 @@ class NetAppOntapClusterHA(object):
         """
         Apply action to cluster HA
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_cluster_ha", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_cluster_ha", self.server, self.module)
         current = self.get_cluster_ha_enabled()
         cd_action = self.na_helper.get_cd_action(current, self.parameters)
         if not self.module.check_mode:
@@ -0,0 +1,450 @@
+#!/usr/bin/python
+
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'certified'}
+
+
+DOCUMENTATION = '''
+
+module: na_ontap_export_policy_rules
+
+short_description: NetApp ONTAP manage all the rules of an export policy in a single task.
+extends_documentation_fragment:
+    - netapp.ontap.netapp.na_ontap
+version_added: '20.7.0'
+author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
+
+description:
+- Converge the rules of an export policy to an ordered list of rules.
+- All the rules of the policy are fetched with a single paginated export-rule-get-iter query.
+- Rules are matched by client_match, and the create, modify, delete, and reorder actions are computed locally.
+- Rules that are not listed are deleted, and the rule index of each rule is its position in the list.
+- New rules are created first, and the rules that are not listed are deleted last, so that no client loses access while the rules are reordered.
+- The rule indexes are read again after each move, as ONTAP renumbers the other rules of the policy.
+- Use na_ontap_export_policy_rule to manage a single rule.
+
+options:
+  name:
+    description:
+    - The name of the export policy.
+    - The policy is created if it does not exist.
+    required: true
+    type: str
+    aliases:
+    - policy_name
+
+  vserver:
+    description:
+    - Name of the vserver to use.
+    required: true
+    type: str
+
+  rules:
+    description:
+    - The complete list of rules for the policy, in rule index order.
+    - An empty list deletes all the rules.
+    required: true
+    type: list
+    elements: dict
+    suboptions:
+      client_match:
+        description:
+        - List of Client Match host names, IP Addresses, Netgroups, or Domains.
+        - Used as a key to match the current rules, it must be unique in the list.
+        required: true
+        type: list
+        elements: str
+      ro_rule:
+        description:
+        - List of Read only access specifications for the rule.
+        - Required to create a rule.
+        type: list
+        elements: str
+        choices: ['any', 'none', 'never', 'krb5', 'krb5i', 'krb5p', 'ntlm', 'sys']
+      rw_rule:
+        description:
+        - List of Read Write access specifications for the rule.
+        - Required to create a rule.
+        type: list
+        elements: str
+        choices: ['any', 'none', 'never', 'krb5', 'krb5i', 'krb5p', 'ntlm', 'sys']
+      super_user_security:
+        description:
+        - List of Super User access specifications for the rule.
+        type: list
+        elements: str
+        choices: ['any', 'none', 'never', 'krb5', 'krb5i', 'krb5p', 'ntlm', 'sys']
+      allow_suid:
+        description:
+        - If 'true', NFS server will honor SetUID bits in SETATTR operation. Default value on creation is 'true'.
+        type: bool
+      protocol:
+        description:
+        - List of Client access protocols.
+        - Default value is set to 'any' during create.
+        type: list
+        elements: str
+        choices: ['any', 'nfs', 'nfs3', 'nfs4', 'cifs', 'flexcache']
+      anonymous_user_id:
+        description:
+        - User name or ID to which anonymous users are mapped. Default value is '65534'.
+        type: int
+
+  max_records:
+    description:
+    - Maximum number of records returned by each call to export-rule-get-iter.
+    type: int
+    default: 500
+'''
+
+EXAMPLES = """
+    - name: Converge the rules of an export policy
+      na_ontap_export_policy_rules:
+        name: default123
+        vserver: ci_dev
+        rules:
+          - client_match: 10.10.0.0/16
+            ro_rule: sys
+            rw_rule: sys
+            super_user_security: sys
+          - client_match: 0.0.0.0/0
+            ro_rule: sys
+            rw_rule: never
+            protocol: nfs3,nfs4
+        hostname: "{{ netapp_hostname }}"
+        username: "{{ netapp_username }}"
+        password: "{{ netapp_password }}"
+
+    - name: Delete all the rules of an export policy
+      na_ontap_export_policy_rules:
+        name: default123
+        vserver: ci_dev
+        rules: []
+        hostname: "{{ netapp_hostname }}"
+        username: "{{ netapp_username }}"
+        password: "{{ netapp_password }}"
+"""
+
+RETURN = """
+actions:
+    description:
+    - Actions taken, in the order they were applied.
+    - rule_index is the index of the rule when the action was applied.
+    - In check mode, setindex and delete actions are reported with the current indexes, the actual moves depend on how ONTAP renumbers the rules.
+    returned: always
+    type: list
+    sample: [{"action": "create", "rule_index": 4, "client_match": "10.10.0.0/16"},
+             {"action": "modify", "rule_index": 2, "client_match": "0.0.0.0/0", "modify": {"rw_rule": ["never"]}},
+             {"action": "setindex", "rule_index": 4, "new_rule_index": 1, "client_match": "10.10.0.0/16"},
+             {"action": "delete", "rule_index": 4, "client_match": "10.20.0.0/16"}]
+"""
+
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+
+HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
+
+SECURITY_FLAVORS = ['any', 'none', 'never', 'krb5', 'krb5i', 'krb5p', 'ntlm', 'sys']
+
+
+class NetAppOntapExportRules(object):
+    '''Class with bulk export rule operations'''
+
+    def __init__(self):
+        '''Initialize module parameters'''
+        self.argument_spec = netapp_utils.na_ontap_host_argument_spec()
+        self.argument_spec.update(dict(
+            name=dict(required=True, type='str', aliases=['policy_name']),
+            vserver=dict(required=True, type='str'),
+            rules=dict(required=True, type='list', elements='dict', options=dict(
+                client_match=dict(required=True, type='list', elements='str'),
+                ro_rule=dict(type='list', elements='str', choices=SECURITY_FLAVORS),
+                rw_rule=dict(type='list', elements='str', choices=SECURITY_FLAVORS),
+                super_user_security=dict(type='list', elements='str', choices=SECURITY_FLAVORS),
+                allow_suid=dict(type='bool'),
+                protocol=dict(type='list', elements='str', choices=['any', 'nfs', 'nfs3', 'nfs4', 'cifs', 'flexcache']),
+                anonymous_user_id=dict(type='int'),
+            )),
+            max_records=dict(required=False, type='int', default=500),
+        ))
+        self.module = AnsibleModule(
+            argument_spec=self.argument_spec,
+            supports_check_mode=True
+        )
+        self.na_helper = NetAppModule()
+        self.parameters = self.na_helper.set_parameters(self.module.params)
+        self.set_playbook_zapi_key_map()
+        self.rules = self.get_desired_rules()
+        self.actions = list()
+
+        if HAS_NETAPP_LIB is False:
+            self.module.fail_json(msg="the python NetApp-Lib module is required")
+        else:
+            self.server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=self.parameters['vserver'])
+
+    def set_playbook_zapi_key_map(self):
+        self.na_helper.zapi_string_keys = {
+            'client_match': 'client-match'
+        }
+        self.na_helper.zapi_list_keys = {
+            'protocol': ('protocol', 'access-protocol'),
+            'ro_rule': ('ro-rule', 'security-flavor'),
+            'rw_rule': ('rw-rule', 'security-flavor'),
+            'super_user_security': ('super-user-security', 'security-flavor'),
+        }
+        self.na_helper.zapi_bool_keys = {
+            'allow_suid': 'is-allow-set-uid-enabled'
+        }
+        self.na_helper.zapi_int_keys = {
+            'rule_index': 'rule-index',
+            'anonymous_user_id': 'anonymous-user-id'
+        }
+
+    @staticmethod
+    def get_client_match_key(client_match):
+        '''client_match is compared without spaces or case'''
+        return client_match.replace(' ', '').lower()
+
+    def get_desired_rules(self):
+        '''Remove unset options, convert client_match to a string, and check for duplicates'''
+        rules = list()
+        keys = set()
+        for rule in self.parameters['rules']:
+            desired = dict((key, value) for key, value in rule.items() if value is not None)
+            desired['client_match'] = ','.join(desired['client_match']).replace(' ', '')
+            key = self.get_client_match_key(desired['client_match'])
+            if key in keys:
+                self.module.fail_json(msg='Error: client_match %s is listed more than once' % desired['client_match'])
+            keys.add(key)
+            rules.append(desired)
+        return rules
+
+    def get_rule_details(self, rule_info):
+        '''Convert export-rule-info to a dict of options'''
+        details = dict()
+        for item_key, zapi_key in self.na_helper.zapi_string_keys.items():
+            details[item_key] = rule_info.get_child_content(zapi_key)
+        for item_key, zapi_key in self.na_helper.zapi_bool_keys.items():
+            details[item_key] = self.na_helper.get_value_for_bool(from_zapi=True, value=rule_info.get_child_content(zapi_key))
+        for item_key, zapi_key in self.na_helper.zapi_int_keys.items():
+            details[item_key] = self.na_helper.get_value_for_int(from_zapi=True, value=rule_info.get_child_content(zapi_key))
+        for item_key, zapi_key in self.na_helper.zapi_list_keys.items():
+            parent, dummy = zapi_key
+            details[item_key] = self.na_helper.get_value_for_list(from_zapi=True, zapi_parent=rule_info.get_child_by_name(parent))
+        return details
+
+    def get_export_rules(self):
+        '''
+        Return all the rules of the policy, using a single paginated export-rule-get-iter query
+        :return: list of rule details, in rule index order
+        '''
+        rule_iter = netapp_utils.zapi.NaElement('export-rule-get-iter')
+        query = netapp_utils.zapi.NaElement('query')
+        query.add_node_with_children('export-rule-info', **{'policy-name': self.parameters['name'],
+                                                            'vserver-name': self.parameters['vserver']})
+        rule_iter.add_child_elem(query)
+
+        rules = list()
+        try:
+            for rule_info in netapp_utils.get_zapi_records(self.server, rule_iter, self.parameters['max_records']):
+                rules.append(self.get_rule_details(rule_info))
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error getting export policy rules %s: %s' % (self.parameters['name'], to_native(error)),
+                                  exception=traceback.format_exc())
+        return sorted(rules, key=lambda rule: rule['rule_index'])
+
+    def get_export_policy(self):
+        '''Return True if the export policy exists'''
+        export_policy_iter = netapp_utils.zapi.NaElement('export-policy-get-iter')
+        export_policy_iter.translate_struct({
+            'query': {
+                'export-policy-info': {
+                    'policy-name': self.parameters['name'],
+                    'vserver': self.parameters['vserver']
+                }
+            }
+        })
+        try:
+            result = self.server.invoke_successfully(export_policy_iter, True)
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error getting export policy %s: %s' % (self.parameters['name'], to_native(error)),
+                                  exception=traceback.format_exc())
+        return result.get_child_by_name('num-records') is not None and int(result.get_child_content('num-records')) >= 1
+
+    def get_plan(self, current_rules):
+        '''
+        Match the desired rules with the current rules, and compute the actions
+        New rules are created after the current rules, in free indexes
+        The setindex and delete actions use the current indexes, they are computed again when applied
+        :return: list of actions
+        '''
+        current_by_key = dict()
+        for current in current_rules:
+            # if several rules have the same client_match, the first one is kept, and the others are deleted
+            current_by_key.setdefault(self.get_client_match_key(current['client_match']), current)
+        deletes, modifies, creates, moves = list(), list(), list(), list()
+        matched = list()
+        for desired in self.rules:
+            current = current_by_key.pop(self.get_client_match_key(desired['client_match']), None)
+            matched.append(current)
+            if current is not None:
+                modify = self.na_helper.get_modified_attributes(current, dict((key, value) for key, value in desired.items()
+                                                                              if key != 'client_match'))
+                if modify:
+                    modifies.append(dict(action='modify', rule_index=current['rule_index'],
+                                         client_match=current['client_match'], modify=modify))
+        kept = set(id(current) for current in matched if current is not None)
+        for current in current_rules:
+            if id(current) not in kept:
+                deletes.append(dict(action='delete', rule_index=current['rule_index'], client_match=current['client_match']))
+
+        next_index = max([current['rule_index'] for current in current_rules] or [0]) + 1
+        for position, desired in enumerate(self.rules):
+            rule_index = None if matched[position] is None else matched[position]['rule_index']
+            if rule_index is None:
+                if 'ro_rule' not in desired or 'rw_rule' not in desired:
+                    self.module.fail_json(msg='Error: ro_rule and rw_rule are required to create export policy rule %s'
+                                          % desired['client_match'])
+                creates.append(dict(action='create', rule_index=next_index, client_match=desired['client_match'],
+                                    desired=desired))
+                rule_index = next_index
+                next_index += 1
+            if rule_index != position + 1:
+                moves.append(dict(action='setindex', rule_index=rule_index, new_rule_index=position + 1,
+                                  client_match=desired['client_match']))
+        return creates + modifies + moves + deletes
+
+    def add_parameters(self, na_element_object, values):
+        '''Add children nodes for create or modify NaElement object'''
+        for key, value in values.items():
+            if key in self.na_helper.zapi_string_keys:
+                na_element_object[self.na_helper.zapi_string_keys[key]] = value
+            elif key in self.na_helper.zapi_list_keys:
+                parent_key, child_key = self.na_helper.zapi_list_keys[key]
+                na_element_object.add_child_elem(self.na_helper.get_value_for_list(from_zapi=False, zapi_parent=parent_key,
+                                                                                   zapi_child=child_key, data=value))
+            elif key in self.na_helper.zapi_int_keys:
+                na_element_object[self.na_helper.zapi_int_keys[key]] = self.na_helper.get_value_for_int(from_zapi=False, value=value)
+            elif key in self.na_helper.zapi_bool_keys:
+                na_element_object[self.na_helper.zapi_bool_keys[key]] = self.na_helper.get_value_for_bool(from_zapi=False, value=value)
+
+    def create_export_policy(self):
+        '''Create the export policy'''
+        export_policy_create = netapp_utils.zapi.NaElement.create_node_with_children(
+            'export-policy-create', **{'policy-name': self.parameters['name']})
+        try:
+            self.server.invoke_successfully(export_policy_create, enable_tunneling=True)
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error creating export-policy %s: %s' % (self.parameters['name'], to_native(error)),
+                                  exception=traceback.format_exc())
+
+    def apply_action(self, action):
+        '''Run a delete, modify, create, or setindex action'''
+        options = {'policy-name': self.parameters['name'], 'rule-index': str(action['rule_index'])}
+        if action['action'] == 'delete':
+            zapi = netapp_utils.zapi.NaElement.create_node_with_children('export-rule-destroy', **options)
+        elif action['action'] == 'modify':
+            zapi = netapp_utils.zapi.NaElement.create_node_with_children('export-rule-modify', **options)
+            self.add_parameters(zapi, action['modify'])
+        elif action['action'] == 'create':
+            zapi = netapp_utils.zapi.NaElement.create_node_with_children('export-rule-create', **options)
+            self.add_parameters(zapi, action['desired'])
+        else:
+            options['new-rule-index'] = str(action['new_rule_index'])
+            zapi = netapp_utils.zapi.NaElement.create_node_with_children('export-rule-setindex', **options)
+        try:
+            self.server.invoke_successfully(zapi, enable_tunneling=True)
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error applying %s for export policy rule %s in policy %s: %s'
+                                  % (action['action'], action['client_match'], self.parameters['name'], to_native(error)),
+                                  exception=traceback.format_exc(), actions=self.get_reported_actions())
+
+    def get_reported_actions(self):
+        return [dict((key, value) for key, value in action.items() if key != 'desired') for action in self.actions]
+
+    def find_rule(self, current_rules, desired, position):
+        '''Return the first rule matching desired, ignoring the rules already in place before position'''
+        key = self.get_client_match_key(desired['client_match'])
+        for rule in current_rules:
+            if rule['rule_index'] > position and self.get_client_match_key(rule['client_match']) == key:
+                return rule
+        self.module.fail_json(msg='Error: export policy rule %s not found in policy %s' % (desired['client_match'], self.parameters['name']),
+                              actions=self.get_reported_actions())
+
+    def check_order(self, current_rules, count):
+        '''Report an error if the first count rules are not the first count desired rules, in order'''
+        current = [self.get_client_match_key(rule['client_match']) for rule in current_rules if rule['rule_index'] <= count]
+        desired = [self.get_client_match_key(rule['client_match']) for rule in self.rules[:count]]
+        if current != desired:
+            self.module.fail_json(msg='Error: the rules of export policy %s are not in the expected order after reordering: %s'
+                                  % (self.parameters['name'], ', '.join(current)), actions=self.get_reported_actions())
+
+    def reorder_rules(self):
+        '''
+        Move each desired rule to its position, in order
+        The indexes are read again after each move, rather than predicting how ONTAP renumbers the other rules
+        :return: the current rules after the last move
+        '''
+        current_rules = self.get_export_rules()
+        for position, desired in enumerate(self.rules):
+            rule = self.find_rule(current_rules, desired, position)
+            if rule['rule_index'] == position + 1:
+                continue
+            action = dict(action='setindex', rule_index=rule['rule_index'], new_rule_index=position + 1,
+                          client_match=rule['client_match'])
+            self.actions.append(action)
+            self.apply_action(action)
+            current_rules = self.get_export_rules()
+            self.check_order(current_rules, position + 1)
+        return current_rules
+
+    def delete_rules(self, current_rules):
+        '''Delete the rules after the desired rules, starting with the last one so the other indexes are not affected'''
+        for rule in reversed(current_rules):
+            if rule['rule_index'] > len(self.rules):
+                action = dict(action='delete', rule_index=rule['rule_index'], client_match=rule['client_match'])
+                self.actions.append(action)
+                self.apply_action(action)
+
+    def apply(self):
+        '''Compute and apply the actions for all the rules of the policy'''
+        netapp_utils.ems_log_event("na_ontap_export_policy_rules", self.server)
+        current_rules = self.get_export_rules()
+        policy_exists = bool(current_rules) or self.get_export_policy()
+        plan = self.get_plan(current_rules)
+        changed = bool(plan) or not policy_exists
+        if changed and not self.module.check_mode:
+            if not policy_exists:
+                self.create_export_policy()
+            # creates and modifies do not change the rule indexes
+            for action in plan:
+                if action['action'] in ('create', 'modify'):
+                    self.actions.append(action)
+                    self.apply_action(action)
+            if any(action['action'] in ('setindex', 'delete') for action in plan):
+                self.delete_rules(self.reorder_rules())
+        else:
+            self.actions = plan
+        self.module.exit_json(changed=changed, actions=self.get_reported_actions())
+
+
+def main():
+    '''Create object and call apply'''
+    rules_obj = NetAppOntapExportRules()
+    rules_obj.apply()
+
+
+if __name__ == '__main__':
+    main()
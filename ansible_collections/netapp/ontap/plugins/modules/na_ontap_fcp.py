@@ -167,9 +167,7 @@ class NetAppOntapFCP(object):
                                   exception=traceback.format_exc())
 
     def apply(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_fcp", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_fcp", self.server, self.module)
         exists = self.get_fcp()
         changed = False
         if self.parameters['state'] == 'present':
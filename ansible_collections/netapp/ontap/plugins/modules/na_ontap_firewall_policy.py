@@ -307,9 +307,7 @@ class NetAppONTAPFirewallPolicy(object):
             return 'enable' if input == 'true' else 'disable'
 
     def autosupport_log(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_firewall_policy", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_firewall_policy", self.server, self.module)
 
     def apply(self):
         self.autosupport_log()
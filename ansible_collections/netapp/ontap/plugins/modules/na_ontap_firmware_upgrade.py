@@ -639,9 +639,7 @@ class NetAppONTAPFirmwareUpgrade(object):
         Autosupport log for software_update
         :return:
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_firmware_upgrade", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_firmware_upgrade", self.server, self.module)
 
     def apply(self):
         """
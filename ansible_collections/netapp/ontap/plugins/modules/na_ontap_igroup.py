@@ -26,6 +26,8 @@ author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
 
 description:
     - Create/Delete/Rename Igroups and Modify initiators belonging to an igroup
+    - Initiators are compared with the current ones in one pass, and only the differences are added or removed.
+    - With REST, new initiators are added with a single request.
 
 options:
   state:
@@ -60,9 +62,18 @@ options:
     - WWPN, WWPN Alias, or iSCSI name of Initiator to add or remove.
     - For a modify operation, this list replaces the exisiting initiators
     - This module does not add or remove specific initiator(s) in an igroup
+    - Initiators are compared without case.
     aliases:
     - initiator
 
+  max_concurrency:
+    description:
+    - Maximum number of initiators added or removed at the same time, when each initiator requires a separate call.
+    - With ZAPI, each worker uses its own connection.
+    type: int
+    default: 4
+    version_added: '20.7.0'
+
   bind_portset:
     description:
     - Name of a current portset to bind to the newly created igroup.
@@ -148,6 +159,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+from ansible_collections.netapp.ontap.plugins.module_utils.netapp import OntapRestAPI
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
 
@@ -168,7 +180,8 @@ class NetAppOntapIgroup(object):
             initiators=dict(required=False, type='list', aliases=['initiator']),
             vserver=dict(required=True, type='str'),
             force_remove_initiator=dict(required=False, type='bool', default=False),
-            bind_portset=dict(required=False, type='str')
+            bind_portset=dict(required=False, type='str'),
+            max_concurrency=dict(required=False, type='int', default=4)
         ))
 
         self.module = AnsibleModule(
@@ -178,6 +191,11 @@ class NetAppOntapIgroup(object):
 
         self.na_helper = NetAppModule()
         self.parameters = self.na_helper.set_parameters(self.module.params)
+        # REST is only probed when initiators are added or removed
+        self.restApi = None
+        self.use_rest = None
+        self.igroup_uuid = None
+        self.worker_pool = netapp_utils.OntapWorkerPool(self.module, self.parameters['max_concurrency'], vserver=self.parameters['vserver'])
 
         if HAS_NETAPP_LIB is False:
             self.module.fail_json(
@@ -218,41 +236,156 @@ class NetAppOntapIgroup(object):
 
         return current
 
-    def add_initiators(self):
+    def get_desired_initiators(self):
+        """
+        Return the desired initiators, without leading or trailing spaces, empty names, or duplicates
+        :return: list
+        """
+        initiators = list()
+        for initiator in self.parameters.get('initiators') or []:
+            # remove leading spaces if any (eg: if user types a space after comma in initiators list)
+            initiator = initiator.strip()
+            if initiator and initiator.lower() not in [name.lower() for name in initiators]:
+                initiators.append(initiator)
+        return initiators
+
+    def get_initiator_changes(self, current):
+        """
+        Compare the desired initiators with the current ones in one pass
+        :return: the initiators to add, and the initiators to remove
+        """
+        desired = self.get_desired_initiators()
+        current_names = set(initiator.lower() for initiator in current['initiators'])
+        desired_names = set(initiator.lower() for initiator in desired)
+        to_add = [initiator for initiator in desired if initiator.lower() not in current_names]
+        to_remove = [initiator for initiator in current['initiators'] if initiator.lower() not in desired_names]
+        return to_add, to_remove
+
+    def add_initiators(self, initiators=None):
         """
         Add the list of initiators to igroup
+        :param initiators: the initiators to add, defaults to the desired initiators
         :return: None
         """
-        # don't add if initiators is empty string
-        if self.parameters.get('initiators') == [''] or self.parameters.get('initiators') is None:
-            return
-        for initiator in self.parameters['initiators']:
-            self.modify_initiator(initiator, 'igroup-add')
+        if initiators is None:
+            initiators = self.get_desired_initiators()
+        self.modify_initiators(initiators, 'igroup-add')
 
     def remove_initiators(self, initiators):
         """
-        Removes all existing initiators from igroup
+        Removes the list of initiators from igroup
         :return: None
         """
-        for initiator in initiators:
-            self.modify_initiator(initiator, 'igroup-remove')
+        self.modify_initiators(initiators, 'igroup-remove')
+
+    def is_rest(self):
+        """
+        Check once whether REST can be used to add or remove initiators
+        """
+        if self.use_rest is None:
+            self.restApi = OntapRestAPI(self.module)
+            self.use_rest = self.restApi.is_rest()
+        return self.use_rest
+
+    def get_server(self):
+        """
+        Return the connection for the current worker thread
+        """
+        return self.worker_pool.get_server(self.server)
+
+    def modify_initiators(self, initiators, zapi):
+        """
+        Add or remove a list of initiators
+        With REST, initiators are added with a single request
+        Otherwise, each initiator requires a separate call, and up to max_concurrency calls run at the same time
+        """
+        if not initiators:
+            return
+        if self.is_rest():
+            if self.igroup_uuid is None:
+                self.igroup_uuid = self.get_igroup_uuid_rest()
+            if zapi == 'igroup-add':
+                errors = self.add_initiators_rest(initiators)
+            else:
+                errors = self.run_initiator_tasks(self.remove_initiator_rest, initiators)
+        else:
+            errors = self.run_initiator_tasks(lambda initiator: self.modify_initiator_task(initiator, zapi), initiators)
+        if errors:
+            self.module.fail_json(msg='Error modifying igroup initiator %s: %s' % (self.parameters['name'], '; '.join(errors)))
+
+    def run_initiator_tasks(self, function, initiators):
+        """
+        Call function for each initiator, with up to max_concurrency workers
+        :return: list of errors
+        """
+        errors = list()
+
+        def set_connection_error(initiator, exc):
+            errors.append('%s: error connecting to %s: %s' % (initiator, self.parameters['hostname'], repr(exc)))
+
+        # with REST, the workers share the REST session
+        self.worker_pool.run(lambda initiator: self.run_initiator_task(function, initiator, errors), initiators,
+                             set_connection_error, connect=not self.use_rest)
+        return errors
+
+    @staticmethod
+    def run_initiator_task(function, initiator, errors):
+        error = function(initiator)
+        if error is not None:
+            errors.append('%s: %s' % (initiator, error))
 
     def modify_initiator(self, initiator, zapi):
         """
         Add or remove an initiator to/from an igroup
         """
-        initiator.strip()  # remove leading spaces if any (eg: if user types a space after comma in initiators list)
         options = {'initiator-group-name': self.parameters['name'],
                    'initiator': initiator}
 
         igroup_modify = netapp_utils.zapi.NaElement.create_node_with_children(zapi, **options)
+        self.get_server().invoke_successfully(igroup_modify, enable_tunneling=True)
 
+    def modify_initiator_task(self, initiator, zapi):
+        """
+        :return: None, or the error reported by ONTAP
+        """
         try:
-            self.server.invoke_successfully(igroup_modify, enable_tunneling=True)
+            self.modify_initiator(initiator, zapi)
         except netapp_utils.zapi.NaApiError as error:
-            self.module.fail_json(msg='Error modifying igroup initiator %s: %s' % (self.parameters['name'],
-                                                                                   to_native(error)),
-                                  exception=traceback.format_exc())
+            return to_native(error)
+        return None
+
+    def get_igroup_uuid_rest(self):
+        """
+        Return the igroup UUID, required to add or remove initiators with REST
+        """
+        api = 'protocols/san/igroups'
+        params = {'svm.name': self.parameters['vserver'],
+                  'name': self.parameters['name'],
+                  'fields': 'uuid'}
+        message, error = self.restApi.get(api, params)
+        if error is None and (not message or not message.get('records')):
+            error = 'igroup not found'
+        if error is not None:
+            self.module.fail_json(msg='Error fetching igroup uuid %s: %s' % (self.parameters['name'], error))
+        return message['records'][0]['uuid']
+
+    def add_initiators_rest(self, initiators):
+        """
+        Add all the initiators with a single request
+        :return: list of errors
+        """
+        api = 'protocols/san/igroups/%s/initiators' % self.igroup_uuid
+        body = {'records': [{'name': initiator} for initiator in initiators]}
+        dummy, error = self.restApi.post(api, body)
+        return [] if error is None else [str(error)]
+
+    def remove_initiator_rest(self, initiator):
+        """
+        :return: None, or the error reported by ONTAP
+        """
+        api = 'protocols/san/igroups/%s/initiators/%s' % (self.igroup_uuid, initiator)
+        dummy, error = self.restApi.delete(api, None)
+        return None if error is None else str(error)
 
     def create_igroup(self):
         """
@@ -318,8 +451,12 @@ class NetAppOntapIgroup(object):
             rename = self.na_helper.is_rename_action(self.get_igroup(self.parameters['from_name']), current)
         else:
             cd_action = self.na_helper.get_cd_action(current, self.parameters)
-        if cd_action is None and self.parameters['state'] == 'present':
-            modify = self.na_helper.get_modified_attributes(current, self.parameters)
+        if cd_action is None and self.parameters['state'] == 'present' and current is not None \
+                and self.parameters.get('initiators') is not None:
+            to_add, to_remove = self.get_initiator_changes(current)
+            if to_add or to_remove:
+                modify = dict(initiators=(to_add, to_remove))
+                self.na_helper.changed = True
 
         if self.na_helper.changed:
             if self.module.check_mode:
@@ -332,8 +469,10 @@ class NetAppOntapIgroup(object):
                 elif cd_action == 'delete':
                     self.delete_igroup()
                 if modify:
-                    self.remove_initiators(current['initiators'])
-                    self.add_initiators()
+                    to_add, to_remove = modify['initiators']
+                    # add first, so that hosts keep their paths when initiators are replaced
+                    self.add_initiators(to_add)
+                    self.remove_initiators(to_remove)
         self.module.exit_json(changed=self.na_helper.changed)
 
 
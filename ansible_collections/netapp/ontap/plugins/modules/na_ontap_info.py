@@ -182,6 +182,15 @@ options:
         type: bool
         default: false
         version_added: '20.6.0'
+    max_concurrency:
+        description:
+        - Maximum number of subsets collected in parallel.
+        - Each worker uses its own connection to the cluster.
+        - Subsets that depend on another subset (eg net_ifgrp_info on net_port_info) are collected after it.
+        - By default, subsets are collected one at a time.
+        type: int
+        default: 1
+        version_added: '20.7.0'
 '''
 
 EXAMPLES = '''
@@ -245,6 +254,15 @@ EXAMPLES = '''
       volume_name: carchitest
       vserver: ansible
 
+- name: Gather all info, collecting up to 8 subsets in parallel
+  na_ontap_info:
+    state: info
+    hostname: "na-vsim"
+    username: "admin"
+    password: "admins_password"
+    max_concurrency: 8
+  register: ontap_info
+
 - name: run ontap info module for aggregate module, requesting specific fields
   na_ontap_info:
     # <<: *login
@@ -308,26 +326,20 @@ ontap_info:
     }'
 '''
 
+import threading
 import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
+from ansible.module_utils.six.moves import queue
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
 
-import copy
 
-try:
-    import xmltodict
-    HAS_XMLTODICT = True
-except ImportError:
-    HAS_XMLTODICT = False
+HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
 
-try:
-    import json
-    HAS_JSON = True
-except ImportError:
-    HAS_JSON = False
 
-HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
+class SubsetFailure(Exception):
+    '''Raised in a worker thread, the main thread reports the failure with fail_json'''
+    pass
 
 
 class NetAppONTAPGatherInfo(object):
@@ -336,6 +348,9 @@ class NetAppONTAPGatherInfo(object):
     def __init__(self, module, max_records):
         self.module = module
         self.max_records = str(max_records)
+        self.max_concurrency = module.params.get('max_concurrency') or 1
+        self.main_thread = threading.current_thread()
+        self.worker_pool = netapp_utils.OntapWorkerPool(module, self.max_concurrency)
         volume_move_target_aggr_info = module.params.get('volume_move_target_aggr_info', dict())
         if volume_move_target_aggr_info is None:
             volume_move_target_aggr_info = dict()
@@ -559,6 +574,7 @@ class NetAppONTAPGatherInfo(object):
                 'method': self.get_ifgrp_info,
                 'kwargs': {},
                 'min_version': '0',
+                'depends_on': ['net_port_info'],
             },
             'ontap_system_version': {
                 'method': self.get_generic_get_iter,
@@ -1234,8 +1250,23 @@ class NetAppONTAPGatherInfo(object):
         else:
             self.server = netapp_utils.setup_na_ontap_zapi(module=self.module)
 
+    def get_server(self):
+        '''Return the connection for the current thread, workers use their own connection'''
+        return self.worker_pool.get_server(self.server)
+
+    def fail_json(self, **kwargs):
+        '''fail_json exits the process, so only the main thread is allowed to call it'''
+        if threading.current_thread() is self.main_thread:
+            self.module.fail_json(**kwargs)
+        raise SubsetFailure(kwargs)
+
     def ontapi(self):
-        '''Method to get ontapi version'''
+        '''Method to get ontapi version, the on-disk cache is used if enabled'''
+
+        return netapp_utils.get_cached_value(self.server, 'ontapi', self.get_ontapi_version)
+
+    def get_ontapi_version(self):
+        '''Method to get ontapi version from the cluster'''
 
         api = 'system-get-ontapi-version'
         api_call = netapp_utils.zapi.NaElement(api)
@@ -1247,12 +1278,13 @@ class NetAppONTAPGatherInfo(object):
             self.module.fail_json(msg="Error calling API %s: %s" %
                                   (api, to_native(error)), exception=traceback.format_exc())
 
-    def call_api(self, call, attributes_list_tag='attributes-list', query=None, fail_on_error=True):
-        '''Main method to run an API call'''
+    def get_api_pages(self, call, attributes_list_tag='attributes-list', query=None):
+        '''Generator running an API call, and following next-tag
+           Each page is yielded as soon as it is received, so it can be released once processed
+           Raises NaApiError on error
+        '''
 
         api_call = netapp_utils.zapi.NaElement(call)
-        initial_result = None
-        result = None
 
         if query:
             for key, val in query.items():
@@ -1261,39 +1293,55 @@ class NetAppONTAPGatherInfo(object):
 
         if self.desired_attributes is not None:
             api_call.translate_struct(self.desired_attributes)
-        try:
-            initial_result = self.server.invoke_successfully(api_call, enable_tunneling=False)
-            next_tag = initial_result.get_child_by_name('next-tag')
-            result = copy.copy(initial_result)
+        result = self.get_server().invoke_successfully(api_call, enable_tunneling=False)
 
-            while next_tag:
-                next_tag_call = netapp_utils.zapi.NaElement(call)
-                if query:
-                    for key, val in query.items():
-                        next_tag_call.add_new_child(key, val)
+        while result is not None:
+            next_tag = result.get_child_by_name('next-tag')
+            yield result
+            result = None
+            if next_tag is None:
+                break
+            if attributes_list_tag is None:
+                self.fail_json(msg="Error calling API %s: %s" %
+                                   (api_call.to_string(), "'next-tag' is not expected for this API"))
 
-                next_tag_call.add_new_child("tag", next_tag.get_content(), True)
-                next_result = self.server.invoke_successfully(next_tag_call, enable_tunneling=False)
+            next_tag_call = netapp_utils.zapi.NaElement(call)
+            if query:
+                for key, val in query.items():
+                    next_tag_call.add_new_child(key, val)
 
-                next_tag = next_result.get_child_by_name('next-tag')
-                if attributes_list_tag is None:
-                    self.module.fail_json(msg="Error calling API %s: %s" %
-                                          (api_call.to_string(), "'next-tag' is not expected for this API"))
+            next_tag_call.add_new_child("tag", next_tag.get_content(), True)
+            result = self.get_server().invoke_successfully(next_tag_call, enable_tunneling=False)
+
+    def report_api_error(self, call, error, fail_on_error):
+        '''Return True if the error can be ignored, and partial results used'''
 
+        if call in ['security-key-manager-key-get-iter']:
+            return True
+        if fail_on_error:
+            self.fail_json(msg="Error calling API %s: %s"
+                               % (call, to_native(error)), exception=traceback.format_exc())
+        return False
+
+    def call_api(self, call, attributes_list_tag='attributes-list', query=None, fail_on_error=True):
+        '''Main method to run an API call, records from all pages are merged in a single result'''
+
+        result = None
+        try:
+            for page in self.get_api_pages(call, attributes_list_tag, query):
+                if result is None:
+                    result = page
+                    continue
                 result_attr = result.get_child_by_name(attributes_list_tag)
-                new_records = next_result.get_child_by_name(attributes_list_tag)
+                new_records = page.get_child_by_name(attributes_list_tag)
                 if new_records:
                     for record in new_records.get_children():
                         result_attr.add_child_elem(record)
-
             return result, None
 
         except netapp_utils.zapi.NaApiError as error:
-            if call in ['security-key-manager-key-get-iter']:
+            if self.report_api_error(call, error, fail_on_error):
                 return result, None
-            if fail_on_error:
-                self.module.fail_json(msg="Error calling API %s: %s"
-                                      % (call, to_native(error)), exception=traceback.format_exc())
             return None, error
 
     def get_ifgrp_info(self):
@@ -1319,55 +1367,66 @@ class NetAppONTAPGatherInfo(object):
             tmp = self.get_generic_get_iter('net-port-ifgrp-get', key_fields=('node', 'ifgrp-name'),
                                             attribute='net-ifgrp-info', query=query,
                                             attributes_list_tag='attributes')
-            net_ifgrp_info = net_ifgrp_info.copy()
             net_ifgrp_info.update(tmp)
         return net_ifgrp_info
 
-    def get_generic_get_iter(self, call, attribute=None, key_fields=None, query=None, attributes_list_tag='attributes-list', fail_on_error=True):
-        '''Method to run a generic get-iter call'''
-
-        generic_call, error = self.call_api(call, attributes_list_tag, query, fail_on_error=fail_on_error)
-
-        if error is not None:
-            return {'error': str(error)}
-
-        if generic_call is None:
-            return None
-
-        if attributes_list_tag is None:
-            attributes_list = generic_call
-        else:
-            attributes_list = generic_call.get_child_by_name(attributes_list_tag)
-
-        if attributes_list is None:
-            return None
-
-        if key_fields is None:
-            out = []
-        else:
-            out = {}
+    def add_records(self, out, attributes_list, attribute, key_fields):
+        '''Convert records, and add them to out (a dict if key_fields is set, or a list)'''
 
         for child in attributes_list.get_children():
-            dic = xmltodict.parse(child.to_string(), xml_attribs=False)
-
+            name = zapi_tag(child)
             if attribute is not None:
-                dic = dic[attribute]
+                if name != attribute:
+                    raise KeyError(attribute)
+                info = zapi_to_dict(child, self.translate_keys)
+            else:
+                info = {translate_key(name, self.translate_keys): zapi_to_dict(child, self.translate_keys)}
 
-            info = json.loads(json.dumps(dic))
-            if self.translate_keys:
-                info = convert_keys(info)
             if isinstance(key_fields, str):
-                unique_key = _finditem(dic, key_fields)
+                unique_key = _finditem(info, key_fields)
             elif isinstance(key_fields, tuple):
-                unique_key = ':'.join([_finditem(dic, el) for el in key_fields])
+                unique_key = ':'.join([_finditem(info, el) for el in key_fields])
             else:
                 unique_key = None
             if unique_key is not None:
-                out = out.copy()
-                out.update({unique_key: info})
+                out[unique_key] = info
             else:
                 out.append(info)
 
+    def get_generic_get_iter(self, call, attribute=None, key_fields=None, query=None, attributes_list_tag='attributes-list', fail_on_error=True):
+        '''Method to run a generic get-iter call'''
+
+        if key_fields is None:
+            out = []
+        else:
+            out = {}
+
+        if self.translate_keys:
+            # keys are translated while walking the tree, so are the key fields
+            if isinstance(key_fields, str):
+                key_fields = key_fields.replace('-', '_')
+            elif isinstance(key_fields, tuple):
+                key_fields = tuple(el.replace('-', '_') for el in key_fields)
+
+        # records are converted page by page, rather than merging all pages first
+        found_records = False
+        try:
+            for page in self.get_api_pages(call, attributes_list_tag, query):
+                if attributes_list_tag is None:
+                    attributes_list = page
+                else:
+                    attributes_list = page.get_child_by_name(attributes_list_tag)
+                if attributes_list is None:
+                    continue
+                found_records = True
+                self.add_records(out, attributes_list, attribute, key_fields)
+        except netapp_utils.zapi.NaApiError as error:
+            if not self.report_api_error(call, error, fail_on_error):
+                return {'error': str(error)}
+
+        if not found_records:
+            return None
+
         if attributes_list_tag is None and key_fields is None:
             if len(out) == 1:
                 # flatten the list as only 1 element is expected
@@ -1396,9 +1455,7 @@ class NetAppONTAPGatherInfo(object):
         if self.module.params['vserver']:
             netapp_utils.ems_log_event("na_ontap_info", self.server)
         else:
-            results = netapp_utils.get_cserver(self.server)
-            cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-            netapp_utils.ems_log_event("na_ontap_info", cserver)
+            netapp_utils.ems_log_event_cserver("na_ontap_info", self.server, self.module)
 
         self.netapp_info['ontapi_version'] = self.ontapi()
         self.netapp_info['ontap_version'] = self.netapp_info['ontapi_version']
@@ -1414,15 +1471,83 @@ class NetAppONTAPGatherInfo(object):
                 if len(run_subset) > 1:
                     self.module.fail_json(msg="desired_attributes option is only supported with a single subset")
                 self.sanitize_desired_attributes()
-            for subset in run_subset:
-                call = self.info_subsets[subset]
-                self.netapp_info[subset] = call['method'](**call['kwargs'])
+            if self.max_concurrency > 1 and len(run_subset) > 1:
+                self.get_subsets_in_parallel(run_subset)
+            else:
+                for subset in self.order_subsets(run_subset):
+                    self.netapp_info[subset] = self.get_subset_info(subset)
 
         if self.warnings:
             self.netapp_info['module_warnings'] = self.warnings
 
         return self.netapp_info
 
+    def get_subset_info(self, subset):
+        '''Method to collect a single subset'''
+
+        call = self.info_subsets[subset]
+        return call['method'](**call['kwargs'])
+
+    def get_dependencies(self, subset, run_subset):
+        '''Return the subsets in run_subset that need to be collected before subset'''
+
+        return [dep for dep in self.info_subsets[subset].get('depends_on', []) if dep in run_subset]
+
+    def order_subsets(self, run_subset):
+        '''Return run_subset as a list, where a subset always follows its dependencies'''
+
+        ordered = list()
+        pending = sorted(run_subset)
+        while pending:
+            ready = [subset for subset in pending
+                     if all(dep in ordered for dep in self.get_dependencies(subset, run_subset))]
+            if not ready:
+                self.module.fail_json(msg='Internal error: circular dependency between subsets: %s' % pending)
+            ordered.extend(ready)
+            pending = [subset for subset in pending if subset not in ready]
+        return ordered
+
+    def get_subsets_in_parallel(self, run_subset):
+        '''Collect subsets using up to max_concurrency workers
+           a subset is only scheduled when the subsets it depends on are collected
+        '''
+
+        results = queue.Queue()
+
+        def collect_subset(subset):
+            try:
+                results.put((subset, self.get_subset_info(subset), None))
+            except (Exception, SystemExit) as exc:  # pylint: disable=broad-except
+                results.put((subset, None, exc))
+
+        self.worker_pool.start(collect_subset, lambda subset, exc: results.put((subset, None, exc)),
+                               min(self.max_concurrency, len(run_subset)))
+
+        pending = self.order_subsets(run_subset)
+        in_flight = 0
+        error = None
+        while in_flight or (pending and error is None):
+            if error is None:
+                ready = [subset for subset in pending
+                         if all(dep in self.netapp_info for dep in self.get_dependencies(subset, run_subset))]
+                for subset in ready:
+                    pending.remove(subset)
+                    self.worker_pool.put(subset)
+                    in_flight += 1
+            subset, info, exc = results.get()
+            in_flight -= 1
+            if exc is not None:
+                # report the first error, after letting running workers complete
+                error = error or exc
+            else:
+                self.netapp_info[subset] = info
+
+        self.worker_pool.stop()
+        if isinstance(error, SubsetFailure):
+            self.module.fail_json(**error.args[0])
+        if error is not None:
+            raise error
+
     def get_subset(self, gather_subset, version):
         '''Method to get a single subset'''
 
@@ -1521,19 +1646,44 @@ def _finditem(obj, keys):
     raise KeyError(str(keys))
 
 
-def convert_keys(d_param):
+def zapi_tag(element):
+    '''Return the tag of a NaElement, without namespace'''
+
+    name = element.get_name()
+    if name.startswith('{'):
+        name = name.split('}', 1)[1]
+    return name
+
+
+def translate_key(key, translate_keys):
     '''Method to convert hyphen to underscore'''
 
+    return key.replace('-', '_') if translate_keys else key
+
+
+def zapi_to_dict(element, translate_keys):
+    '''Convert a NaElement to a dictionary in a single pass
+       - an element without children is converted to its text, or None
+       - repeated tags are converted to a list
+       - if translate_keys is set, hyphens in keys are converted to underscores
+    '''
+
+    children = element.get_children()
+    if not children:
+        content = element.get_content()
+        if content is not None:
+            content = content.strip() or None
+        return content
     out = {}
-    if isinstance(d_param, dict):
-        for key, val in d_param.items():
-            val = convert_keys(val)
-            out[key.replace('-', '_')] = val
-    elif isinstance(d_param, list):
-        for val in d_param:
-            val = convert_keys(val)
-    else:
-        return d_param
+    for child in children:
+        key = translate_key(zapi_tag(child), translate_keys)
+        value = zapi_to_dict(child, translate_keys)
+        if key not in out:
+            out[key] = value
+        elif isinstance(out[key], list):
+            out[key].append(value)
+        else:
+            out[key] = [out[key], value]
     return out
 
 
@@ -1556,7 +1706,8 @@ def main():
             )
         ),
         desired_attributes=dict(type='dict', required=False),
-        use_native_zapi_tags=dict(type='bool', required=False, default=False)
+        use_native_zapi_tags=dict(type='bool', required=False, default=False),
+        max_concurrency=dict(type='int', required=False, default=1)
     ))
 
     module = AnsibleModule(
@@ -1564,12 +1715,6 @@ def main():
         supports_check_mode=True
     )
 
-    if not HAS_XMLTODICT:
-        module.fail_json(msg="xmltodict missing")
-
-    if not HAS_JSON:
-        module.fail_json(msg="json missing")
-
     state = module.params['state']
     gather_subset = module.params['gather_subset']
     summary = module.params['summary']
@@ -488,9 +488,7 @@ class NetAppOntapInterface(object):
                                   exception=traceback.format_exc())
 
     def autosupport_log(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_interface", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_interface", self.server, self.module)
 
     def apply(self):
         ''' calling all interface features '''
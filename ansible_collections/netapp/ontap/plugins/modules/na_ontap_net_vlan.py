@@ -153,9 +153,7 @@ class NetAppOntapVlan(object):
         """
         changed = False
         result = None
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_net_vlan", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_net_vlan", self.server, self.module)
         existing_vlan = self.does_vlan_exist()
         if existing_vlan:
             if self.state == 'absent':  # delete
@@ -113,9 +113,7 @@ class NetAppOntapNode(object):
 
     def apply(self):
         # logging ems event
-        results = netapp_utils.get_cserver(self.cluster)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_node", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_node", self.cluster, self.module)
 
         exists = self.get_node(self.parameters['name'])
         from_exists = self.get_node(self.parameters['from_name'])
@@ -0,0 +1,415 @@
+#!/usr/bin/python
+
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'certified'}
+
+
+DOCUMENTATION = '''
+
+module: na_ontap_quota_rules
+
+short_description: NetApp ONTAP manage a list of quota rules for a volume in a single task.
+extends_documentation_fragment:
+    - netapp.ontap.netapp.na_ontap
+version_added: '20.7.0'
+author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
+
+description:
+- Set, modify, or delete a list of quota rules for a volume.
+- All the quota rules of the volume are fetched with a single paginated quota-list-entries-iter query.
+- Changes are computed locally, and activated once for the volume.
+- When quotas are on, limit changes are activated with quota-resize, while added or deleted rules require quotas to be
+  turned off and on, which rescans the whole volume.
+- Use na_ontap_quotas to manage a single quota rule.
+
+options:
+  vserver:
+    description:
+    - Name of the vserver to use.
+    required: true
+    type: str
+  volume:
+    description:
+    - The name of the volume that the quota rules reside on.
+    required: true
+    type: str
+  policy:
+    description:
+    - Name of the quota policy from which the quota rules should be obtained.
+    - Defaults to the policy assigned to the vserver.
+    type: str
+  rules:
+    description:
+    - List of quota rules to manage.
+    - Rules of the volume that are not listed are left unchanged.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      type:
+        description:
+        - The type of quota rule.
+        choices: ['user', 'group', 'tree']
+        required: true
+        type: str
+      quota_target:
+        description:
+        - The quota target of the type specified.
+        required: true
+        type: str
+      qtree:
+        description:
+        - Name of the qtree for the quota.
+        - For user or group rules, it can be the qtree name or "" if no qtree.
+        - For tree type rules, this field must be "".
+        default: ""
+        type: str
+      state:
+        description:
+        - Whether the quota rule should exist or not.
+        choices: ['present', 'absent']
+        default: present
+        type: str
+      file_limit:
+        description:
+        - The number of files that the target can have.
+        - Use '-' for no limit.
+        default: '-'
+        type: str
+      disk_limit:
+        description:
+        - The amount of disk space that is reserved for the target.
+        - A number of kilobytes, or a number with a KB, MB, GB, TB, or PB unit, eg 10GB.
+        - The value is converted to kilobytes, as reported by ONTAP, before it is compared with the current value.
+        - Use '-' for no limit.
+        default: '-'
+        type: str
+      threshold:
+        description:
+        - The amount of disk space the target would have to exceed before a message is logged.
+        - A number of kilobytes, or a number with a KB, MB, GB, TB, or PB unit, eg 10GB.
+        - Use '-' for no limit.
+        default: '-'
+        type: str
+  set_quota_status:
+    description:
+    - Whether the specified volume should have quota status on or off.
+    - When not set, the current status is kept.
+    type: bool
+  activate:
+    description:
+    - How to activate the changes when quotas are on.
+    - C(auto) uses quota-resize when only limits changed, and turns quotas off and on when rules were added or deleted.
+    - C(resize) always uses quota-resize, C(reinitialize) always turns quotas off and on.
+    - C(none) does not activate the changes.
+    choices: ['auto', 'resize', 'reinitialize', 'none']
+    default: auto
+    type: str
+  wait_for_completion:
+    description:
+    - Whether to wait for the quota-resize or quota-on job to complete.
+    default: true
+    type: bool
+  time_out:
+    description:
+    - Time in seconds to wait for the quota-resize or quota-on job to complete.
+    default: 180
+    type: int
+  max_records:
+    description:
+    - Maximum number of records returned by each call to quota-list-entries-iter.
+    default: 500
+    type: int
+'''
+
+EXAMPLES = """
+    - name: Set home directory quotas
+      na_ontap_quota_rules:
+        vserver: ansible
+        volume: home
+        rules:
+          - type: user
+            quota_target: alice
+            disk_limit: 10GB
+          - type: user
+            quota_target: bob
+            disk_limit: 20GB
+          - type: user
+            quota_target: carol
+            state: absent
+        set_quota_status: true
+        hostname: "{{ netapp_hostname }}"
+        username: "{{ netapp_username }}"
+        password: "{{ netapp_password }}"
+"""
+
+RETURN = """
+rules:
+    description:
+    - Action taken for each quota rule, in the order of the rules option.
+    - disk_limit and threshold are reported in kilobytes.
+    returned: always
+    type: list
+    sample: [{"type": "user", "quota_target": "alice", "qtree": "", "action": "modify", "modify": {"disk_limit": "10485760"}},
+             {"type": "user", "quota_target": "carol", "qtree": "", "action": "delete"}]
+activation:
+    description:
+    - How the changes were activated, one of resize, reinitialize, on, off, or null when nothing was done.
+    returned: always
+    type: str
+"""
+
+import re
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+
+HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
+
+LIMIT_KEYS = {
+    'file_limit': 'file-limit',
+    'disk_limit': 'disk-limit',
+    'threshold': 'threshold'
+}
+
+# disk_limit and threshold are reported in KB by ONTAP
+SIZE_KEYS = ['disk_limit', 'threshold']
+SIZE_UNITS = {'kb': 1, 'mb': 1024, 'gb': 1024 ** 2, 'tb': 1024 ** 3, 'pb': 1024 ** 4}
+
+
+class NetAppOntapQuotaRules(object):
+    '''Class with bulk quota rule operations'''
+
+    def __init__(self):
+        '''Initialize module parameters'''
+        self.argument_spec = netapp_utils.na_ontap_host_argument_spec()
+        self.argument_spec.update(dict(
+            vserver=dict(required=True, type='str'),
+            volume=dict(required=True, type='str'),
+            policy=dict(required=False, type='str'),
+            rules=dict(required=True, type='list', elements='dict', options=dict(
+                type=dict(required=True, type='str', choices=['user', 'group', 'tree']),
+                quota_target=dict(required=True, type='str'),
+                qtree=dict(type='str', default=''),
+                state=dict(choices=['present', 'absent'], default='present', type='str'),
+                file_limit=dict(type='str', default='-'),
+                disk_limit=dict(type='str', default='-'),
+                threshold=dict(type='str', default='-'),
+            )),
+            set_quota_status=dict(required=False, type='bool'),
+            activate=dict(required=False, type='str', choices=['auto', 'resize', 'reinitialize', 'none'], default='auto'),
+            wait_for_completion=dict(required=False, type='bool', default=True),
+            time_out=dict(required=False, type='int', default=180),
+            max_records=dict(required=False, type='int', default=500),
+        ))
+        self.module = AnsibleModule(
+            argument_spec=self.argument_spec,
+            supports_check_mode=True
+        )
+        self.na_helper = NetAppModule()
+        self.parameters = self.na_helper.set_parameters(self.module.params)
+        self.rules = self.get_desired_rules()
+
+        if HAS_NETAPP_LIB is False:
+            self.module.fail_json(msg="the python NetApp-Lib module is required")
+        else:
+            self.server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=self.parameters['vserver'])
+
+    @staticmethod
+    def get_key(rule):
+        '''A quota rule is identified by its type, target, and qtree'''
+        return rule['type'], rule['quota_target'], rule['qtree']
+
+    def get_size_in_kb(self, rule, key):
+        '''Convert a size with an optional unit to a number of KB, as reported by ONTAP'''
+        value = rule[key].strip()
+        if value == '-':
+            return value
+        match = re.match(r'^(\d+)\s*([kmgtp]b)?$', value, re.IGNORECASE)
+        if match is None:
+            self.module.fail_json(msg='Error: %s for quota rule %s %s must be "-", a number of KB, or a number with a KB, MB, GB, TB, '
+                                      'or PB unit, got: %s' % (key, rule['type'], rule['quota_target'], rule[key]))
+        return str(int(match.group(1)) * SIZE_UNITS[(match.group(2) or 'kb').lower()])
+
+    def get_desired_rules(self):
+        '''Check for duplicate rules, and convert the sizes to KB'''
+        rules = list()
+        keys = set()
+        for rule in self.parameters['rules']:
+            if self.get_key(rule) in keys:
+                self.module.fail_json(msg='Error: quota rule %s %s (qtree: "%s") is listed more than once' % self.get_key(rule))
+            keys.add(self.get_key(rule))
+            rule = dict(rule)
+            for key in SIZE_KEYS:
+                rule[key] = self.get_size_in_kb(rule, key)
+            rules.append(rule)
+        return rules
+
+    def get_quota_rules(self):
+        '''
+        Return all the quota rules of the volume, using a single paginated quota-list-entries-iter query
+        :return: dict of rules indexed by (type, quota_target, qtree)
+        '''
+        quota_get = netapp_utils.zapi.NaElement('quota-list-entries-iter')
+        query = {'volume': self.parameters['volume'],
+                 'vserver': self.parameters['vserver']}
+        if self.parameters.get('policy'):
+            query['policy'] = self.parameters['policy']
+        quota_get.translate_struct({'query': {'quota-entry': query}})
+
+        rules = dict()
+        try:
+            for quota_entry in netapp_utils.get_zapi_records(self.server, quota_get, self.parameters['max_records']):
+                rule = dict(type=quota_entry.get_child_content('quota-type'),
+                            quota_target=quota_entry.get_child_content('quota-target'),
+                            qtree=quota_entry.get_child_content('qtree') or '')
+                for key, zapi_key in LIMIT_KEYS.items():
+                    rule[key] = quota_entry.get_child_content(zapi_key)
+                rules[self.get_key(rule)] = rule
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error fetching quotas info for %s: %s' % (self.parameters['volume'], to_native(error)),
+                                  exception=traceback.format_exc())
+        return rules
+
+    def get_quota_status(self):
+        '''Return the quota status of the volume, eg on or off'''
+        quota_status_get = netapp_utils.zapi.NaElement.create_node_with_children('quota-status', **{'volume': self.parameters['volume']})
+        try:
+            result = self.server.invoke_successfully(quota_status_get, enable_tunneling=True)
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error fetching quotas status info: %s' % to_native(error),
+                                  exception=traceback.format_exc())
+        return result.get_child_content('status')
+
+    def get_rule_options(self, rule):
+        options = {'volume': self.parameters['volume'],
+                   'quota-target': rule['quota_target'],
+                   'quota-type': rule['type'],
+                   'qtree': rule['qtree']}
+        if self.parameters.get('policy'):
+            options['policy'] = self.parameters['policy']
+        return options
+
+    def apply_action(self, result):
+        '''Run the create, delete, or modify action for a quota rule'''
+        rule = result['desired']
+        options = self.get_rule_options(rule)
+        if result['action'] == 'create':
+            zapi = 'quota-set-entry'
+            options.update(dict((zapi_key, rule[key]) for key, zapi_key in LIMIT_KEYS.items()))
+        elif result['action'] == 'delete':
+            zapi = 'quota-delete-entry'
+        else:
+            zapi = 'quota-modify-entry'
+            options.update(dict((LIMIT_KEYS[key], value) for key, value in result['modify'].items()))
+        quota_entry = netapp_utils.zapi.NaElement.create_node_with_children(zapi, **options)
+        try:
+            self.server.invoke_successfully(quota_entry, enable_tunneling=True)
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error %s quota entry %s %s for %s: %s'
+                                  % (dict(create='adding', delete='deleting', modify='modifying')[result['action']],
+                                     rule['type'], rule['quota_target'], self.parameters['volume'], to_native(error)),
+                                  exception=traceback.format_exc())
+
+    def run_quota_zapi(self, zapi):
+        '''
+        Run quota-on, quota-off, or quota-resize for the volume
+        quota-on and quota-resize start a job, which is awaited if wait_for_completion is set
+        '''
+        quota = netapp_utils.zapi.NaElement.create_node_with_children(zapi, **{'volume': self.parameters['volume']})
+        try:
+            result = self.server.invoke_successfully(quota, enable_tunneling=True)
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error setting %s for %s: %s' % (zapi, self.parameters['volume'], to_native(error)),
+                                  exception=traceback.format_exc())
+        job_id = result.get_child_content('result-jobid')
+        if zapi == 'quota-off' or job_id is None or not self.parameters['wait_for_completion']:
+            return
+        error = netapp_utils.OntapJobWaiter(self.module, self.server).wait_for_job(job_id, self.parameters['time_out'])
+        if error is not None:
+            self.module.fail_json(msg='Error running %s for %s: %s' % (zapi, self.parameters['volume'], error))
+
+    def get_activation(self, results, quota_status):
+        '''
+        Decide how to activate the changes, depending on the quota status and the actions
+        :return: resize, reinitialize, on, off, or None
+        '''
+        if quota_status is None:
+            return None
+        is_on = quota_status == 'on'
+        want_on = self.parameters.get('set_quota_status', is_on)
+        if want_on != is_on:
+            # turning quotas on reads all the rules anyway
+            return 'on' if want_on else 'off'
+        actions = set(result['action'] for result in results if result['action'] is not None)
+        if not is_on or not actions or self.parameters['activate'] == 'none':
+            return None
+        if self.parameters['activate'] == 'auto':
+            return 'resize' if actions == set(['modify']) else 'reinitialize'
+        return self.parameters['activate']
+
+    def activate(self, activation):
+        if activation == 'resize':
+            self.run_quota_zapi('quota-resize')
+        elif activation == 'reinitialize':
+            self.run_quota_zapi('quota-off')
+            self.run_quota_zapi('quota-on')
+        elif activation is not None:
+            self.run_quota_zapi('quota-%s' % activation)
+
+    def apply(self):
+        '''Call create/modify/delete operations for all quota rules, and activate the changes once'''
+        netapp_utils.ems_log_event("na_ontap_quota_rules", self.server)
+        current_rules = self.get_quota_rules()
+        results = list()
+        for desired in self.rules:
+            current = current_rules.get(self.get_key(desired))
+            result = dict(type=desired['type'], quota_target=desired['quota_target'], qtree=desired['qtree'],
+                          action=None, desired=desired)
+            cd_action = self.na_helper.get_cd_action(current, desired)
+            if cd_action is not None:
+                result['action'] = cd_action
+            elif current is not None and desired['state'] == 'present':
+                modify = dict((key, desired[key]) for key in LIMIT_KEYS if desired[key] != current[key])
+                if modify:
+                    result['action'] = 'modify'
+                    result['modify'] = modify
+            results.append(result)
+
+        quota_status = None
+        if 'set_quota_status' in self.parameters or \
+                (self.parameters['activate'] != 'none' and any(result['action'] is not None for result in results)):
+            quota_status = self.get_quota_status()
+        activation = self.get_activation(results, quota_status)
+
+        if not self.module.check_mode:
+            for result in results:
+                if result['action'] is not None:
+                    self.apply_action(result)
+            self.activate(activation)
+
+        for result in results:
+            del result['desired']
+        changed = activation is not None or any(result['action'] is not None for result in results)
+        self.module.exit_json(changed=changed, rules=results, activation=activation)
+
+
+def main():
+    '''Create object and call apply'''
+    quota_obj = NetAppOntapQuotaRules()
+    quota_obj.apply()
+
+
+if __name__ == '__main__':
+    main()
@@ -250,7 +250,6 @@ EXAMPLES = """
 RETURN = """
 """
 
-import time
 import re
 import traceback
 from ansible.module_utils.basic import AnsibleModule
@@ -502,14 +501,11 @@ class NetAppONTAPSnapmirror(object):
         if result is not None and result['status'] == 'passed':
             return
         elif result is not None and result['status'] != 'passed':
-            retries = 5
-            while retries > 0:
-                time.sleep(5)
-                retries = retries - 1
-                status = self.snapmirror_get()
-                if status['status'] == 'quiesced':
-                    return
-            if retries == 0:
+            def poll():
+                return self.snapmirror_get()['status'] == 'quiesced', None
+
+            quiesced, dummy = netapp_utils.wait_for_condition(poll, 25, max_interval=5)
+            if not quiesced:
                 self.module.fail_json(msg='Taking a long time to Quiescing SnapMirror, try again later')
 
     def snapmirror_delete(self):
@@ -776,22 +772,15 @@ class NetAppONTAPSnapmirror(object):
 
     def asup_log_for_cserver(self, event_name):
         """
-        Fetch admin vserver for the given cluster
-        Create and Autosupport log event with the given module name
+        Create and Autosupport log event with the given module name on the admin vserver
         :param event_name: Name of the event log
         :return: None
         """
-        results = netapp_utils.get_cserver(self.server)
-        if results is None:
-            # We may be running on a vserser
-            try:
-                netapp_utils.ems_log_event(event_name, self.server)
-            except netapp_utils.zapi.NaApiError:
-                # Don't fail if we cannot log usage
-                pass
-        else:
-            cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-            netapp_utils.ems_log_event(event_name, cserver)
+        try:
+            netapp_utils.ems_log_event_cserver(event_name, self.server, self.module)
+        except netapp_utils.zapi.NaApiError:
+            # Don't fail if we cannot log usage, we may be running on a vserver
+            pass
 
     def apply(self):
         """
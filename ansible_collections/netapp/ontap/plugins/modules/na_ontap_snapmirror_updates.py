@@ -0,0 +1,280 @@
+#!/usr/bin/python
+
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'certified'}
+
+
+DOCUMENTATION = '''
+
+module: na_ontap_snapmirror_updates
+
+short_description: NetApp ONTAP update all the SnapMirror relationships of a destination in a single task.
+extends_documentation_fragment:
+    - netapp.ontap.netapp.na_ontap
+version_added: '20.7.0'
+author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
+
+description:
+- Trigger a SnapMirror update for all the relationships of a destination cluster, optionally filtered by destination vserver or policy.
+- The relationships are listed with a single paginated snapmirror-get-iter query.
+- Updates are dispatched with bounded concurrency, and the transfers are awaited together, polling with a single query.
+- Relationships that are not in the snapmirrored state, or that are already transferring, are skipped.
+- Use na_ontap_snapmirror to create, modify, or delete a relationship.
+
+options:
+  destination_vserver:
+    description:
+    - Only update the relationships whose destination is in this vserver.
+    type: str
+  policy:
+    description:
+    - Only update the relationships using this SnapMirror policy.
+    type: str
+  max_concurrency:
+    description:
+    - Maximum number of snapmirror-update requests running at the same time.
+    - Each worker uses its own connection.
+    type: int
+    default: 8
+  max_records:
+    description:
+    - Maximum number of records returned in a single snapmirror-get-iter call.
+    type: int
+    default: 500
+  wait_for_completion:
+    description:
+    - Whether to wait for all the transfers to complete.
+    type: bool
+    default: true
+  time_out:
+    description:
+    - Time in seconds to wait for all the transfers to complete.
+    type: int
+    default: 3600
+'''
+
+EXAMPLES = """
+    - name: Update all DR relationships of a vserver
+      na_ontap_snapmirror_updates:
+        destination_vserver: dr_svm
+        policy: MirrorAllSnapshots
+        max_concurrency: 16
+        hostname: "{{ destination_cluster_hostname }}"
+        username: "{{ netapp_username }}"
+        password: "{{ netapp_password }}"
+"""
+
+RETURN = """
+relationships:
+    description:
+    - Update status for each relationship.
+    - lag_time and last_transfer_duration are reported in seconds by ONTAP, after the transfer when waiting for completion.
+    - transfer_time is the time in seconds between the update request and the poll that found the transfer completed.
+    returned: always
+    type: list
+    sample: [{"destination_path": "dr_svm:vol1_dst", "source_path": "svm:vol1", "policy": "MirrorAllSnapshots",
+              "action": "update", "lag_time": 42, "last_transfer_duration": 12, "last_transfer_size": 1048576,
+              "transfer_time": 15.2},
+             {"destination_path": "dr_svm:vol2_dst", "source_path": "svm:vol2", "policy": "MirrorAllSnapshots",
+              "action": null, "skipped": "relationship is transferring", "lag_time": 3600}]
+"""
+
+import time
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+
+HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
+
+SNAPMIRROR_ATTRIBUTES = ['destination-location', 'source-location', 'policy', 'mirror-state', 'relationship-status',
+                         'lag-time', 'last-transfer-duration', 'last-transfer-end-timestamp', 'last-transfer-size',
+                         'last-transfer-error']
+
+
+class NetAppOntapSnapmirrorUpdates(object):
+    '''Class with bulk SnapMirror update operations'''
+
+    def __init__(self):
+        '''Initialize module parameters'''
+        self.argument_spec = netapp_utils.na_ontap_host_argument_spec()
+        self.argument_spec.update(dict(
+            destination_vserver=dict(required=False, type='str'),
+            policy=dict(required=False, type='str'),
+            max_concurrency=dict(required=False, type='int', default=8),
+            max_records=dict(required=False, type='int', default=500),
+            wait_for_completion=dict(required=False, type='bool', default=True),
+            time_out=dict(required=False, type='int', default=3600),
+        ))
+        self.module = AnsibleModule(
+            argument_spec=self.argument_spec,
+            supports_check_mode=True
+        )
+        self.parameters = self.module.params
+        self.worker_pool = netapp_utils.OntapWorkerPool(self.module, self.parameters['max_concurrency'])
+
+        if HAS_NETAPP_LIB is False:
+            self.module.fail_json(msg="the python NetApp-Lib module is required")
+        else:
+            self.server = netapp_utils.setup_na_ontap_zapi(module=self.module)
+
+    def get_server(self):
+        '''Return the connection for the current worker thread'''
+        return self.worker_pool.get_server(self.server)
+
+    @staticmethod
+    def get_int(snapmirror_info, attribute):
+        value = snapmirror_info.get_child_content(attribute)
+        return int(value) if value is not None else None
+
+    def get_relationship_details(self, snapmirror_info):
+        '''Convert snapmirror-info to a dict'''
+        return dict(
+            destination_path=snapmirror_info.get_child_content('destination-location'),
+            source_path=snapmirror_info.get_child_content('source-location'),
+            policy=snapmirror_info.get_child_content('policy'),
+            mirror_state=snapmirror_info.get_child_content('mirror-state'),
+            status=snapmirror_info.get_child_content('relationship-status'),
+            lag_time=self.get_int(snapmirror_info, 'lag-time'),
+            last_transfer_duration=self.get_int(snapmirror_info, 'last-transfer-duration'),
+            last_transfer_end=snapmirror_info.get_child_content('last-transfer-end-timestamp'),
+            last_transfer_size=self.get_int(snapmirror_info, 'last-transfer-size'),
+            last_transfer_error=snapmirror_info.get_child_content('last-transfer-error'),
+        )
+
+    def get_relationships(self):
+        '''
+        Return all the relationships matching the filters, using a single paginated snapmirror-get-iter query
+        :return: dict of relationship details, indexed by destination path
+        '''
+        snapmirror_get_iter = netapp_utils.zapi.NaElement('snapmirror-get-iter')
+        desired_attributes = netapp_utils.zapi.NaElement('desired-attributes')
+        desired_attributes.translate_struct({'snapmirror-info': dict((attribute, None) for attribute in SNAPMIRROR_ATTRIBUTES)})
+        snapmirror_get_iter.add_child_elem(desired_attributes)
+        query = dict()
+        if self.parameters.get('destination_vserver') is not None:
+            query['destination-vserver'] = self.parameters['destination_vserver']
+        if self.parameters.get('policy') is not None:
+            query['policy'] = self.parameters['policy']
+        if query:
+            snapmirror_get_iter.translate_struct({'query': {'snapmirror-info': query}})
+
+        relationships = dict()
+        try:
+            for snapmirror_info in netapp_utils.get_zapi_records(self.server, snapmirror_get_iter, self.parameters['max_records']):
+                details = self.get_relationship_details(snapmirror_info)
+                relationships[details['destination_path']] = details
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error fetching snapmirror info: %s' % to_native(error),
+                                  exception=traceback.format_exc())
+        return relationships
+
+    def update_relationship(self, result):
+        '''Trigger a SnapMirror update, and record any error in result'''
+        snapmirror_update = netapp_utils.zapi.NaElement.create_node_with_children(
+            'snapmirror-update', **{'destination-location': result['destination_path']})
+        result['start_time'] = time.time()
+        try:
+            self.get_server().invoke_successfully(snapmirror_update, enable_tunneling=True)
+        except netapp_utils.zapi.NaApiError as error:
+            result['error'] = 'Error updating SnapMirror %s: %s' % (result['destination_path'], to_native(error))
+
+    def set_connection_error(self, result, exc):
+        result['error'] = 'Error connecting to %s: %s' % (self.parameters['hostname'], repr(exc))
+
+    def update_relationships(self, pending):
+        '''Trigger updates with up to max_concurrency workers'''
+        self.worker_pool.run(self.update_relationship, pending, self.set_connection_error)
+
+    @staticmethod
+    def set_transfer_details(result, current):
+        for key in ('lag_time', 'last_transfer_duration', 'last_transfer_size'):
+            result[key] = current[key]
+
+    def wait_for_transfers(self, pending, initial):
+        '''
+        Poll all the relationships with a single query, until every pending transfer is complete
+        A transfer is complete when the relationship is idle, and its last transfer end timestamp has changed
+        '''
+        waiting = dict((result['destination_path'], result) for result in pending)
+
+        def poll():
+            current_relationships = self.get_relationships()
+            now = time.time()
+            for path in list(waiting):
+                current = current_relationships.get(path)
+                if current is None or current['status'] != 'idle' or \
+                        current['last_transfer_end'] == initial[path]['last_transfer_end']:
+                    continue
+                result = waiting.pop(path)
+                result['transfer_time'] = round(now - result['start_time'], 3)
+                self.set_transfer_details(result, current)
+                if current['last_transfer_error']:
+                    result['error'] = 'Error transferring SnapMirror %s: %s' % (path, current['last_transfer_error'])
+            return not waiting, None
+
+        netapp_utils.wait_for_condition(poll, self.parameters['time_out'], max_interval=30)
+        for path, result in waiting.items():
+            result['error'] = 'Error: timed out after %d seconds waiting for SnapMirror %s transfer to complete' \
+                % (self.parameters['time_out'], path)
+
+    @staticmethod
+    def get_skip_reason(current):
+        if current['mirror_state'] != 'snapmirrored':
+            return 'mirror state is %s' % current['mirror_state']
+        if current['status'] != 'idle':
+            return 'relationship is %s' % current['status']
+        return None
+
+    def apply(self):
+        '''Update all the relationships matching the filters, and wait for the transfers together'''
+        netapp_utils.ems_log_event("na_ontap_snapmirror_updates", self.server)
+        relationships = self.get_relationships()
+        results = list()
+        for path in sorted(relationships):
+            current = relationships[path]
+            result = dict(destination_path=path, source_path=current['source_path'], policy=current['policy'], action='update')
+            skipped = self.get_skip_reason(current)
+            if skipped is not None:
+                result['action'] = None
+                result['skipped'] = skipped
+            self.set_transfer_details(result, current)
+            results.append(result)
+        pending = [result for result in results if result['action'] is not None]
+
+        changed = bool(pending)
+        if not self.module.check_mode and pending:
+            self.update_relationships(pending)
+            started = [result for result in pending if 'error' not in result]
+            changed = bool(started)
+            if self.parameters['wait_for_completion']:
+                self.wait_for_transfers(started, relationships)
+
+        errors = list()
+        for result in results:
+            result.pop('start_time', None)
+            if 'error' in result:
+                errors.append(result['error'])
+        if errors:
+            self.module.fail_json(msg='Error updating %d SnapMirror relationship(s): %s' % (len(errors), '; '.join(errors)),
+                                  relationships=results, changed=changed)
+        self.module.exit_json(changed=changed, relationships=results)
+
+
+def main():
+    '''Apply SnapMirror updates from playbook'''
+    obj = NetAppOntapSnapmirrorUpdates()
+    obj.apply()
+
+
+if __name__ == '__main__':
+    main()
@@ -129,9 +129,7 @@ class NetAppONTAPSnmp(object):
         to add an already existing snmp community
         """
         changed = False
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_snmp", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_snmp", self.server, self.module)
         if self.state == 'present':  # add
             if self.add_snmp_community():
                 changed = True
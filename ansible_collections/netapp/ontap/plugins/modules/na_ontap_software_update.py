@@ -80,7 +80,6 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
-import time
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
 
@@ -266,9 +265,7 @@ class NetAppONTAPSoftwareUpdate(object):
         Autosupport log for software_update
         :return:
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_software_update", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_software_update", self.server, self.module)
 
     def apply(self):
         """
@@ -288,10 +285,11 @@ class NetAppONTAPSoftwareUpdate(object):
             if self.parameters.get('state') == 'present' and current:
                 package_exists = self.cluster_image_package_download()
                 if package_exists is False:
-                    cluster_download_progress = self.cluster_image_package_download_progress()
-                    while cluster_download_progress.get('progress_status') == 'async_pkg_get_phase_running':
-                        time.sleep(5)
-                        cluster_download_progress = self.cluster_image_package_download_progress()
+                    def download_done():
+                        progress = self.cluster_image_package_download_progress()
+                        return progress.get('progress_status') != 'async_pkg_get_phase_running', progress
+
+                    dummy, cluster_download_progress = netapp_utils.wait_for_condition(download_done, None, max_interval=5)
                     if cluster_download_progress.get('progress_status') == 'async_pkg_get_phase_complete':
                         changed = True
                     else:
@@ -300,11 +298,13 @@ class NetAppONTAPSoftwareUpdate(object):
                 if self.parameters['download_only'] is False:
                     self.cluster_image_update()
                     changed = True
+
                     # delete package once update is completed
-                    cluster_update_progress = self.cluster_image_update_progress_get()
-                    while not cluster_update_progress or cluster_update_progress.get('overall_status') == 'in_progress':
-                        time.sleep(25)
-                        cluster_update_progress = self.cluster_image_update_progress_get()
+                    def update_done():
+                        progress = self.cluster_image_update_progress_get()
+                        return bool(progress) and progress.get('overall_status') != 'in_progress', progress
+
+                    dummy, cluster_update_progress = netapp_utils.wait_for_condition(update_done, None, max_interval=25)
                     if cluster_update_progress.get('overall_status') == 'completed':
                         self.cluster_image_package_delete()
         self.module.exit_json(changed=changed)
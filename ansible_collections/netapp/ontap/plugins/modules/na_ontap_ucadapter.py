@@ -195,9 +195,7 @@ class NetAppOntapadapter(object):
         Autosupport log for ucadater
         :return:
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_ucadapter", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_ucadapter", self.server, self.module)
 
     def apply(self):
         ''' calling all adapter features '''
@@ -345,7 +345,8 @@ options:
 
   check_interval:
     description:
-    - The amount of time in seconds to wait between checks of a volume to see if it has moved successfully.
+    - The maximum amount of time in seconds to wait between checks of a volume to see if it has moved successfully.
+    - The first check is done after 1 second, and the interval doubles up to check_interval.
     default: 30
     type: int
     version_added: '20.6.0'
@@ -577,7 +578,6 @@ EXAMPLES = """
 RETURN = """
 """
 
-import time
 import traceback
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
@@ -664,6 +664,7 @@ class NetAppOntapVolume(object):
         self.na_helper = NetAppModule()
         self.parameters = self.na_helper.check_and_set_parameters(self.module)
         self.volume_style = None
+        self.job_waiter = None
 
         if self.parameters.get('size'):
             self.parameters['size'] = self.parameters['size'] * \
@@ -877,20 +878,19 @@ class NetAppOntapVolume(object):
             self.ems_log_event("volume-create")
 
             if self.parameters.get('wait_for_completion'):
-                # round off time_out
-                retries = (self.parameters['time_out'] + 5) // 10
-                is_online = None
                 errors = list()
-                while not is_online and retries > 0:
+
+                def poll():
                     try:
                         current = self.get_volume()
-                        is_online = None if current is None else current['is_online']
                     except KeyError as err:
                         # get_volume may receive incomplete data as the volume is being created
                         errors.append(repr(err))
-                    if not is_online:
-                        time.sleep(10)
-                    retries = retries - 1
+                        return False, None
+                    is_online = None if current is None else current['is_online']
+                    return bool(is_online), None
+
+                is_online, dummy = netapp_utils.wait_for_condition(poll, self.parameters['time_out'], max_interval=10)
                 if not is_online:
                     errors.append("Timeout after %s seconds" % self.parameters['time_out'])
                     self.module.fail_json(msg='Error waiting for volume %s to come online: %s'
@@ -1027,37 +1027,36 @@ class NetAppOntapVolume(object):
                                   exception=traceback.format_exc())
 
     def wait_for_volume_move(self):
-        waiting = True
-        fail_count = 0
-        while waiting:
-            volume_move_iter = netapp_utils.zapi.NaElement('volume-move-get-iter')
-            volume_move_info = netapp_utils.zapi.NaElement('volume-move-info')
-            volume_move_info.add_new_child('volume', self.parameters['name'])
-            query = netapp_utils.zapi.NaElement('query')
-            query.add_child_elem(volume_move_info)
-            volume_move_iter.add_child_elem(query)
+        volume_move_iter = netapp_utils.zapi.NaElement('volume-move-get-iter')
+        volume_move_info = netapp_utils.zapi.NaElement('volume-move-info')
+        volume_move_info.add_new_child('volume', self.parameters['name'])
+        query = netapp_utils.zapi.NaElement('query')
+        query.add_child_elem(volume_move_info)
+        volume_move_iter.add_child_elem(query)
+        errors = list()
+
+        def poll():
             try:
                 result = self.cluster.invoke_successfully(volume_move_iter, enable_tunneling=True)
             except netapp_utils.zapi.NaApiError as error:
-                if fail_count < 3:
-                    fail_count += 1
-                    time.sleep(self.parameters['check_interval'])
-                    continue
+                errors.append(error)
+                if len(errors) <= 3:
+                    return False, None
                 self.module.fail_json(msg='Error getting volume move status: %s' % (to_native(error)),
                                       exception=traceback.format_exc())
             # reset fail count to 0
-            fail_count = 0
+            del errors[:]
             volume_move_status = result.get_child_by_name('attributes-list').get_child_by_name('volume-move-info').\
                 get_child_content('state')
             # We have 5 states that can be returned.
             # warning and healthy are state where the move is still going so we don't need to do anything for thouse.
-            if volume_move_status == 'done':
-                waiting = False
             if volume_move_status in ['failed', 'alert']:
                 self.module.fail_json(msg='Error moving volume %s: %s' %
                                           (self.parameters['name'],
                                            result.get_child_by_name('attributes-list')[0].get_child_by_name('details')))
-            time.sleep(self.parameters['check_interval'])
+            return volume_move_status == 'done', None
+
+        netapp_utils.wait_for_condition(poll, None, max_interval=self.parameters['check_interval'])
 
     def rename_volume(self):
         """
@@ -1387,73 +1386,13 @@ class NetAppOntapVolume(object):
                     return current['style_extended']
         return None
 
-    def get_job(self, jobid, server):
-        """
-        Get job details by id
-        """
-        job_get = netapp_utils.zapi.NaElement('job-get')
-        job_get.add_new_child('job-id', jobid)
-        try:
-            result = server.invoke_successfully(job_get, enable_tunneling=True)
-        except netapp_utils.zapi.NaApiError as error:
-            if to_native(error.code) == "15661":
-                # Not found
-                return None
-            self.module.fail_json(msg='Error fetching job info: %s' % to_native(error),
-                                  exception=traceback.format_exc())
-        job_info = result.get_child_by_name('attributes').get_child_by_name('job-info')
-        results = {
-            'job-progress': job_info['job-progress'],
-            'job-state': job_info['job-state']
-        }
-        if job_info.get_child_by_name('job-completion') is not None:
-            results['job-completion'] = job_info['job-completion']
-        else:
-            results['job-completion'] = None
-        return results
-
     def check_job_status(self, jobid):
         """
         Loop until job is complete
         """
-        server = self.server
-        sleep_time = 5
-        time_out = self.parameters['time_out']
-        results = self.get_job(jobid, server)
-        error = 'timeout'
-
-        while time_out > 0:
-            results = self.get_job(jobid, server)
-            # If running as cluster admin, the job is owned by cluster vserver
-            # rather than the target vserver.
-            if results is None and server == self.server:
-                results = netapp_utils.get_cserver(self.server)
-                server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-                continue
-            if results is None:
-                error = 'cannot locate job with id: %d' % int(jobid)
-                break
-            if results['job-state'] in ('queued', 'running'):
-                time.sleep(sleep_time)
-                time_out -= sleep_time
-                continue
-            if results['job-state'] in ('success', 'failure'):
-                break
-            else:
-                self.module.fail_json(msg='Unexpected job status in: %s' % repr(results))
-
-        if results is not None:
-            if results['job-state'] == 'success':
-                error = None
-            elif results['job-state'] in ('queued', 'running'):
-                error = 'job completion exceeded expected timer of: %s seconds' % \
-                        self.parameters['time_out']
-            else:
-                if results['job-completion'] is not None:
-                    error = results['job-completion']
-                else:
-                    error = results['job-progress']
-        return error
+        if self.job_waiter is None:
+            self.job_waiter = netapp_utils.OntapJobWaiter(self.module, self.server)
+        return self.job_waiter.wait_for_job(jobid, self.parameters['time_out'])
 
     def check_invoke_result(self, result, action):
         '''
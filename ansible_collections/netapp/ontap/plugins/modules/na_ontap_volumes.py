@@ -0,0 +1,451 @@
+#!/usr/bin/python
+
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'certified'}
+
+
+DOCUMENTATION = '''
+
+module: na_ontap_volumes
+
+short_description: NetApp ONTAP manage a list of volumes in a single task.
+extends_documentation_fragment:
+    - netapp.ontap.netapp.na_ontap
+version_added: '20.7.0'
+author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
+
+description:
+- Create, destroy, or modify a list of FlexVol volumes on NetApp ONTAP.
+- The current state of all the volumes is fetched with a single paginated volume-get-iter query.
+- Changes are computed locally, and create, delete, or modify operations are dispatched with bounded concurrency.
+- Use na_ontap_volume for FlexGroup volumes and for options not supported in this module.
+
+options:
+
+  vserver:
+    description:
+    - Name of the vserver to use.
+    type: str
+    required: true
+
+  volumes:
+    description:
+    - List of volumes to manage.
+    - Only the options that are set for a volume are compared with the current state.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description:
+        - The name of the volume.
+        type: str
+        required: true
+      state:
+        description:
+        - Whether the volume should exist or not.
+        choices: ['present', 'absent']
+        default: 'present'
+        type: str
+      size:
+        description:
+        - The size of the volume in (size_unit).
+        - Required when creating a volume.
+        type: int
+      size_unit:
+        description:
+        - The unit used to interpret the size parameter.
+        choices: ['bytes', 'b', 'kb', 'mb', 'gb', 'tb', 'pb', 'eb', 'zb', 'yb']
+        default: 'gb'
+        type: str
+      aggregate_name:
+        description:
+        - The name of the aggregate the volume should exist in.
+        - Required when creating a volume.
+        - If the volume exists on another aggregate, a volume move is started.
+        type: str
+      junction_path:
+        description:
+        - Junction path of the volume.
+        - To unmount, use junction path C('').
+        type: str
+      policy:
+        description:
+        - Name of the export policy.
+        type: str
+      snapshot_policy:
+        description:
+        - The name of the snapshot policy.
+        type: str
+      space_guarantee:
+        description:
+        - Space guarantee style for the volume.
+        choices: ['none', 'file', 'volume']
+        type: str
+      percent_snapshot_space:
+        description:
+        - Amount of space reserved for snapshot copies of the volume.
+        type: int
+      volume_security_style:
+        description:
+        - The security style associated with this volume.
+        choices: ['mixed', 'ntfs', 'unified', 'unix']
+        type: str
+      tiering_policy:
+        description:
+        - The tiering policy that is to be associated with the volume.
+        choices: ['snapshot-only', 'auto', 'backup', 'none']
+        type: str
+      qos_policy_group:
+        description:
+        - Specifies a QoS policy group to be set on volume.
+        type: str
+      comment:
+        description:
+        - Sets a comment associated with the volume.
+        type: str
+
+  max_concurrency:
+    description:
+    - Maximum number of volumes being created, deleted, or modified at the same time.
+    - Each worker uses its own connection.
+    type: int
+    default: 4
+
+  max_records:
+    description:
+    - Maximum number of records returned in a single volume-get-iter call.
+    type: int
+    default: 500
+
+'''
+
+EXAMPLES = """
+
+    - name: Create tenant volumes
+      na_ontap_volumes:
+        vserver: ansible
+        volumes:
+          - name: tenant_001
+            aggregate_name: aggr1
+            size: 10
+            policy: default
+            junction_path: /tenant_001
+          - name: tenant_002
+            aggregate_name: aggr2
+            size: 10
+            policy: default
+            junction_path: /tenant_002
+        max_concurrency: 8
+        hostname: "{{ netapp_hostname }}"
+        username: "{{ netapp_username }}"
+        password: "{{ netapp_password }}"
+
+    - name: Resize and delete volumes
+      na_ontap_volumes:
+        vserver: ansible
+        volumes:
+          - name: tenant_001
+            size: 20
+          - name: tenant_002
+            state: absent
+        hostname: "{{ netapp_hostname }}"
+        username: "{{ netapp_username }}"
+        password: "{{ netapp_password }}"
+"""
+
+RETURN = """
+volumes:
+    description: Action taken for each volume, in the order of the volumes option.
+    returned: always
+    type: list
+    sample: [{"name": "tenant_001", "action": "modify", "modify": {"size": 21474836480}},
+             {"name": "tenant_002", "action": "delete"},
+             {"name": "tenant_003", "action": null}]
+"""
+
+import traceback
+
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
+
+HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
+
+# option: (volume-attributes child, attribute), used to read the current state and with volume-modify-iter
+VOLUME_ATTRIBUTES = dict(
+    policy=('volume-export-attributes', 'policy'),
+    snapshot_policy=('volume-snapshot-attributes', 'snapshot-policy'),
+    space_guarantee=('volume-space-attributes', 'space-guarantee'),
+    percent_snapshot_space=('volume-space-attributes', 'percentage-snapshot-reserve'),
+    volume_security_style=('volume-security-attributes', 'style'),
+    tiering_policy=('volume-comp-aggr-attributes', 'tiering-policy'),
+    qos_policy_group=('volume-qos-attributes', 'policy-group-name'),
+    comment=('volume-id-attributes', 'comment'),
+)
+
+# option: volume-create parameter
+CREATE_OPTIONS = dict(
+    aggregate_name='containing-aggr-name',
+    size='size',
+    junction_path='junction-path',
+    policy='export-policy',
+    snapshot_policy='snapshot-policy',
+    space_guarantee='space-reserve',
+    percent_snapshot_space='percentage-snapshot-reserve',
+    volume_security_style='volume-security-style',
+    tiering_policy='tiering-policy',
+    qos_policy_group='qos-policy-group-name',
+    comment='volume-comment',
+)
+
+
+class NetAppOntapVolumes(object):
+    '''Class with bulk volume operations'''
+
+    def __init__(self):
+        '''Initialize module parameters'''
+        self.argument_spec = netapp_utils.na_ontap_host_argument_spec()
+        self.argument_spec.update(dict(
+            vserver=dict(required=True, type='str'),
+            volumes=dict(required=True, type='list', elements='dict', options=dict(
+                name=dict(required=True, type='str'),
+                state=dict(required=False, choices=['present', 'absent'], default='present'),
+                size=dict(type='int'),
+                size_unit=dict(default='gb', choices=['bytes', 'b', 'kb', 'mb', 'gb', 'tb', 'pb', 'eb', 'zb', 'yb'], type='str'),
+                aggregate_name=dict(type='str'),
+                junction_path=dict(type='str'),
+                policy=dict(type='str'),
+                snapshot_policy=dict(type='str'),
+                space_guarantee=dict(choices=['none', 'file', 'volume'], type='str'),
+                percent_snapshot_space=dict(type='int'),
+                volume_security_style=dict(choices=['mixed', 'ntfs', 'unified', 'unix'], type='str'),
+                tiering_policy=dict(choices=['snapshot-only', 'auto', 'backup', 'none'], type='str'),
+                qos_policy_group=dict(type='str'),
+                comment=dict(type='str'),
+            )),
+            max_concurrency=dict(required=False, type='int', default=4),
+            max_records=dict(required=False, type='int', default=500),
+        ))
+        self.module = AnsibleModule(
+            argument_spec=self.argument_spec,
+            supports_check_mode=True
+        )
+        self.na_helper = NetAppModule()
+        self.parameters = self.na_helper.set_parameters(self.module.params)
+        self.volumes = self.get_desired_volumes()
+        self.worker_pool = netapp_utils.OntapWorkerPool(self.module, self.parameters['max_concurrency'], vserver=self.parameters['vserver'])
+
+        if HAS_NETAPP_LIB is False:
+            self.module.fail_json(msg="the python NetApp-Lib module is required")
+        else:
+            self.server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=self.parameters['vserver'])
+
+    def get_desired_volumes(self):
+        '''Remove unset options, convert sizes to bytes, and check for duplicate names'''
+        volumes = list()
+        names = set()
+        for volume in self.parameters['volumes']:
+            desired = dict((key, value) for key, value in volume.items() if value is not None)
+            if desired['name'] in names:
+                self.module.fail_json(msg='Error: volume %s is listed more than once' % desired['name'])
+            names.add(desired['name'])
+            size_unit = desired.pop('size_unit')
+            if desired.get('size') is not None:
+                desired['size'] *= netapp_utils.POW2_BYTE_MAP[size_unit]
+            volumes.append(desired)
+        return volumes
+
+    def get_server(self):
+        '''Return the connection for the current worker thread'''
+        return self.worker_pool.get_server(self.server)
+
+    @staticmethod
+    def get_attribute(volume_attributes, parent, attribute):
+        '''Return the attribute content, or None if the attribute or its parent is not present'''
+        parent_attributes = volume_attributes.get_child_by_name(parent)
+        if parent_attributes is None:
+            return None
+        return parent_attributes.get_child_content(attribute)
+
+    def get_volume_details(self, volume_attributes):
+        '''Convert volume-attributes to a dict of options'''
+        details = dict(
+            name=self.get_attribute(volume_attributes, 'volume-id-attributes', 'name'),
+            aggregate_name=self.get_attribute(volume_attributes, 'volume-id-attributes', 'containing-aggregate-name'),
+            junction_path=self.get_attribute(volume_attributes, 'volume-id-attributes', 'junction-path') or '',
+        )
+        size = self.get_attribute(volume_attributes, 'volume-space-attributes', 'size')
+        details['size'] = int(size) if size is not None else None
+        for option, (parent, attribute) in VOLUME_ATTRIBUTES.items():
+            details[option] = self.get_attribute(volume_attributes, parent, attribute)
+        if details['percent_snapshot_space'] is not None:
+            details['percent_snapshot_space'] = int(details['percent_snapshot_space'])
+        return details
+
+    def get_volumes(self):
+        '''
+        Return the current state of all the volumes, using a single paginated volume-get-iter query
+        :return: dict of volume details, indexed by volume name
+        '''
+        volume_get_iter = netapp_utils.zapi.NaElement('volume-get-iter')
+        query = netapp_utils.zapi.NaElement('query')
+        volume_attributes = netapp_utils.zapi.NaElement('volume-attributes')
+        volume_id_attributes = netapp_utils.zapi.NaElement('volume-id-attributes')
+        volume_id_attributes.add_new_child('name', '|'.join(volume['name'] for volume in self.volumes))
+        volume_id_attributes.add_new_child('vserver', self.parameters['vserver'])
+        volume_attributes.add_child_elem(volume_id_attributes)
+        query.add_child_elem(volume_attributes)
+        volume_get_iter.add_child_elem(query)
+
+        volumes = dict()
+        try:
+            for volume_attributes in netapp_utils.get_zapi_records(self.server, volume_get_iter, self.parameters['max_records']):
+                details = self.get_volume_details(volume_attributes)
+                volumes[details['name']] = details
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error fetching volumes: %s' % to_native(error),
+                                  exception=traceback.format_exc())
+        return volumes
+
+    def create_volume(self, desired):
+        '''Create a FlexVol volume'''
+        if desired.get('aggregate_name') is None or desired.get('size') is None:
+            raise ValueError('aggregate_name and size are required to create a volume')
+        options = dict(volume=desired['name'])
+        for option, zapi_option in CREATE_OPTIONS.items():
+            if desired.get(option) is not None:
+                options[zapi_option] = str(desired[option])
+        volume_create = netapp_utils.zapi.NaElement.create_node_with_children('volume-create', **options)
+        self.get_server().invoke_successfully(volume_create, enable_tunneling=True)
+
+    def delete_volume(self, name):
+        '''Unmount, offline, and delete a FlexVol volume'''
+        volume_delete = netapp_utils.zapi.NaElement.create_node_with_children(
+            'volume-destroy', **{'name': name, 'unmount-and-offline': 'true'})
+        self.get_server().invoke_successfully(volume_delete, enable_tunneling=True)
+
+    def modify_volume_attributes(self, name, modify):
+        '''Modify the attributes listed in VOLUME_ATTRIBUTES with a single volume-modify-iter call'''
+        parents = dict()
+        for option, (parent, attribute) in VOLUME_ATTRIBUTES.items():
+            if option in modify:
+                if parent not in parents:
+                    parents[parent] = netapp_utils.zapi.NaElement(parent)
+                parents[parent].add_new_child(attribute, str(modify[option]))
+        if not parents:
+            return
+        volume_modify_iter = netapp_utils.zapi.NaElement('volume-modify-iter')
+        attributes = netapp_utils.zapi.NaElement('attributes')
+        volume_attributes = netapp_utils.zapi.NaElement('volume-attributes')
+        for parent in parents.values():
+            volume_attributes.add_child_elem(parent)
+        attributes.add_child_elem(volume_attributes)
+        volume_modify_iter.add_child_elem(attributes)
+        query = netapp_utils.zapi.NaElement('query')
+        query_attributes = netapp_utils.zapi.NaElement('volume-attributes')
+        query_id_attributes = netapp_utils.zapi.NaElement('volume-id-attributes')
+        query_id_attributes.add_new_child('name', name)
+        query_attributes.add_child_elem(query_id_attributes)
+        query.add_child_elem(query_attributes)
+        volume_modify_iter.add_child_elem(query)
+        result = self.get_server().invoke_successfully(volume_modify_iter, enable_tunneling=True)
+        failures = result.get_child_by_name('failure-list')
+        if failures is not None and failures.get_child_by_name('volume-modify-iter-info') is not None:
+            raise ValueError(failures['volume-modify-iter-info'].get_child_content('error-message'))
+
+    def modify_volume(self, name, modify):
+        '''Modify volume attributes, then junction path, size, and aggregate'''
+        server = self.get_server()
+        self.modify_volume_attributes(name, modify)
+        if 'junction_path' in modify:
+            if modify['junction_path'] == '':
+                zapi = netapp_utils.zapi.NaElement.create_node_with_children('volume-unmount', **{'volume-name': name})
+            else:
+                zapi = netapp_utils.zapi.NaElement.create_node_with_children(
+                    'volume-mount', **{'volume-name': name, 'junction-path': modify['junction_path']})
+            server.invoke_successfully(zapi, enable_tunneling=True)
+        if 'size' in modify:
+            volume_size = netapp_utils.zapi.NaElement.create_node_with_children(
+                'volume-size', **{'volume': name, 'new-size': str(modify['size'])})
+            server.invoke_successfully(volume_size, enable_tunneling=True)
+        if 'aggregate_name' in modify:
+            # keep it last, the move runs in the background
+            volume_move = netapp_utils.zapi.NaElement.create_node_with_children(
+                'volume-move-start', **{'source-volume': name, 'vserver': self.parameters['vserver'],
+                                        'dest-aggr': modify['aggregate_name']})
+            server.invoke_successfully(volume_move, enable_tunneling=True)
+
+    def apply_action(self, result):
+        '''Run the create, delete, or modify action for a volume, and record any error in result'''
+        try:
+            if result['action'] == 'create':
+                self.create_volume(result['desired'])
+            elif result['action'] == 'delete':
+                self.delete_volume(result['name'])
+            elif result['action'] == 'modify':
+                self.modify_volume(result['name'], result['modify'])
+        except (netapp_utils.zapi.NaApiError, ValueError) as error:
+            result['error'] = 'Error %s volume %s: %s' % (
+                dict(create='creating', delete='deleting', modify='modifying')[result['action']], result['name'], to_native(error))
+
+    def set_connection_error(self, result, exc):
+        result['error'] = 'Error connecting to %s: %s' % (self.parameters['hostname'], repr(exc))
+
+    def apply_actions(self, results):
+        '''Apply actions with up to max_concurrency workers'''
+        pending = [result for result in results if result['action'] is not None]
+        self.worker_pool.run(self.apply_action, pending, self.set_connection_error)
+
+    def apply(self):
+        '''Call create/modify/delete operations for all volumes'''
+        netapp_utils.ems_log_event("na_ontap_volumes", self.server)
+        current_volumes = self.get_volumes()
+        results = list()
+        for desired in self.volumes:
+            current = current_volumes.get(desired['name'])
+            result = dict(name=desired['name'], action=None, desired=desired)
+            cd_action = self.na_helper.get_cd_action(current, desired)
+            if cd_action is not None:
+                result['action'] = cd_action
+            elif current is not None and desired['state'] == 'present':
+                modify = self.na_helper.get_modified_attributes(current, desired)
+                if modify:
+                    result['action'] = 'modify'
+                    result['modify'] = modify
+            results.append(result)
+
+        if not self.module.check_mode:
+            self.apply_actions(results)
+
+        changed = False
+        errors = list()
+        for result in results:
+            del result['desired']
+            if result['action'] is not None and 'error' not in result:
+                changed = True
+            if 'error' in result:
+                errors.append(result['error'])
+        if errors:
+            self.module.fail_json(msg='Error managing %d volume(s): %s' % (len(errors), '; '.join(errors)),
+                                  volumes=results, changed=changed)
+        self.module.exit_json(changed=changed, volumes=results)
+
+
+def main():
+    '''Apply volume operations from playbook'''
+    obj = NetAppOntapVolumes()
+    obj.apply()
+
+
+if __name__ == '__main__':
+    main()
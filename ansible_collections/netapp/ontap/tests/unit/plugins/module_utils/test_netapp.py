@@ -9,6 +9,8 @@ import json
 import os.path
 import pytest
 import tempfile
+import threading
+import time
 
 from ansible.module_utils.ansible_release import __version__ as ansible_version
 from ansible.module_utils import basic
@@ -353,3 +355,551 @@ def test_certificate_method_zapi():
     # for python 2,6 :(
     msg2 = 'SSL certificate authentication requires python 2.7 or later.'
     assert exc.value.args[0]['msg'].startswith((msg1, msg2))
+
+
+def mock_response(status_code=200, json_dict=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = 'content'
+    response.json.return_value = json_dict if json_dict is not None else dict()
+    return response
+
+
+@patch('requests.Session.request')
+def test_session_is_reused(mock_request):
+    ''' the same pooled session is used for all requests '''
+    mock_request.return_value = mock_response(json_dict={'records': []})
+    restApi = create_restapi_object(mock_args())
+    assert restApi.session is None
+    restApi.get('storage/volumes', None)
+    session = restApi.session
+    restApi.get('storage/volumes', None)
+    assert restApi.session is session
+    assert session.auth == ('test_user', 'test_pass!')
+    assert session.verify
+    assert mock_request.call_count == 2
+    assert restApi.get_pool_stats()['requests'] == 2
+    assert restApi.debug_logs[-1] == ('pool', restApi.get_pool_stats())
+
+
+def test_session_cert_and_key():
+    ''' cert and key are set once on the session '''
+    restApi = create_restapi_object(cert_args())
+    session = restApi.get_session()
+    assert session.cert == ('test_pem.pem', 'test_key.key')
+    assert session.auth is None
+    assert session.get_adapter(restApi.url)._pool_maxsize == 10
+
+
+def test_session_no_keep_alive():
+    ''' connection is closed after each request '''
+    module = create_module(mock_args())
+    restApi = netapp_utils.OntapRestAPI(module, pool_maxsize=4, keep_alive=False)
+    session = restApi.get_session()
+    assert session.headers['Connection'] == 'close'
+    assert session.get_adapter(restApi.url)._pool_maxsize == 4
+
+
+def test_pool_stats_without_session():
+    ''' no connection is reported before the first request '''
+    restApi = create_restapi_object(mock_args())
+    assert restApi.get_pool_stats() == dict(requests=0, new_connections=0, reused_connections=0)
+
+
+def create_httpapi_module(args):
+    module = create_module(args)
+    module.fail_json = fail_json
+    module._socket_path = '/dummy/socket'
+    return module
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.Connection')
+def test_rest_through_httpapi(mock_connection):
+    ''' REST requests are sent through the persistent connection '''
+    httpapi = mock_connection.return_value
+    httpapi.send_request.side_effect = [
+        (200, {'records': [{'name': 'vol1'}]}),
+        (404, {'error': {'message': 'entry not found'}}),
+    ]
+    module = create_httpapi_module(mock_args())
+    restApi = netapp_utils.OntapRestAPI(module)
+    assert restApi.auth_method == 'httpapi'
+    json_dict, error = restApi.get('storage/volumes', {'fields': 'name'})
+    assert json_dict == {'records': [{'name': 'vol1'}]}
+    assert error is None
+    httpapi.send_request.assert_called_with(None, method='GET', path='storage/volumes', params={'fields': 'name'}, headers=None)
+    json_dict, error = restApi.get('storage/volumes', None)
+    assert json_dict is None
+    assert error == {'message': 'entry not found'}
+    assert restApi.session is None
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.Connection')
+def test_is_rest_cached_in_httpapi(mock_connection):
+    ''' REST probe is only sent once per persistent connection '''
+    httpapi = mock_connection.return_value
+    httpapi.get_capability.side_effect = [None, True, True]
+    httpapi.send_request.return_value = (200, None)
+    module = create_httpapi_module(mock_args())
+    assert netapp_utils.OntapRestAPI(module).is_rest()
+    httpapi.set_capability.assert_called_with('is_rest', True)
+    assert netapp_utils.OntapRestAPI(module).is_rest()
+    assert httpapi.send_request.call_count == 1
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.Connection')
+def test_zapi_through_httpapi(mock_connection):
+    ''' ZAPI requests are sent through the persistent connection '''
+    httpapi = mock_connection.return_value
+    httpapi.invoke_zapi.return_value = '<netapp><results status="passed"><vserver-name>svm1</vserver-name></results></netapp>'
+    module = create_httpapi_module(mock_args())
+    server = netapp_utils.setup_na_ontap_zapi(module)
+    assert isinstance(server, netapp_utils.OntapZAPIHttpApi)
+    result = server.invoke_successfully(netapp_utils.zapi.NaElement('vserver-get-iter'), True)
+    assert result.get_child_content('vserver-name') == 'svm1'
+    assert '<vserver-get-iter' in httpapi.invoke_zapi.call_args[0][0]
+
+
+def test_get_cserver_cached_in_httpapi():
+    ''' cserver is only looked up once per persistent connection '''
+    server = MockONTAPConnection('vserver', 'svm1')
+    server.httpapi = Mock()
+    server.httpapi.get_capability.return_value = 'cached_svm'
+    assert netapp_utils.get_cserver(server) == 'cached_svm'
+    assert server.xml_in is None
+    server.httpapi.get_capability.return_value = None
+    assert netapp_utils.get_cserver(server) == 'svm1'
+    server.httpapi.set_capability.assert_called_with('cserver', 'svm1')
+
+
+def cache_args(cache_dir, **kwargs):
+    args = mock_args()
+    args.update(dict(cache_ttl=60, cache_dir=cache_dir))
+    args.update(kwargs)
+    return args
+
+
+def test_ontap_cache_set_and_get():
+    ''' values are read back from disk, within cache_ttl '''
+    cache_dir = tempfile.mkdtemp()
+    cache = netapp_utils.get_ontap_cache(create_module(cache_args(cache_dir)))
+    assert cache.get_capability('cserver') is None
+    cache.set_capability('cserver', 'svm1')
+    cache.set_capability('is_rest', False)
+    # a new module run, same host and user
+    cache = netapp_utils.get_ontap_cache(create_module(cache_args(cache_dir)))
+    assert cache.get_capability('cserver') == 'svm1'
+    assert cache.get_capability('is_rest') is False
+    # a different user does not share the cache
+    args = cache_args(cache_dir, username='other_user')
+    assert netapp_utils.get_ontap_cache(create_module(args)).get_capability('cserver') is None
+
+
+def test_ontap_cache_expired_or_invalidated():
+    ''' entries are ignored once expired, or with cache_invalidate '''
+    cache_dir = tempfile.mkdtemp()
+    cache = netapp_utils.get_ontap_cache(create_module(cache_args(cache_dir)))
+    cache.set_capability('cserver', 'svm1')
+    cache = netapp_utils.get_ontap_cache(create_module(cache_args(cache_dir, cache_invalidate=True)))
+    assert cache.get_capability('cserver') is None
+    with patch('time.time', return_value=time.time() + 61):
+        cache = netapp_utils.get_ontap_cache(create_module(cache_args(cache_dir)))
+        assert cache.get_capability('cserver') is None
+
+
+def test_ontap_cache_not_trusted():
+    ''' a cache directory or file writable by others is ignored, and not written to '''
+    cache_dir = tempfile.mkdtemp()
+    cache = netapp_utils.get_ontap_cache(create_module(cache_args(cache_dir)))
+    cache.set_capability('cserver', 'svm1')
+    os.chmod(cache.filepath, 0o666)
+    assert cache.get_capability('cserver') is None
+    os.chmod(cache.filepath, 0o600)
+    assert cache.get_capability('cserver') == 'svm1'
+    os.chmod(cache_dir, 0o777)
+    assert cache.get_capability('cserver') is None
+    cache.set_capability('is_rest', True)
+    os.chmod(cache_dir, 0o700)
+    assert cache.get_capability('is_rest') is None
+
+
+def test_ontap_cache_default_dir():
+    ''' the default cache directory is private to the user '''
+    home = tempfile.mkdtemp()
+    with patch('os.path.expanduser', return_value=home):
+        cache = netapp_utils.get_ontap_cache(create_module(dict(mock_args(), cache_ttl=60)))
+        cache.set_capability('cserver', 'svm1')
+    assert cache.cache_dir == os.path.join(home, '.ansible', 'tmp', 'netapp_ontap_cache')
+    assert os.stat(cache.cache_dir).st_mode & 0o777 == 0o700
+    assert cache.get_capability('cserver') == 'svm1'
+
+
+def test_ontap_cache_disabled():
+    ''' no cache by default '''
+    assert netapp_utils.get_ontap_cache(create_module(mock_args())) is None
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_is_rest_cached_on_disk(mock_request):
+    ''' REST probe is skipped when the result is cached '''
+    mock_request.side_effect = [
+        SRR['is_rest'],
+    ]
+    cache_dir = tempfile.mkdtemp()
+    assert netapp_utils.OntapRestAPI(create_module(cache_args(cache_dir))).is_rest()
+    assert netapp_utils.OntapRestAPI(create_module(cache_args(cache_dir))).is_rest()
+    assert mock_request.call_count == 1
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_is_rest_not_cached_on_auth_error(mock_request):
+    ''' an authentication error is not cached '''
+    mock_request.side_effect = [
+        (401, {}, 'Unauthorized'),
+        SRR['is_rest'],
+    ]
+    cache_dir = tempfile.mkdtemp()
+    assert not netapp_utils.OntapRestAPI(create_module(cache_args(cache_dir))).is_rest()
+    assert netapp_utils.OntapRestAPI(create_module(cache_args(cache_dir))).is_rest()
+
+
+def test_get_cserver_cached_on_disk():
+    ''' cserver is read from the on-disk cache '''
+    cache_dir = tempfile.mkdtemp()
+    server = MockONTAPConnection('vserver', 'svm1')
+    server.ontap_cache = netapp_utils.get_ontap_cache(create_module(cache_args(cache_dir)))
+    assert netapp_utils.get_cserver(server) == 'svm1'
+    server = MockONTAPConnection('vserver', 'svm2')
+    server.ontap_cache = netapp_utils.get_ontap_cache(create_module(cache_args(cache_dir)))
+    assert netapp_utils.get_cserver(server) == 'svm1'
+    assert server.xml_in is None
+
+
+def test_ems_log_event_off():
+    ''' no event is sent '''
+    server = MockONTAPConnection()
+    server.ems_logging = 'off'
+    netapp_utils.ems_log_event('unittest', server)
+    assert server.xml_in is None
+
+
+def test_ems_log_event_deferred():
+    ''' event is only sent when the queue is flushed '''
+    server = MockONTAPConnection()
+    server.ems_logging = 'deferred'
+    netapp_utils.ems_log_event('unittest', server, event='deferred')
+    assert server.xml_in is None
+    assert len(netapp_utils.EMS_QUEUE) == 1
+    netapp_utils.flush_ems_events()
+    assert server.xml_in.get_child_content('event-description') == 'deferred'
+    assert not netapp_utils.EMS_QUEUE
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.setup_na_ontap_zapi')
+def test_ems_log_event_cserver_deferred(mock_setup):
+    ''' admin vserver is only looked up when the event is sent '''
+    args = mock_args()
+    args['ems_logging'] = 'deferred'
+    module = create_module(args)
+    server = MockONTAPConnection('vserver', 'svm1')
+    cserver = MockONTAPConnection()
+    mock_setup.return_value = cserver
+    netapp_utils.ems_log_event_cserver('unittest', server, module)
+    assert server.xml_in is None
+    netapp_utils.flush_ems_events()
+    mock_setup.assert_called_with(module=module, vserver='svm1')
+    assert cserver.xml_in.get_child_content('event-source') == 'unittest'
+
+
+def test_ems_log_event_cserver_off():
+    ''' admin vserver is not looked up '''
+    args = mock_args()
+    args['ems_logging'] = 'off'
+    server = MockONTAPConnection('vserver', 'svm1')
+    netapp_utils.ems_log_event_cserver('unittest', server, create_module(args))
+    assert server.xml_in is None
+    assert not netapp_utils.EMS_QUEUE
+
+
+def job_response(uuid, state, message=None):
+    return ({'uuid': uuid, 'state': state, 'message': message}, None)
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_job_returns_when_terminal(mock_request, mock_sleep):
+    ''' polling backs off from a sub second interval, and stops as soon as the job completes '''
+    mock_request.side_effect = [job_response('abc', 'queued'), job_response('abc', 'running'), job_response('abc', 'running'),
+                                job_response('abc', 'success', 'done'), SRR['end_of_sequence']]
+    rest_api = create_restapi_object(mock_args())
+    job = {'job': {'uuid': 'abc', '_links': {'self': {'href': '/api/cluster/jobs/abc'}}}}
+    message, error = rest_api.wait_on_job(job, increment=1)
+    assert (message, error) == ('done', None)
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [0.5, 1, 1, 1]
+    mock_request.assert_called_with('GET', 'cluster/jobs/abc', None)
+
+
+@patch('time.time')
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_job_timeout(mock_request, mock_sleep, mock_time):
+    ''' an error is reported when the deadline is reached '''
+    clock = [0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    mock_time.side_effect = lambda: clock[0]
+    mock_sleep.side_effect = sleep
+    mock_request.return_value = job_response('abc', 'running', 'still running')
+    rest_api = create_restapi_object(mock_args())
+    message, error = rest_api.wait_on_job({'_links': {'self': {'href': '/api/cluster/jobs/abc'}}}, timeout=10)
+    assert message == 'still running'
+    assert error == 'Timeout error: Process still running after 10 seconds'
+    # the last sleep is capped by the deadline
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [0.5, 1, 2, 4, 2.5]
+    assert mock_request.call_count == 5
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_jobs(mock_request, mock_sleep):
+    ''' several jobs are polled with a single query, until all of them complete '''
+    mock_request.side_effect = [
+        ({'records': [{'uuid': 'a', 'state': 'running'}, {'uuid': 'b', 'state': 'failure', 'message': 'no space'}]}, None),
+        job_response('a', 'success', 'done'),
+        SRR['end_of_sequence']]
+    rest_api = create_restapi_object(mock_args())
+    results = rest_api.wait_on_jobs([{'uuid': 'a'}, {'uuid': 'b'}, {'bad': 'format'}])
+    assert results[0] == ({'uuid': 'a', 'state': 'success', 'message': 'done'}, None)
+    assert results[1] == ({'uuid': 'b', 'state': 'failure', 'message': 'no space'}, None)
+    assert results[2][1].startswith('URL Incorrect format')
+    mock_request.assert_any_call('GET', 'cluster/jobs', {'uuid': 'a|b', 'fields': 'uuid,state,message,code'})
+    assert mock_sleep.call_count == 2
+
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_job_paused(mock_request, mock_sleep):
+    ''' a paused job ends the wait, and its message is reported as the error '''
+    mock_request.side_effect = [
+        job_response('abc', 'paused', 'waiting for an administrator'),
+        SRR['end_of_sequence']]
+    rest_api = create_restapi_object(mock_args())
+    message, error = rest_api.wait_on_job({'uuid': 'abc'})
+    assert message == 'waiting for an administrator'
+    assert error == 'waiting for an administrator'
+    assert mock_sleep.call_count == 1
+
+class MockJobConnection(object):
+    ''' mock a server connection returning job states, each call consumes a state for each job '''
+
+    def __init__(self, states, page_size=None):
+        self.states = states
+        self.page_size = page_size
+        self.requests = list()
+
+    def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
+        self.requests.append(xml)
+        next_tag = None
+        if xml.get_name() == 'job-get':
+            job_ids = [xml.get_child_content('job-id')]
+        else:
+            job_ids = [job_id for job_id in xml['query']['job-info']['job-id'].split('|') if self.states.get(job_id)]
+            if self.page_size:
+                start = int(xml.get_child_content('tag') or 0)
+                if start + self.page_size < len(job_ids):
+                    next_tag = str(start + self.page_size)
+                job_ids = job_ids[start:start + self.page_size]
+        jobs = list()
+        for job_id in job_ids:
+            if self.states.get(job_id):
+                state = self.states[job_id].pop(0) if len(self.states[job_id]) > 1 else self.states[job_id][0]
+                jobs.append({'job-id': job_id, 'job-state': state, 'job-progress': 'progress', 'job-completion': 'completion %s' % job_id})
+        if xml.get_name() == 'job-get':
+            if not jobs:
+                raise netapp_utils.zapi.NaApiError('15661', 'not found')
+            return self.build_job_get(jobs[0])
+        xml = netapp_utils.zapi.NaElement('results')
+        attributes = netapp_utils.zapi.NaElement('attributes-list')
+        for job in jobs:
+            attributes.add_node_with_children('job-info', **job)
+        xml.add_child_elem(attributes)
+        if next_tag is not None:
+            xml.add_new_child('next-tag', next_tag)
+        return xml
+
+    @staticmethod
+    def build_job_get(job):
+        xml = netapp_utils.zapi.NaElement('results')
+        attributes = netapp_utils.zapi.NaElement('attributes')
+        attributes.add_node_with_children('job-info', **job)
+        xml.add_child_elem(attributes)
+        return xml
+
+
+@patch('time.sleep')
+def test_wait_for_condition(mock_sleep):
+    ''' interval doubles up to max_interval, and the result of the last poll is returned '''
+    polls = iter([(False, 1), (False, 2), (False, 3), (False, 4), (True, 5)])
+    assert netapp_utils.wait_for_condition(lambda: next(polls), None, 1, 3) == (True, 5)
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [1, 2, 3, 3]
+
+
+def test_wait_for_condition_timeout_0():
+    ''' poll is called once '''
+    assert netapp_utils.wait_for_condition(lambda: (False, 'running'), 0) == (False, 'running')
+
+
+@patch('time.sleep')
+def test_wait_for_job(mock_sleep):
+    ''' returns as soon as the job completes '''
+    server = MockJobConnection({'1234': ['queued', 'running', 'success']})
+    waiter = netapp_utils.OntapJobWaiter(create_module(mock_args()), server)
+    assert waiter.wait_for_job(1234, 180) is None
+    assert len(server.requests) == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch('time.time')
+@patch('time.sleep')
+def test_wait_for_jobs_single_query(mock_sleep, mock_time):
+    ''' jobs are polled with a single query, errors are reported per job '''
+    clock = [0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    mock_time.side_effect = lambda: clock[0]
+    mock_sleep.side_effect = sleep
+    server = MockJobConnection({'1': ['running', 'success'], '2': ['running', 'running', 'failure'], '3': ['running']})
+    waiter = netapp_utils.OntapJobWaiter(create_module(mock_args()), server)
+    errors = waiter.wait_for_jobs([1, 2, 3], 4)
+    assert errors == {'1': None, '2': 'completion 2', '3': 'job completion exceeded expected timer of: 4 seconds'}
+    assert [request.get_name() for request in server.requests] == ['job-get-iter', 'job-get-iter', 'job-get-iter', 'job-get']
+    assert server.requests[0]['query']['job-info']['job-id'] == '1|2|3'
+    assert server.requests[2]['query']['job-info']['job-id'] == '2|3'
+    # sleeps are 1, 2, then capped by the deadline
+    assert clock[0] == 4
+
+
+@patch('time.sleep')
+def test_wait_for_jobs_paginated(mock_sleep):
+    ''' job-get-iter pages are followed, so no job is reported missing '''
+    server = MockJobConnection(dict((str(job_id), ['success']) for job_id in range(5)), page_size=2)
+    waiter = netapp_utils.OntapJobWaiter(create_module(mock_args()), server)
+    errors = waiter.wait_for_jobs(range(5), 180)
+    assert errors == dict((str(job_id), None) for job_id in range(5))
+    assert len(server.requests) == 3
+    assert server.requests[0].get_child_content('max-records') == '5'
+    assert server.requests[2].get_child_content('tag') == '4'
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.setup_na_ontap_zapi')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.get_cserver')
+def test_wait_for_job_owned_by_cluster(mock_cserver, mock_setup, mock_sleep):
+    ''' the connection to the job owner is created once and reused '''
+    mock_cserver.return_value = 'cserver'
+    owner = MockJobConnection({'1': ['running', 'success'], '2': ['failure']})
+    mock_setup.return_value = owner
+    waiter = netapp_utils.OntapJobWaiter(create_module(mock_args()), MockJobConnection({}))
+    assert waiter.wait_for_job('1', 180) is None
+    assert waiter.wait_for_job('2', 180) == 'completion 2'
+    assert waiter.wait_for_job('3', 180) == 'cannot locate job with id: 3'
+    assert mock_setup.call_count == 1
+    assert len(owner.requests) == 4
+
+
+def test_wait_for_job_unexpected_state():
+    ''' fail on an unknown state '''
+    server = MockJobConnection({'1': ['other']})
+    module = create_module(mock_args())
+    module.fail_json = fail_json
+    waiter = netapp_utils.OntapJobWaiter(module, server)
+    with pytest.raises(AnsibleFailJson) as exc:
+        waiter.wait_for_job('1', 180)
+    assert exc.value.args[0]['msg'].startswith('Unexpected job status in: ')
+
+
+class MockPagingConnection(object):
+    ''' mock an iter ZAPI returning one record per page '''
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.tags = list()
+
+    def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
+        self.tags.append(xml.get_child_content('tag'))
+        index = int(self.tags[-1] or 0)
+        result = netapp_utils.zapi.NaElement('results')
+        attributes = netapp_utils.zapi.NaElement('attributes-list')
+        attributes.add_new_child('record', str(index))
+        result.add_child_elem(attributes)
+        if index + 1 < self.pages:
+            result.add_new_child('next-tag', str(index + 1))
+        return result
+
+
+def test_get_zapi_records():
+    ''' all the pages are read, following next-tag '''
+    server = MockPagingConnection(3)
+    zapi = netapp_utils.zapi.NaElement('volume-get-iter')
+    records = [record.get_content() for record in netapp_utils.get_zapi_records(server, zapi, 1)]
+    assert records == ['0', '1', '2']
+    assert server.tags == [None, '1', '2']
+    assert zapi.get_child_content('max-records') == '1'
+
+
+def mock_connections(servers):
+    ''' return a setup_na_ontap_zapi side effect, returning or raising each item of servers in turn, from any thread '''
+    lock = threading.Lock()
+    servers = list(servers)
+
+    def setup(module, vserver=None):  # pylint: disable=unused-argument
+        with lock:
+            server = servers.pop(0)
+        if isinstance(server, Exception):
+            raise server
+        return server
+    return setup
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.setup_na_ontap_zapi')
+def test_worker_pool_run(mock_setup):
+    ''' a worker that fails to connect leaves its tasks to the connected workers '''
+    mock_setup.side_effect = mock_connections([KeyError('down'), 'server1'])
+    pool = netapp_utils.OntapWorkerPool(create_module(mock_args()), 2, vserver='vserver')
+    results = dict()
+    errors = dict()
+    pool.run(lambda task: results.update({task: pool.get_server()}), list(range(6)),
+             lambda task, exc: errors.update({task: repr(exc)}))
+    assert mock_setup.call_count == 2
+    assert results == dict((task, 'server1') for task in range(6))
+    assert not errors
+    assert pool.get_server('default') == 'default'
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.setup_na_ontap_zapi')
+def test_worker_pool_run_no_connection(mock_setup):
+    ''' connection errors are reported for each task when no worker can connect '''
+    mock_setup.side_effect = mock_connections([KeyError('down'), KeyError('down')])
+    pool = netapp_utils.OntapWorkerPool(create_module(mock_args()), 2)
+    results = dict()
+    errors = dict()
+    pool.run(lambda task: results.update({task: pool.get_server()}), list(range(6)),
+             lambda task, exc: errors.update({task: repr(exc)}))
+    assert not results
+    assert sorted(errors) == list(range(6))
+    assert all('down' in error for error in errors.values())
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.setup_na_ontap_zapi')
+def test_worker_pool_run_sequential(mock_setup):
+    ''' with a single worker, tasks are run in the calling thread '''
+    pool = netapp_utils.OntapWorkerPool(create_module(mock_args()), 1)
+    results = list()
+    pool.run(results.append, [1, 2], None)
+    assert results == [1, 2]
+    assert not mock_setup.called
@@ -241,6 +241,30 @@ class TestMyModule(unittest.TestCase):
         result = my_obj.get_modified_attributes(current, desired, True)
         assert result == {'schedule': ['hourly', 'daily', 'daily']}
 
+    def test_get_modified_attributes_for_list_ignoring_case(self):
+        ''' validate strings in lists are compared without case, as with cmp '''
+        current = {'initiators': ['iqn.1995-08.com.Example:abc', 'IQN.1995-08.com.example:def'], 'state': 'present'}
+        desired = {'initiators': ['iqn.1995-08.com.example:def', 'iqn.1995-08.com.example:ABC'], 'state': 'present'}
+        my_obj = na_helper()
+        assert my_obj.get_modified_attributes(current, desired, False) == {}
+        assert my_obj.get_modified_attributes(current, desired, True) == {}
+
+    def test_get_modified_attributes_for_list_of_nested_dicts_diff(self):
+        ''' validate unhashable elements are compared by value '''
+        current = {'rules': [{'clients': ['1.1.1.1', '2.2.2.2'], 'ro': {'sys'}}, {'clients': ['3.3.3.3'], 'ro': {'any'}}]}
+        desired = {'rules': [{'ro': {'any'}, 'clients': ['3.3.3.3']}, {'clients': ['4.4.4.4'], 'ro': {'sys'}}]}
+        my_obj = na_helper()
+        result = my_obj.get_modified_attributes(current, desired, True)
+        assert result == {'rules': [{'clients': ['4.4.4.4'], 'ro': {'sys'}}]}
+
+    def test_get_modified_attributes_for_large_lists_diff(self):
+        ''' validate large lists with duplicates '''
+        current = {'ports': ['node1:e0%d' % index for index in range(5000)] * 2}
+        desired = {'ports': ['node1:e0%d' % index for index in range(1, 5001)] * 2}
+        my_obj = na_helper()
+        result = my_obj.get_modified_attributes(current, desired, True)
+        assert result == {'ports': ['node1:e05000', 'node1:e05000']}
+
     def test_is_rename_action_for_empty_input(self):
         ''' validate rename action for input None '''
         source = None
@@ -225,3 +225,22 @@ class TestMyModule(unittest.TestCase):
             my_obj.asup_log_for_cserver = Mock(return_value=None)
             my_obj.apply()
             assert 'Error renaming: aggregate test_name2 does not exist' in exc.value.args[0]['msg']
+
+    def test_asup_log_off(self):
+        ''' with ems_logging off, the admin vserver is not looked up '''
+        module_args = self.set_default_args()
+        module_args['ems_logging'] = 'off'
+        set_module_args(module_args)
+        my_obj = my_module()
+        my_obj.server = MockONTAPConnection('aggregate_fail')
+        my_obj.asup_log_for_cserver('na_ontap_aggregate')
+        assert my_obj.server.xml_in is None
+
+    def test_get_aggr_error_not_cluster_admin(self):
+        ''' the admin vserver is looked up on error, to report a vserver connection '''
+        set_module_args(self.set_default_args())
+        my_obj = my_module()
+        my_obj.server = MockONTAPConnection('aggregate_fail')
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.aggr_get_iter('name')
+        assert exc.value.args[0]['msg'].endswith('Added info: %s.' % netapp_utils.ERROR_MSG['no_cserver'])
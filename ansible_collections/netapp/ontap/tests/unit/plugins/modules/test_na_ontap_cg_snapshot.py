@@ -59,12 +59,20 @@ class MockONTAPConnection(object):
         self.parm1 = parm1
         self.xml_in = None
         self.xml_out = None
+        self.calls = list()
 
     def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
         ''' mock invoke_successfully returning xml data '''
         self.xml_in = xml
+        self.calls.append(xml)
         if self.type == 'vserver':
             xml = self.build_vserver_info(self.parm1)
+        elif self.type == 'snapshot':
+            if xml.get_name() == 'snapshot-get-iter':
+                xml = self.build_snapshot_info(self.parm1)
+            elif xml.get_name() == 'cg-start':
+                xml = netapp_utils.zapi.NaElement('xml')
+                xml.add_new_child('cg-id', '123')
         self.xml_out = xml
         return xml
 
@@ -79,6 +87,17 @@ class MockONTAPConnection(object):
         # print(xml.to_string())
         return xml
 
+    @staticmethod
+    def build_snapshot_info(volumes):
+        ''' build xml data for snapshot-info, for each volume that has the snapshot '''
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes = netapp_utils.zapi.NaElement('attributes-list')
+        for volume in volumes:
+            attributes.add_node_with_children('snapshot-info', **{'volume': volume})
+        xml.add_child_elem(attributes)
+        xml.add_new_child('num-records', str(len(volumes)))
+        return xml
+
 
 class TestMyModule(unittest.TestCase):
     ''' a group of related Unit Tests '''
@@ -114,3 +133,45 @@ class TestMyModule(unittest.TestCase):
             my_obj.cgcreate()
         msg = 'Error fetching CG ID for CG commit snapshot'
         assert exc.value.args[0]['msg'] == msg
+
+    def test_single_snapshot_query(self):
+        ''' one query checks all volumes, and only volumes without the snapshot are added to cg-start '''
+        set_module_args({
+            'vserver': 'vserver',
+            'volumes': ['vol1', 'vol2', 'vol3'],
+            'snapshot': 'snapshot',
+            'hostname': 'hostname',
+            'username': 'username',
+            'password': 'password',
+        })
+        my_obj = my_module()
+        my_obj.server = MockONTAPConnection('snapshot', ['vol2'])
+        with patch.object(netapp_utils, 'ems_log_event'):
+            with pytest.raises(AnsibleExitJson) as exc:
+                my_obj.apply()
+        assert exc.value.args[0]['changed']
+        assert sorted(exc.value.args[0]['timing']) == ['cg_commit', 'cg_start', 'snapshot_check']
+        assert [xml.get_name() for xml in my_obj.server.calls] == ['snapshot-get-iter', 'cg-start', 'cg-commit']
+        query = my_obj.server.calls[0]['query']['snapshot-info']
+        assert query.get_child_content('volume') == 'vol1|vol2|vol3'
+        volumes = my_obj.server.calls[1].get_child_by_name('volumes').get_children()
+        assert [volume.get_content() for volume in volumes] == ['vol1', 'vol3']
+
+    def test_snapshot_exists_in_all_volumes(self):
+        ''' cg-start is not issued when all volumes have the snapshot '''
+        set_module_args({
+            'vserver': 'vserver',
+            'volumes': ['vol1', 'vol2'],
+            'snapshot': 'snapshot',
+            'hostname': 'hostname',
+            'username': 'username',
+            'password': 'password',
+        })
+        my_obj = my_module()
+        my_obj.server = MockONTAPConnection('snapshot', ['vol1', 'vol2'])
+        with patch.object(netapp_utils, 'ems_log_event'):
+            with pytest.raises(AnsibleExitJson) as exc:
+                my_obj.apply()
+        assert not exc.value.args[0]['changed']
+        assert list(exc.value.args[0]['timing']) == ['snapshot_check']
+        assert len(my_obj.server.calls) == 1
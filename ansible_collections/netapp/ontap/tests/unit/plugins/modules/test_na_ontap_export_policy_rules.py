@@ -0,0 +1,283 @@
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for ONTAP Ansible module: na_ontap_export_policy_rules '''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import json
+import pytest
+
+from ansible_collections.netapp.ontap.tests.unit.compat import unittest
+from ansible_collections.netapp.ontap.tests.unit.compat.mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+
+from ansible_collections.netapp.ontap.plugins.modules.na_ontap_export_policy_rules \
+    import NetAppOntapExportRules as rules_module  # module under test
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip('skipping as missing required netapp_lib')
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class MockONTAPConnection(object):
+    ''' mock server connection to ONTAP host, keeping the rules of a policy indexed by rule index '''
+
+    def __init__(self, rules=None, page_size=None, policy_exists=True, renumber='shift'):
+        '''
+        rules is a list of (client_match, ro_rule, rw_rule) tuples, with rule indexes starting at 1
+        renumber is how setindex handles an index in use: shift the rules at or after the index, or swap the two rules
+        '''
+        self.rules = dict((index, dict(client_match=client_match, ro_rule=ro_rule, rw_rule=rw_rule))
+                          for index, (client_match, ro_rule, rw_rule) in enumerate(rules or [], 1))
+        self.page_size = page_size
+        self.policy_exists = policy_exists or bool(self.rules)
+        self.renumber = renumber
+        self.calls = list()
+
+    def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
+        ''' mock invoke_successfully returning xml data '''
+        api = xml.get_name()
+        self.calls.append(xml)
+        if api == 'export-rule-get-iter':
+            return self.build_rule_page(xml.get_child_content('tag'))
+        if api == 'export-policy-get-iter':
+            xml = netapp_utils.zapi.NaElement('xml')
+            xml.add_new_child('num-records', '1' if self.policy_exists else '0')
+            return xml
+        if api == 'export-policy-create':
+            self.policy_exists = True
+        index = xml.get_child_content('rule-index')
+        if api == 'export-rule-destroy':
+            del self.rules[int(index)]
+        elif api == 'export-rule-create':
+            if int(index) in self.rules:
+                raise netapp_utils.zapi.NaApiError('15661', 'rule index %s is in use' % index)
+            self.rules[int(index)] = dict(client_match=xml.get_child_content('client-match'),
+                                          ro_rule=xml['ro-rule']['security-flavor'], rw_rule=xml['rw-rule']['security-flavor'])
+        elif api == 'export-rule-modify':
+            if xml.get_child_by_name('rw-rule') is not None:
+                self.rules[int(index)]['rw_rule'] = xml['rw-rule']['security-flavor']
+        elif api == 'export-rule-setindex':
+            self.setindex(int(index), int(xml.get_child_content('new-rule-index')))
+        return netapp_utils.zapi.NaElement('xml')
+
+    def setindex(self, index, new_index):
+        ''' move a rule, the other rules are renumbered when new_index is in use '''
+        rule = self.rules.pop(index)
+        if new_index in self.rules and self.renumber == 'swap':
+            self.rules[index] = self.rules.pop(new_index)
+        elif new_index in self.rules:
+            for other in sorted(self.rules, reverse=True):
+                if other >= new_index:
+                    self.rules[other + 1] = self.rules.pop(other)
+        self.rules[new_index] = rule
+
+    def build_rule_page(self, tag):
+        ''' build xml data for export-rule-info, using the tag as the page index '''
+        indexes = sorted(self.rules)
+        start = int(tag) if tag else 0
+        end = start + self.page_size if self.page_size else len(indexes)
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes_list = netapp_utils.zapi.NaElement('attributes-list')
+        for index in indexes[start:end]:
+            rule = self.rules[index]
+            rule_info = netapp_utils.zapi.NaElement('export-rule-info')
+            rule_info.translate_struct({
+                'client-match': rule['client_match'],
+                'rule-index': str(index),
+                'anonymous-user-id': '65534',
+                'is-allow-set-uid-enabled': 'true',
+                'protocol': [{'access-protocol': 'any'}],
+                'ro-rule': [{'security-flavor': rule['ro_rule']}],
+                'rw-rule': [{'security-flavor': rule['rw_rule']}],
+                'super-user-security': [{'security-flavor': 'any'}]
+            })
+            attributes_list.add_child_elem(rule_info)
+        xml.add_child_elem(attributes_list)
+        xml.add_new_child('num-records', str(len(indexes[start:end])))
+        if end < len(indexes):
+            xml.add_new_child('next-tag', str(end))
+        return xml
+
+    def get_calls(self, api):
+        ''' return the requests for an API '''
+        return [xml for xml in self.calls if xml.get_name() == api]
+
+    def get_order(self):
+        return [self.rules[index]['client_match'] for index in sorted(self.rules)]
+
+
+RULES = [('10.0.0.1', 'sys', 'sys'), ('10.0.0.2', 'sys', 'never'), ('10.0.0.3', 'sys', 'sys')]
+
+
+class TestMyModule(unittest.TestCase):
+    ''' a group of related Unit Tests '''
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule,
+                                                 exit_json=exit_json,
+                                                 fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+
+    @staticmethod
+    def set_default_args(rules, **kwargs):
+        args = dict(
+            hostname='hostname',
+            username='username',
+            password='password',
+            vserver='vserver',
+            name='policy',
+            rules=rules
+        )
+        args.update(kwargs)
+        return args
+
+    @staticmethod
+    def get_rules(rules):
+        return [dict(client_match=client_match, ro_rule=ro_rule, rw_rule=rw_rule) for client_match, ro_rule, rw_rule in rules]
+
+    def call_apply(self, args, server, exc_class=AnsibleExitJson):
+        set_module_args(args)
+        my_obj = rules_module()
+        my_obj.server = server
+        with patch.object(netapp_utils, 'ems_log_event'):
+            with pytest.raises(exc_class) as exc:
+                my_obj.apply()
+        return exc.value.args[0]
+
+    def test_module_fail_when_required_args_missing(self):
+        ''' required arguments are reported as errors '''
+        with pytest.raises(AnsibleFailJson) as exc:
+            set_module_args({})
+            rules_module()
+        print('Info: %s' % exc.value.args[0]['msg'])
+
+    def test_duplicate_client_match(self):
+        ''' a client_match can only be listed once '''
+        set_module_args(self.set_default_args(self.get_rules([('10.0.0.1', 'sys', 'sys'), ('10.0.0.1 ', 'any', 'any')])))
+        with pytest.raises(AnsibleFailJson) as exc:
+            rules_module()
+        assert exc.value.args[0]['msg'] == 'Error: client_match 10.0.0.1 is listed more than once'
+
+    def test_idempotent(self):
+        ''' a single query when all rules match '''
+        server = MockONTAPConnection(RULES)
+        result = self.call_apply(self.set_default_args(self.get_rules(RULES)), server)
+        assert not result['changed']
+        assert result['actions'] == []
+        assert len(server.calls) == 1
+
+    def test_paginated_query(self):
+        ''' rules are collected across pages '''
+        rules = [('10.0.0.%d' % index, 'sys', 'sys') for index in range(1, 6)]
+        server = MockONTAPConnection(rules, page_size=2)
+        result = self.call_apply(self.set_default_args(self.get_rules(rules), max_records=2), server)
+        assert not result['changed']
+        assert len(server.get_calls('export-rule-get-iter')) == 3
+
+    def test_insert_at_top(self):
+        ''' a new first rule is created in a free index, and moved into place '''
+        rules = [('10.0.0.0', 'sys', 'sys')] + RULES
+        for renumber in ('shift', 'swap'):
+            server = MockONTAPConnection(RULES, renumber=renumber)
+            result = self.call_apply(self.set_default_args(self.get_rules(rules)), server)
+            assert result['changed']
+            assert result['actions'][0]['action'] == 'create'
+            assert result['actions'][1] == dict(action='setindex', rule_index=4, new_rule_index=1, client_match='10.0.0.0')
+            assert server.get_order() == ['10.0.0.0', '10.0.0.1', '10.0.0.2', '10.0.0.3']
+            assert sorted(server.rules) == [1, 2, 3, 4]
+
+    def test_create_modify_delete_reorder(self):
+        ''' creates are applied first and deletes last, the indexes are read again after each move '''
+        rules = [('10.0.0.3', 'sys', 'sys'), ('10.0.0.4', 'sys', 'sys'), ('10.0.0.2', 'sys', 'sys')]
+        for renumber in ('shift', 'swap'):
+            server = MockONTAPConnection(RULES, renumber=renumber)
+            result = self.call_apply(self.set_default_args(self.get_rules(rules)), server)
+            assert result['changed']
+            actions = [action['action'] for action in result['actions']]
+            assert actions[:2] == ['create', 'modify']
+            assert actions[-1] == 'delete'
+            assert set(actions[2:-1]) == set(['setindex'])
+            assert result['actions'][1]['modify'] == {'rw_rule': ['sys']}
+            assert result['actions'][-1]['client_match'] == '10.0.0.1'
+            assert server.get_order() == ['10.0.0.3', '10.0.0.4', '10.0.0.2']
+            assert sorted(server.rules) == [1, 2, 3]
+            assert server.rules[3]['rw_rule'] == 'sys'
+            # one query to start, and one after each move
+            assert len(server.get_calls('export-rule-get-iter')) == 2 + len(server.get_calls('export-rule-setindex'))
+
+    def test_reversed_order(self):
+        ''' the order converges whatever the renumbering '''
+        rules = [('10.0.0.%d' % index, 'sys', 'sys') for index in range(1, 7)]
+        for renumber in ('shift', 'swap'):
+            server = MockONTAPConnection(rules, renumber=renumber)
+            result = self.call_apply(self.set_default_args(self.get_rules(list(reversed(rules)))), server)
+            assert result['changed']
+            assert server.get_order() == [rule[0] for rule in reversed(rules)]
+            assert sorted(server.rules) == list(range(1, 7))
+
+    def test_delete_all(self):
+        ''' an empty list deletes all the rules, starting with the last one '''
+        server = MockONTAPConnection(RULES)
+        result = self.call_apply(self.set_default_args([]), server)
+        assert result['changed']
+        assert [action['rule_index'] for action in result['actions']] == [3, 2, 1]
+        assert server.rules == {}
+
+    def test_create_policy(self):
+        ''' the policy is created if needed '''
+        server = MockONTAPConnection(policy_exists=False)
+        result = self.call_apply(self.set_default_args(self.get_rules(RULES)), server)
+        assert result['changed']
+        assert len(server.get_calls('export-policy-create')) == 1
+        assert server.get_order() == ['10.0.0.1', '10.0.0.2', '10.0.0.3']
+        assert not server.get_calls('export-rule-setindex')
+
+    def test_check_mode(self):
+        ''' actions are reported, no change is made in check mode '''
+        server = MockONTAPConnection(RULES)
+        args = self.set_default_args(self.get_rules(list(reversed(RULES))))
+        args['_ansible_check_mode'] = True
+        result = self.call_apply(args, server)
+        assert result['changed']
+        assert [action['action'] for action in result['actions']] == ['setindex', 'setindex']
+        assert len(server.calls) == 1
+
+    def test_missing_options_for_create(self):
+        ''' ro_rule and rw_rule are required to create a rule '''
+        server = MockONTAPConnection(RULES)
+        rules = self.get_rules(RULES) + [dict(client_match=['10.0.0.4'], ro_rule=['sys'])]
+        result = self.call_apply(self.set_default_args(rules), server, AnsibleFailJson)
+        assert result['msg'] == 'Error: ro_rule and rw_rule are required to create export policy rule 10.0.0.4'
@@ -131,7 +131,8 @@ class TestMyModule(unittest.TestCase):
             'bind_portset': 'true',
             'hostname': 'hostname',
             'username': 'username',
-            'password': 'password'
+            'password': 'password',
+            'use_rest': 'Never'
         }
 
     def get_igroup_mock_object(self, kind=None):
@@ -188,7 +189,7 @@ class TestMyModule(unittest.TestCase):
             current = obj.get_igroup(data['name'])
             obj.apply()
         remove.assert_called_with(current['initiators'])
-        add.assert_called_with()
+        add.assert_called_with(['replacewithme'])
 
     @patch('ansible_collections.netapp.ontap.plugins.modules.na_ontap_igroup.NetAppOntapIgroup.modify_initiator')
     def test_modify_called_from_add(self, modify):
@@ -211,7 +212,8 @@ class TestMyModule(unittest.TestCase):
         set_module_args(data)
         with pytest.raises(AnsibleExitJson) as exc:
             self.get_igroup_mock_object('igroup').apply()
-        modify.assert_called_with('init2', remove)
+        modify.assert_any_call('init1', remove)
+        modify.assert_any_call('init2', remove)
         assert modify.call_count == 2  # remove existing 2, add nothing
 
     @patch('ansible_collections.netapp.ontap.plugins.modules.na_ontap_igroup.NetAppOntapIgroup.add_initiators')
@@ -258,3 +260,67 @@ class TestMyModule(unittest.TestCase):
         with pytest.raises(AnsibleExitJson) as exc:
             self.get_igroup_mock_object().apply()
         assert exc.value.args[0]['changed']
+
+    @patch('ansible_collections.netapp.ontap.plugins.modules.na_ontap_igroup.NetAppOntapIgroup.modify_initiator')
+    def test_modify_only_changes(self, modify):
+        '''Test only the missing initiators are added, and only the extra ones are removed'''
+        data = self.mock_args()
+        data['initiators'] = ['INIT1', 'init3', ' init3']
+        set_module_args(data)
+        with pytest.raises(AnsibleExitJson) as exc:
+            self.get_igroup_mock_object('igroup').apply()
+        assert exc.value.args[0]['changed']
+        assert modify.call_args_list == [(('init3', 'igroup-add'),), (('init2', 'igroup-remove'),)]
+
+    @patch('ansible_collections.netapp.ontap.plugins.modules.na_ontap_igroup.NetAppOntapIgroup.modify_initiator')
+    def test_modify_idempotent(self, modify):
+        '''Test initiators are compared without case'''
+        data = self.mock_args()
+        data['initiators'] = ['INIT2', 'init1']
+        set_module_args(data)
+        with pytest.raises(AnsibleExitJson) as exc:
+            self.get_igroup_mock_object('igroup').apply()
+        assert not exc.value.args[0]['changed']
+        assert modify.call_count == 0
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.setup_na_ontap_zapi')
+    def test_concurrent_errors(self, mock_setup):
+        '''Test each worker uses its own connection, and errors are reported together'''
+        data = self.mock_args()
+        data['initiators'] = ['init%d' % index for index in range(10)]
+        data['max_concurrency'] = 3
+        set_module_args(data)
+        worker_server = Mock()
+        worker_server.invoke_successfully.side_effect = netapp_utils.zapi.NaApiError('test', 'no such initiator')
+        mock_setup.return_value = worker_server
+        obj = self.get_igroup_mock_object('igroup_no_initiators')
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj.apply()
+        assert worker_server.invoke_successfully.call_count == 10
+        assert exc.value.args[0]['msg'].count('no such initiator') == 10
+        assert exc.value.args[0]['msg'].startswith('Error modifying igroup initiator test: init')
+        # 1 connection for the module, 3 for the workers
+        assert mock_setup.call_count == 4
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_rest_bulk_add(self, mock_request):
+        '''Test initiators are added with a single REST request'''
+        data = self.mock_args()
+        data['initiators'] = ['init1', 'init3', 'init4']
+        data['use_rest'] = 'Always'
+        data['max_concurrency'] = 1
+        set_module_args(data)
+        mock_request.side_effect = [
+            ({'records': [{'uuid': 'abcd'}]}, None),    # get uuid
+            (None, None),                               # add init3 and init4
+            (None, None),                               # remove init2
+        ]
+        obj = self.get_igroup_mock_object('igroup')
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj.apply()
+        assert exc.value.args[0]['changed']
+        assert mock_request.call_count == 3
+        args = mock_request.call_args_list[1][0]
+        assert args[:2] == ('POST', 'protocols/san/igroups/abcd/initiators')
+        assert mock_request.call_args_list[1][1]['json'] == {'records': [{'name': 'init3'}, {'name': 'init4'}]}
+        assert mock_request.call_args_list[2][0][:2] == ('DELETE', 'protocols/san/igroups/abcd/initiators/init2')
@@ -17,6 +17,7 @@ import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_ut
 
 from ansible_collections.netapp.ontap.plugins.modules.na_ontap_info import main as info_main
 from ansible_collections.netapp.ontap.plugins.modules.na_ontap_info import __finditem as info_finditem
+from ansible_collections.netapp.ontap.plugins.modules.na_ontap_info import zapi_to_dict
 from ansible_collections.netapp.ontap.plugins.modules.na_ontap_info \
     import NetAppONTAPGatherInfo as info_module  # module under test
 
@@ -77,6 +78,14 @@ class MockONTAPConnection(object):
             self.type = 'net_ifgrp'
         elif self.type == 'net_ifgrp':
             xml = self.build_net_ifgrp_info()
+        elif self.type == 'net_port_paged':
+            # first page returns node_0 with a next-tag, second page returns node_1
+            xml = self.build_net_port_page(0 if xml.get_child_by_name('tag') is None else 1)
+        elif self.type == 'net_port_and_ifgrp':
+            if xml.get_name() == 'net-port-ifgrp-get':
+                xml = self.build_net_ifgrp_info()
+            else:
+                xml = self.build_net_port_info('with_ifgrp')
         elif self.type == 'zapi_error':
             error = netapp_utils.zapi.NaApiError('test', 'error')
             raise error
@@ -121,6 +130,20 @@ class MockONTAPConnection(object):
         xml.add_child_elem(attributes_list)
         return xml
 
+    @staticmethod
+    def build_net_port_page(page):
+        ''' build xml data for a page of net-port-info '''
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes_list = netapp_utils.zapi.NaElement('attributes-list')
+        net_port_info = netapp_utils.zapi.NaElement('net-port-info')
+        net_port_info.add_new_child('node', 'node_%d' % page)
+        net_port_info.add_new_child('port', 'port_%d' % page)
+        attributes_list.add_child_elem(net_port_info)
+        xml.add_child_elem(attributes_list)
+        if page == 0:
+            xml.add_new_child('next-tag', 'page_1')
+        return xml
+
     @staticmethod
     def build_net_ifgrp_info():
         ''' build xml data for net-ifgrp-info '''
@@ -452,3 +475,83 @@ class TestMyModule(unittest.TestCase):
             obj.warnings.remove(msg)
         # make sure there is no extra warnings (eg we found and removed all of them)
         assert obj.warnings == list()
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.setup_na_ontap_zapi')
+    def test_get_subsets_in_parallel(self, mock_setup):
+        ''' subsets are collected by workers, net_ifgrp_info uses net_port_info '''
+        set_module_args(self.mock_args())
+        obj = self.get_info_mock_object('vserver')
+        mock_setup.side_effect = lambda module, vserver=None: MockONTAPConnection('net_port_and_ifgrp')
+        obj.max_concurrency = 4
+        obj.get_subsets_in_parallel(set(['net_port_info', 'net_ifgrp_info']))
+        # one connection for the main thread, and one per worker
+        assert mock_setup.call_count == 3
+        assert obj.netapp_info['net_port_info'].get('node_0:port_0')
+        assert obj.netapp_info['net_ifgrp_info'].get('node_0:ifgrp_0')
+        assert obj.netapp_info['net_ifgrp_info'].get('node_1:ifgrp_1')
+        # the main connection is not used by workers
+        assert obj.server.xml_in is None
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.setup_na_ontap_zapi')
+    def test_get_subsets_in_parallel_error(self, mock_setup):
+        ''' an error in a worker is reported by the main thread '''
+        set_module_args(self.mock_args())
+        obj = self.get_info_mock_object('vserver')
+        mock_setup.side_effect = lambda module, vserver=None: MockONTAPConnection('zapi_error')
+        obj.max_concurrency = 2
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj.get_subsets_in_parallel(set(['net_port_info', 'net_ifgrp_info', 'volume_info']))
+        assert exc.value.args[0]['msg'].startswith('Error calling API')
+        assert 'net_ifgrp_info' not in obj.netapp_info
+
+    def test_order_subsets(self):
+        ''' a subset is always collected after its dependencies '''
+        set_module_args(self.mock_args())
+        obj = self.get_info_mock_object('vserver')
+        ordered = obj.order_subsets(set(['net_ifgrp_info', 'aggregate_info', 'net_port_info']))
+        assert ordered == ['aggregate_info', 'net_port_info', 'net_ifgrp_info']
+
+    def test_zapi_to_dict(self):
+        ''' nested elements, repeated tags, empty elements, and key translation '''
+        xml = netapp_utils.zapi.NaElement('volume-attributes')
+        xml.translate_struct({'volume-id-attributes': {'name': 'vol1', 'junction-path': ' ', 'comment': None}})
+        aggr_list = netapp_utils.zapi.NaElement('aggr-list')
+        aggr_list.add_new_child('aggr-name', 'aggr1')
+        aggr_list.add_new_child('aggr-name', 'aggr2')
+        xml.add_child_elem(aggr_list)
+        expected = {
+            'volume_id_attributes': {'name': 'vol1', 'junction_path': None, 'comment': None},
+            'aggr_list': {'aggr_name': ['aggr1', 'aggr2']},
+        }
+        assert zapi_to_dict(xml, True) == expected
+        native = zapi_to_dict(xml, False)
+        assert native['volume-id-attributes']['junction-path'] is None
+        assert native['aggr-list'] == {'aggr-name': ['aggr1', 'aggr2']}
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.ems_log_event')
+    def test_get_generic_get_iter_native_tags(self, mock_ems_log):
+        ''' key fields are found with or without key translation '''
+        set_module_args(self.mock_args())
+        obj = self.get_info_mock_object('net_ifgrp')
+        obj.translate_keys = False
+        result = obj.get_generic_get_iter('net-port-ifgrp-get', key_fields=('node', 'ifgrp-name'),
+                                          attribute='net-ifgrp-info', attributes_list_tag='attributes')
+        assert result['node_0:ifgrp_0'] == {'ifgrp-name': 'ifgrp_0', 'node': 'node_0'}
+
+    def test_get_generic_get_iter_pages(self):
+        ''' records from all pages are returned '''
+        set_module_args(self.mock_args())
+        obj = self.get_info_mock_object('net_port_paged')
+        result = obj.get_generic_get_iter('net-port-get-iter', attribute='net-port-info', key_fields=('node', 'port'),
+                                          query={'max-records': '1'})
+        assert sorted(result.keys()) == ['node_0:port_0', 'node_1:port_1']
+        assert obj.server.xml_in.get_child_content('tag') == 'page_1'
+        assert obj.server.xml_in.get_child_content('max-records') == '1'
+
+    def test_call_api_pages(self):
+        ''' records from all pages are merged '''
+        set_module_args(self.mock_args())
+        obj = self.get_info_mock_object('net_port_paged')
+        result, error = obj.call_api('net-port-get-iter')
+        assert error is None
+        assert len(result.get_child_by_name('attributes-list').get_children()) == 2
@@ -0,0 +1,270 @@
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for ONTAP Ansible module: na_ontap_quota_rules '''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import json
+import pytest
+
+from ansible_collections.netapp.ontap.tests.unit.compat import unittest
+from ansible_collections.netapp.ontap.tests.unit.compat.mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+
+from ansible_collections.netapp.ontap.plugins.modules.na_ontap_quota_rules \
+    import NetAppOntapQuotaRules as quota_module  # module under test
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip('skipping as missing required netapp_lib')
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class MockONTAPConnection(object):
+    ''' mock server connection to ONTAP host, keeping the quota rules indexed by (type, target, qtree) '''
+
+    def __init__(self, rules=None, status='on', page_size=None, fail_api=None):
+        ''' rules is a list of (type, target, disk_limit) tuples '''
+        self.rules = dict(((quota_type, target, ''), disk_limit) for quota_type, target, disk_limit in rules or [])
+        self.status = status
+        self.page_size = page_size
+        self.fail_api = fail_api
+        self.calls = list()
+
+    def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
+        ''' mock invoke_successfully returning xml data '''
+        api = xml.get_name()
+        self.calls.append(xml)
+        if api == self.fail_api:
+            raise netapp_utils.zapi.NaApiError(code='TEST', message='forced error')
+        result = netapp_utils.zapi.NaElement('xml')
+        if api == 'quota-list-entries-iter':
+            return self.build_quota_page(xml.get_child_content('tag'))
+        if api == 'quota-status':
+            result.add_new_child('status', self.status)
+            return result
+        key = (xml.get_child_content('quota-type'), xml.get_child_content('quota-target'), xml.get_child_content('qtree') or '')
+        if api == 'quota-set-entry':
+            self.rules[key] = xml.get_child_content('disk-limit')
+        elif api == 'quota-delete-entry':
+            del self.rules[key]
+        elif api == 'quota-modify-entry':
+            self.rules[key] = xml.get_child_content('disk-limit')
+        elif api == 'quota-off':
+            self.status = 'off'
+        elif api in ('quota-on', 'quota-resize'):
+            self.status = 'on'
+            result.add_new_child('result-jobid', '1234')
+        return result
+
+    def build_quota_page(self, tag):
+        ''' build xml data for quota-entry, using the tag as the page index '''
+        keys = sorted(self.rules)
+        start = int(tag) if tag else 0
+        end = start + self.page_size if self.page_size else len(keys)
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes_list = netapp_utils.zapi.NaElement('attributes-list')
+        for quota_type, target, qtree in keys[start:end]:
+            quota_entry = netapp_utils.zapi.NaElement('quota-entry')
+            quota_entry.translate_struct({
+                'quota-type': quota_type,
+                'quota-target': target,
+                'qtree': qtree,
+                'disk-limit': self.rules[(quota_type, target, qtree)],
+                'file-limit': '-',
+                'threshold': '-'
+            })
+            attributes_list.add_child_elem(quota_entry)
+        xml.add_child_elem(attributes_list)
+        xml.add_new_child('num-records', str(len(keys[start:end])))
+        if end < len(keys):
+            xml.add_new_child('next-tag', str(end))
+        return xml
+
+    def get_apis(self):
+        ''' return the list of APIs called '''
+        return [xml.get_name() for xml in self.calls]
+
+
+# disk limits are reported in KB by ONTAP
+RULES = [('user', 'alice', '10485760'), ('user', 'bob', '20971520'), ('tree', 'q1', '1073741824')]
+RULES_WITH_UNITS = [('user', 'alice', '10GB'), ('user', 'bob', '20 gb'), ('tree', 'q1', '1TB')]
+
+
+class TestMyModule(unittest.TestCase):
+    ''' a group of related Unit Tests '''
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule,
+                                                 exit_json=exit_json,
+                                                 fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+
+    @staticmethod
+    def set_default_args(rules, **kwargs):
+        args = dict(
+            hostname='hostname',
+            username='username',
+            password='password',
+            vserver='vserver',
+            volume='volume',
+            rules=rules
+        )
+        args.update(kwargs)
+        return args
+
+    @staticmethod
+    def get_rules(rules):
+        return [dict(type=quota_type, quota_target=target, disk_limit=disk_limit) for quota_type, target, disk_limit in rules]
+
+    def call_apply(self, args, server, exc_class=AnsibleExitJson):
+        set_module_args(args)
+        my_obj = quota_module()
+        my_obj.server = server
+        with patch.object(netapp_utils, 'ems_log_event'):
+            with patch.object(netapp_utils.OntapJobWaiter, 'wait_for_job', return_value=None) as mock_wait:
+                with pytest.raises(exc_class) as exc:
+                    my_obj.apply()
+        self.mock_wait = mock_wait
+        return exc.value.args[0]
+
+    def test_module_fail_when_required_args_missing(self):
+        ''' required arguments are reported as errors '''
+        with pytest.raises(AnsibleFailJson) as exc:
+            set_module_args({})
+            quota_module()
+        print('Info: %s' % exc.value.args[0]['msg'])
+
+    def test_duplicate_rule(self):
+        ''' a rule can only be listed once '''
+        set_module_args(self.set_default_args(self.get_rules([('user', 'alice', '1GB'), ('user', 'alice', '2GB')])))
+        with pytest.raises(AnsibleFailJson) as exc:
+            quota_module()
+        assert exc.value.args[0]['msg'] == 'Error: quota rule user alice (qtree: "") is listed more than once'
+
+    def test_idempotent(self):
+        ''' a single query when all rules match '''
+        server = MockONTAPConnection(RULES)
+        result = self.call_apply(self.set_default_args(self.get_rules(RULES)), server)
+        assert not result['changed']
+        assert result['activation'] is None
+        assert server.get_apis() == ['quota-list-entries-iter']
+
+    def test_idempotent_with_units(self):
+        ''' sizes with a unit are converted to KB before they are compared '''
+        server = MockONTAPConnection(RULES)
+        result = self.call_apply(self.set_default_args(self.get_rules(RULES_WITH_UNITS)), server)
+        assert not result['changed']
+        assert server.get_apis() == ['quota-list-entries-iter']
+
+    def test_invalid_size(self):
+        ''' a size with an unknown unit is rejected '''
+        set_module_args(self.set_default_args(self.get_rules([('user', 'alice', '10GiB')])))
+        with pytest.raises(AnsibleFailJson) as exc:
+            quota_module()
+        assert exc.value.args[0]['msg'].startswith('Error: disk_limit for quota rule user alice must be "-", a number of KB')
+
+    def test_paginated_query(self):
+        ''' rules are collected across pages '''
+        server = MockONTAPConnection(RULES, page_size=2)
+        result = self.call_apply(self.set_default_args(self.get_rules(RULES), max_records=2), server)
+        assert not result['changed']
+        assert server.get_apis() == ['quota-list-entries-iter'] * 2
+
+    def test_modify_uses_resize(self):
+        ''' limit changes are activated with a single quota-resize '''
+        server = MockONTAPConnection(RULES)
+        rules = self.get_rules([('user', 'alice', '15GB'), ('user', 'bob', '25GB')])
+        result = self.call_apply(self.set_default_args(rules), server)
+        assert result['changed']
+        assert result['activation'] == 'resize'
+        assert [rule['modify'] for rule in result['rules']] == [{'disk_limit': '15728640'}, {'disk_limit': '26214400'}]
+        assert server.get_apis() == ['quota-list-entries-iter', 'quota-status', 'quota-modify-entry', 'quota-modify-entry',
+                                     'quota-resize']
+        assert server.rules[('user', 'bob', '')] == '26214400'
+        self.mock_wait.assert_called_once_with('1234', 180)
+
+    def test_create_delete_reinitialize(self):
+        ''' adding or deleting rules requires quotas to be turned off and on, once '''
+        server = MockONTAPConnection(RULES)
+        rules = self.get_rules([('user', 'carol', '5GB'), ('user', 'alice', '15GB')])
+        rules.append(dict(type='user', quota_target='bob', state='absent'))
+        result = self.call_apply(self.set_default_args(rules), server)
+        assert result['changed']
+        assert result['activation'] == 'reinitialize'
+        assert [rule['action'] for rule in result['rules']] == ['create', 'modify', 'delete']
+        assert server.get_apis() == ['quota-list-entries-iter', 'quota-status', 'quota-set-entry', 'quota-modify-entry',
+                                     'quota-delete-entry', 'quota-off', 'quota-on']
+        assert sorted(server.rules) == [('tree', 'q1', ''), ('user', 'alice', ''), ('user', 'carol', '')]
+
+    def test_activate_resize_forced(self):
+        ''' activate overrides the auto choice '''
+        server = MockONTAPConnection(RULES)
+        rules = self.get_rules([('user', 'carol', '5GB')])
+        result = self.call_apply(self.set_default_args(rules, activate='resize', wait_for_completion=False), server)
+        assert result['activation'] == 'resize'
+        assert server.get_apis()[-1] == 'quota-resize'
+        assert not self.mock_wait.called
+
+    def test_quotas_off(self):
+        ''' no activation when quotas are off '''
+        server = MockONTAPConnection(RULES, status='off')
+        result = self.call_apply(self.set_default_args(self.get_rules([('user', 'carol', '5GB')])), server)
+        assert result['changed']
+        assert result['activation'] is None
+        assert server.get_apis()[-1] == 'quota-set-entry'
+
+    def test_set_quota_status_on(self):
+        ''' quota-on activates all the changes '''
+        server = MockONTAPConnection(RULES, status='off')
+        rules = self.get_rules([('user', 'carol', '5GB')])
+        result = self.call_apply(self.set_default_args(rules, set_quota_status=True), server)
+        assert result['activation'] == 'on'
+        assert server.get_apis() == ['quota-list-entries-iter', 'quota-status', 'quota-set-entry', 'quota-on']
+
+    def test_check_mode(self):
+        ''' actions are reported, no change is made in check mode '''
+        server = MockONTAPConnection(RULES)
+        args = self.set_default_args(self.get_rules([('user', 'alice', '15GB')]))
+        args['_ansible_check_mode'] = True
+        result = self.call_apply(args, server)
+        assert result['changed']
+        assert result['activation'] == 'resize'
+        assert server.get_apis() == ['quota-list-entries-iter', 'quota-status']
+
+    def test_error(self):
+        ''' errors are reported with the rule '''
+        server = MockONTAPConnection(RULES, fail_api='quota-modify-entry')
+        result = self.call_apply(self.set_default_args(self.get_rules([('user', 'alice', '15GB')])), server, AnsibleFailJson)
+        assert result['msg'] == 'Error modifying quota entry user alice for volume: NetApp API failed. Reason - TEST:forced error'
@@ -0,0 +1,243 @@
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for ONTAP Ansible module: na_ontap_snapmirror_updates '''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import json
+import pytest
+
+from ansible_collections.netapp.ontap.tests.unit.compat import unittest
+from ansible_collections.netapp.ontap.tests.unit.compat.mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+
+from ansible_collections.netapp.ontap.plugins.modules.na_ontap_snapmirror_updates \
+    import NetAppOntapSnapmirrorUpdates as updates_module  # module under test
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip('skipping as missing required netapp_lib')
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class MockONTAPConnection(object):
+    ''' mock server connection to ONTAP host, keeping the relationships indexed by destination path
+        a transfer completes after transfer_polls snapmirror-get-iter calls
+    '''
+
+    def __init__(self, relationships=None, page_size=None, transfer_polls=1, fail_update=None, transfer_error=None):
+        self.relationships = dict()
+        for index, (path, state, status) in enumerate(relationships or []):
+            self.relationships[path] = dict(state=state, status=status, end=str(1000 + index), lag=3600, polls=None)
+        self.page_size = page_size
+        self.transfer_polls = transfer_polls
+        self.fail_update = fail_update
+        self.transfer_error = transfer_error
+        self.calls = list()
+
+    def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
+        ''' mock invoke_successfully returning xml data '''
+        api = xml.get_name()
+        self.calls.append(xml)
+        if api == 'snapmirror-get-iter':
+            self.progress_transfers()
+            return self.build_snapmirror_page(xml.get_child_content('tag'))
+        if api == 'snapmirror-update':
+            path = xml.get_child_content('destination-location')
+            if path == self.fail_update:
+                raise netapp_utils.zapi.NaApiError(code='TEST', message='forced error')
+            self.relationships[path]['status'] = 'transferring'
+            self.relationships[path]['polls'] = self.transfer_polls
+        return netapp_utils.zapi.NaElement('xml')
+
+    def progress_transfers(self):
+        for relationship in self.relationships.values():
+            if relationship['polls'] is None:
+                continue
+            if relationship['polls'] == 0:
+                relationship.update(status='idle', end=str(int(relationship['end']) + 5000), lag=10, polls=None)
+            else:
+                relationship['polls'] -= 1
+
+    def build_snapmirror_page(self, tag):
+        ''' build xml data for snapmirror-info, using the tag as the page index '''
+        paths = sorted(self.relationships)
+        start = int(tag) if tag else 0
+        end = start + self.page_size if self.page_size else len(paths)
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes_list = netapp_utils.zapi.NaElement('attributes-list')
+        for path in paths[start:end]:
+            relationship = self.relationships[path]
+            info = {
+                'destination-location': path,
+                'source-location': path.replace('dst', 'src'),
+                'policy': 'MirrorAllSnapshots',
+                'mirror-state': relationship['state'],
+                'relationship-status': relationship['status'],
+                'lag-time': str(relationship['lag']),
+                'last-transfer-duration': '3',
+                'last-transfer-end-timestamp': relationship['end'],
+                'last-transfer-size': '1024'
+            }
+            if self.transfer_error and relationship['lag'] == 10:
+                info['last-transfer-error'] = self.transfer_error
+            snapmirror_info = netapp_utils.zapi.NaElement('snapmirror-info')
+            snapmirror_info.translate_struct(info)
+            attributes_list.add_child_elem(snapmirror_info)
+        xml.add_child_elem(attributes_list)
+        xml.add_new_child('num-records', str(len(paths[start:end])))
+        if end < len(paths):
+            xml.add_new_child('next-tag', str(end))
+        return xml
+
+    def get_calls(self, api):
+        ''' return the requests for an API '''
+        return [xml for xml in self.calls if xml.get_name() == api]
+
+
+RELATIONSHIPS = [('svm:vol1_dst', 'snapmirrored', 'idle'), ('svm:vol2_dst', 'snapmirrored', 'idle'),
+                 ('svm:vol3_dst', 'snapmirrored', 'transferring'), ('svm:vol4_dst', 'uninitialized', 'idle')]
+
+
+class TestMyModule(unittest.TestCase):
+    ''' a group of related Unit Tests '''
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule,
+                                                 exit_json=exit_json,
+                                                 fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+
+    @staticmethod
+    def set_default_args(**kwargs):
+        args = dict(
+            hostname='hostname',
+            username='username',
+            password='password',
+            max_concurrency=1
+        )
+        args.update(kwargs)
+        return args
+
+    @staticmethod
+    def call_apply(args, server, exc_class=AnsibleExitJson):
+        set_module_args(args)
+        my_obj = updates_module()
+        my_obj.server = server
+        with patch.object(netapp_utils, 'ems_log_event'):
+            with patch('time.sleep'):
+                with pytest.raises(exc_class) as exc:
+                    my_obj.apply()
+        return exc.value.args[0]
+
+    def test_module_fail_when_required_args_missing(self):
+        ''' required arguments are reported as errors '''
+        with pytest.raises(AnsibleFailJson) as exc:
+            set_module_args({})
+            updates_module()
+        print('Info: %s' % exc.value.args[0]['msg'])
+
+    def test_filters(self):
+        ''' filters are added to the query '''
+        server = MockONTAPConnection()
+        result = self.call_apply(self.set_default_args(destination_vserver='svm', policy='MirrorAllSnapshots'), server)
+        assert not result['changed']
+        assert result['relationships'] == []
+        query = server.calls[0]['query']['snapmirror-info']
+        assert query.get_child_content('destination-vserver') == 'svm'
+        assert query.get_child_content('policy') == 'MirrorAllSnapshots'
+
+    def test_update_and_wait(self):
+        ''' idle relationships are updated, and the transfers are awaited with a single query per poll '''
+        server = MockONTAPConnection(RELATIONSHIPS, transfer_polls=2)
+        result = self.call_apply(self.set_default_args(), server)
+        assert result['changed']
+        relationships = result['relationships']
+        assert [relationship['action'] for relationship in relationships] == ['update', 'update', None, None]
+        assert relationships[2]['skipped'] == 'relationship is transferring'
+        assert relationships[3]['skipped'] == 'mirror state is uninitialized'
+        assert relationships[0]['lag_time'] == 10
+        assert relationships[0]['last_transfer_duration'] == 3
+        assert 'transfer_time' in relationships[1]
+        assert relationships[2]['lag_time'] == 3600
+        assert len(server.get_calls('snapmirror-update')) == 2
+        # 1 to list, 3 polls
+        assert len(server.get_calls('snapmirror-get-iter')) == 4
+
+    def test_paginated_query(self):
+        ''' relationships are collected across pages '''
+        server = MockONTAPConnection(RELATIONSHIPS, page_size=3)
+        result = self.call_apply(self.set_default_args(wait_for_completion=False), server)
+        assert len(result['relationships']) == 4
+        assert len(server.get_calls('snapmirror-get-iter')) == 2
+        assert 'transfer_time' not in result['relationships'][0]
+
+    def test_check_mode(self):
+        ''' updates are reported, no change is made in check mode '''
+        server = MockONTAPConnection(RELATIONSHIPS)
+        args = self.set_default_args()
+        args['_ansible_check_mode'] = True
+        result = self.call_apply(args, server)
+        assert result['changed']
+        assert len(server.calls) == 1
+
+    def test_errors_are_reported_per_relationship(self):
+        ''' update and transfer errors are collected '''
+        server = MockONTAPConnection(RELATIONSHIPS, fail_update='svm:vol1_dst', transfer_error='source unreachable')
+        result = self.call_apply(self.set_default_args(), server, AnsibleFailJson)
+        assert result['changed']
+        assert result['relationships'][0]['error'] == \
+            'Error updating SnapMirror svm:vol1_dst: NetApp API failed. Reason - TEST:forced error'
+        assert result['relationships'][1]['error'] == 'Error transferring SnapMirror svm:vol2_dst: source unreachable'
+        assert result['msg'].startswith('Error updating 2 SnapMirror relationship(s)')
+
+    def test_timeout(self):
+        ''' transfers that do not complete are reported '''
+        server = MockONTAPConnection(RELATIONSHIPS, transfer_polls=100)
+        result = self.call_apply(self.set_default_args(time_out=0), server, AnsibleFailJson)
+        assert 'timed out after 0 seconds waiting for SnapMirror svm:vol1_dst' in result['relationships'][0]['error']
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.setup_na_ontap_zapi')
+    def test_concurrent_updates(self, mock_setup):
+        ''' workers use their own connection '''
+        paths = [('svm:vol%d_dst' % index, 'snapmirrored', 'idle') for index in range(10)]
+        server = MockONTAPConnection(paths)
+        worker_server = MockONTAPConnection(paths)
+        mock_setup.return_value = worker_server
+        result = self.call_apply(self.set_default_args(max_concurrency=3, wait_for_completion=False), server)
+        assert result['changed']
+        assert len(worker_server.get_calls('snapmirror-update')) == 10
+        assert not server.get_calls('snapmirror-update')
+        # 1 connection for the module, 3 for the workers
+        assert mock_setup.call_count == 4
@@ -927,7 +927,7 @@ class TestMyModule(unittest.TestCase):
         job = 'job_info'
         success = 'success_modify_async'
         mount = 'job_info'  # not correct, but works
-        kind = [online, job, job, success, mount, job, job]
+        kind = [online, job, success, job, mount]
         obj = self.get_volume_mock_object(kind)
         with pytest.raises(AnsibleExitJson) as exc:
             obj.apply()
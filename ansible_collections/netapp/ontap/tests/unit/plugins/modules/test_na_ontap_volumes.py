@@ -0,0 +1,247 @@
+# (c) 2020, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for ONTAP Ansible module: na_ontap_volumes '''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import json
+import pytest
+
+from ansible_collections.netapp.ontap.tests.unit.compat import unittest
+from ansible_collections.netapp.ontap.tests.unit.compat.mock import patch
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+
+from ansible_collections.netapp.ontap.plugins.modules.na_ontap_volumes \
+    import NetAppOntapVolumes as volumes_module  # module under test
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip('skipping as missing required netapp_lib')
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class MockONTAPConnection(object):
+    ''' mock server connection to ONTAP host, answering based on the API name '''
+
+    def __init__(self, volumes=None, page_size=None, errors=None):
+        ''' save arguments '''
+        self.volumes = volumes or list()
+        self.page_size = page_size
+        self.errors = errors or dict()
+        self.calls = list()
+
+    def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
+        ''' mock invoke_successfully returning xml data '''
+        api = xml.get_name()
+        self.calls.append(xml)
+        if api in self.errors:
+            raise netapp_utils.zapi.NaApiError('test', self.errors[api])
+        if api == 'volume-get-iter':
+            return self.build_volume_page(xml.get_child_content('tag'))
+        if api == 'volume-modify-iter':
+            xml = netapp_utils.zapi.NaElement('xml')
+            xml.translate_struct({'num-succeeded': '1', 'num-failed': '0'})
+            return xml
+        return netapp_utils.zapi.NaElement('xml')
+
+    def build_volume_page(self, tag):
+        ''' build xml data for volume-attributes, using the tag as the page index '''
+        start = int(tag) if tag else 0
+        end = start + self.page_size if self.page_size else len(self.volumes)
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes_list = netapp_utils.zapi.NaElement('attributes-list')
+        for volume in self.volumes[start:end]:
+            volume_attributes = netapp_utils.zapi.NaElement('volume-attributes')
+            volume_attributes.translate_struct({
+                'volume-id-attributes': {
+                    'name': volume['name'],
+                    'containing-aggregate-name': volume.get('aggregate_name', 'aggr1'),
+                    'junction-path': volume.get('junction_path', '/' + volume['name'])
+                },
+                'volume-space-attributes': {
+                    'size': str(volume.get('size', 10 * 1024 ** 3)),
+                    'space-guarantee': 'none',
+                    'percentage-snapshot-reserve': '5'
+                },
+                'volume-export-attributes': {
+                    'policy': volume.get('policy', 'default')
+                },
+                'volume-snapshot-attributes': {
+                    'snapshot-policy': 'default'
+                }
+            })
+            attributes_list.add_child_elem(volume_attributes)
+        xml.add_child_elem(attributes_list)
+        xml.add_new_child('num-records', str(len(self.volumes[start:end])))
+        if end < len(self.volumes):
+            xml.add_new_child('next-tag', str(end))
+        return xml
+
+    def get_calls(self, api):
+        ''' return the requests for an API '''
+        return [xml for xml in self.calls if xml.get_name() == api]
+
+
+class TestMyModule(unittest.TestCase):
+    ''' a group of related Unit Tests '''
+
+    def setUp(self):
+        self.mock_module_helper = patch.multiple(basic.AnsibleModule,
+                                                 exit_json=exit_json,
+                                                 fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+
+    @staticmethod
+    def set_default_args(volumes, **kwargs):
+        args = dict(
+            hostname='hostname',
+            username='username',
+            password='password',
+            vserver='vserver',
+            volumes=volumes,
+            max_concurrency=1
+        )
+        args.update(kwargs)
+        return args
+
+    def get_volumes_mock_object(self, server):
+        """ Helper method to return an na_ontap_volumes object """
+        volumes_obj = volumes_module()
+        volumes_obj.server = server
+        return volumes_obj
+
+    def call_apply(self, args, server, exc_class=AnsibleExitJson):
+        set_module_args(args)
+        my_obj = self.get_volumes_mock_object(server)
+        with patch.object(netapp_utils, 'ems_log_event'):
+            with pytest.raises(exc_class) as exc:
+                my_obj.apply()
+        return exc.value.args[0]
+
+    def test_module_fail_when_required_args_missing(self):
+        ''' required arguments are reported as errors '''
+        with pytest.raises(AnsibleFailJson) as exc:
+            set_module_args({})
+            volumes_module()
+        print('Info: %s' % exc.value.args[0]['msg'])
+
+    def test_duplicate_names(self):
+        ''' a volume can only be listed once '''
+        set_module_args(self.set_default_args([dict(name='vol1'), dict(name='vol1', state='absent')]))
+        with pytest.raises(AnsibleFailJson) as exc:
+            volumes_module()
+        assert exc.value.args[0]['msg'] == 'Error: volume vol1 is listed more than once'
+
+    def test_idempotent(self):
+        ''' no action when all volumes match, and a single query is used '''
+        server = MockONTAPConnection(volumes=[dict(name='vol1'), dict(name='vol2')])
+        volumes = [dict(name='vol1', size=10, policy='default'), dict(name='vol2', aggregate_name='aggr1'),
+                   dict(name='vol3', state='absent')]
+        result = self.call_apply(self.set_default_args(volumes), server)
+        assert not result['changed']
+        assert [volume['action'] for volume in result['volumes']] == [None, None, None]
+        calls = server.get_calls('volume-get-iter')
+        assert len(calls) == 1
+        assert calls[0]['query']['volume-attributes']['volume-id-attributes']['name'] == 'vol1|vol2|vol3'
+        assert len(server.calls) == 1
+
+    def test_paginated_query(self):
+        ''' volumes are collected across pages '''
+        server = MockONTAPConnection(volumes=[dict(name='vol%d' % index) for index in range(5)], page_size=2)
+        volumes = [dict(name='vol%d' % index, size=10) for index in range(6)]
+        volumes[5]['aggregate_name'] = 'aggr1'
+        result = self.call_apply(self.set_default_args(volumes, max_records=2), server)
+        assert result['changed']
+        assert [volume['action'] for volume in result['volumes']] == [None] * 5 + ['create']
+        assert len(server.get_calls('volume-get-iter')) == 3
+
+    def test_create_modify_delete(self):
+        ''' each volume is compared locally, and the required calls are made '''
+        server = MockONTAPConnection(volumes=[dict(name='vol1'), dict(name='vol2'), dict(name='vol3')])
+        volumes = [dict(name='vol1', size=20, policy='restricted', junction_path=''),
+                   dict(name='vol2', aggregate_name='aggr2'),
+                   dict(name='vol3', state='absent'),
+                   dict(name='vol4', size=1, size_unit='tb', aggregate_name='aggr1', comment='new')]
+        result = self.call_apply(self.set_default_args(volumes), server)
+        assert result['changed']
+        assert [volume['action'] for volume in result['volumes']] == ['modify', 'modify', 'delete', 'create']
+        assert result['volumes'][0]['modify'] == {'size': 20 * 1024 ** 3, 'policy': 'restricted', 'junction_path': ''}
+        modify = server.get_calls('volume-modify-iter')
+        assert len(modify) == 1
+        assert modify[0]['attributes']['volume-attributes']['volume-export-attributes']['policy'] == 'restricted'
+        assert server.get_calls('volume-size')[0]['new-size'] == str(20 * 1024 ** 3)
+        assert len(server.get_calls('volume-unmount')) == 1
+        assert server.get_calls('volume-move-start')[0]['dest-aggr'] == 'aggr2'
+        assert server.get_calls('volume-destroy')[0]['name'] == 'vol3'
+        create = server.get_calls('volume-create')[0]
+        assert create['size'] == str(1024 ** 4)
+        assert create['volume-comment'] == 'new'
+
+    def test_check_mode(self):
+        ''' no change is made in check mode '''
+        server = MockONTAPConnection(volumes=[dict(name='vol1')])
+        args = self.set_default_args([dict(name='vol1', state='absent')])
+        args['_ansible_check_mode'] = True
+        result = self.call_apply(args, server)
+        assert result['changed']
+        assert result['volumes'][0]['action'] == 'delete'
+        assert not server.get_calls('volume-destroy')
+
+    def test_errors_are_reported_per_volume(self):
+        ''' other volumes are still processed when one fails '''
+        server = MockONTAPConnection(volumes=[dict(name='vol1')], errors={'volume-size': 'no space'})
+        volumes = [dict(name='vol1', size=20), dict(name='vol2', size=10), dict(name='vol3', size=10, aggregate_name='aggr1')]
+        result = self.call_apply(self.set_default_args(volumes), server, AnsibleFailJson)
+        assert result['changed']
+        assert 'error' not in result['volumes'][2]
+        assert 'Error modifying volume vol1' in result['volumes'][0]['error']
+        assert 'error' in result['volumes'][1]
+        assert 'aggregate_name and size are required' in result['volumes'][1]['error']
+        assert result['msg'].startswith('Error managing 2 volume(s)')
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.setup_na_ontap_zapi')
+    def test_concurrent_actions(self, mock_setup):
+        ''' workers use their own connection '''
+        server = MockONTAPConnection(volumes=[dict(name='vol%d' % index) for index in range(10)])
+        worker_server = MockONTAPConnection()
+        mock_setup.return_value = worker_server
+        volumes = [dict(name='vol%d' % index, size=20) for index in range(10)]
+        result = self.call_apply(self.set_default_args(volumes, max_concurrency=3), server)
+        assert result['changed']
+        assert all(volume['action'] == 'modify' for volume in result['volumes'])
+        assert 'error' not in str(result['volumes'])
+        assert len(worker_server.get_calls('volume-size')) == 10
+        assert not server.get_calls('volume-size')
+        # 1 connection for the module, 3 for the workers
+        assert mock_setup.call_count == 4
@@ -46,6 +46,18 @@ options:
       description:
       - Override the default port (443) with this port
       type: int
+  http_retries:
+      description:
+      - Number of times a throttled (429) or unavailable (503) request is retried, with exponential backoff.
+      type: int
+      default: 3
+      version_added: 20.7.0
+  http_max_concurrency:
+      description:
+      - Maximum number of requests in flight to the UM host at the same time.
+      type: int
+      default: 10
+      version_added: 20.7.0
 
 
 requirements:
@@ -55,4 +67,36 @@ requirements:
 notes:
   - The modules prefixed with na\\_um are built to support the AIQUM/OCUM 9.7 platform.
 
+'''
+
+    # Documentation fragment for the AIQUM/OCUM list modules (um_list)
+    UM_LIST = r'''
+options:
+  fields:
+      description:
+      - List of fields to return for each record, for instance C(name) or C(cluster.name).
+      - By default, the fields selected by Unified Manager are returned.
+      type: list
+      elements: str
+      version_added: 20.7.0
+  query:
+      description:
+      - Dictionary of field names and values used to filter the records on Unified Manager.
+      - For instance C({'cluster.name': 'cluster1', 'state': 'online'}).
+      type: dict
+      version_added: 20.7.0
+  max_records:
+      description:
+      - Maximum number of records returned in a single page.
+      - All pages are collected by following the next links.
+      type: int
+      default: 1000
+      version_added: 20.7.0
+  max_concurrency:
+      description:
+      - Maximum number of pages fetched at the same time.
+      - With the default of 1, pages are fetched one at a time.
+      type: int
+      default: 1
+      version_added: 20.7.0
 '''
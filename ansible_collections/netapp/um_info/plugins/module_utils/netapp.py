@@ -30,7 +30,12 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import random
+import threading
+import time
+
 from ansible.module_utils.basic import missing_required_lib
+from ansible.module_utils.six.moves import queue
 
 try:
     from ansible.module_utils.ansible_release import __version__ as ansible_version
@@ -49,6 +54,31 @@ ERROR_MSG = dict(
     no_cserver='This module is expected to run as cluster admin'
 )
 
+# throttling or temporary unavailability, the request can be sent again
+RETRY_STATUS_CODES = (429, 503)
+
+# limit the number of requests in flight to a host, shared by all the clients in a process
+HOST_SEMAPHORES = dict()
+HOST_SEMAPHORES_LOCK = threading.Lock()
+
+
+def get_host_semaphore(host, max_concurrency):
+    ''' return the semaphore for a host, the first client to use a host sets the limit '''
+    with HOST_SEMAPHORES_LOCK:
+        if host not in HOST_SEMAPHORES:
+            HOST_SEMAPHORES[host] = threading.BoundedSemaphore(max_concurrency)
+        return HOST_SEMAPHORES[host]
+
+
+def get_retry_delay(attempt, backoff_factor, max_backoff, retry_after=None):
+    ''' exponential backoff with full jitter, a Retry-After header in seconds takes precedence if larger '''
+    delay = random.uniform(0, min(max_backoff, backoff_factor * 2 ** attempt))
+    try:
+        delay = max(delay, min(max_backoff, float(retry_after)))
+    except (TypeError, ValueError):
+        pass
+    return delay
+
 
 def na_um_host_argument_spec():
 
@@ -58,17 +88,42 @@ def na_um_host_argument_spec():
         password=dict(required=True, type='str', no_log=True),
         validate_certs=dict(required=False, type='bool', default=True),
         http_port=dict(required=False, type='int'),
+        http_retries=dict(required=False, type='int', default=3),
+        http_max_concurrency=dict(required=False, type='int', default=10),
+    )
+
+
+def na_um_list_argument_spec():
+
+    return dict(
+        fields=dict(required=False, type='list', elements='str'),
+        query=dict(required=False, type='dict'),
+        max_records=dict(required=False, type='int', default=1000),
+        max_concurrency=dict(required=False, type='int', default=1),
     )
 
 
 class UMRestAPI(object):
-    def __init__(self, module, timeout=60):
+    def __init__(self, module, timeout=60, pool_maxsize=10, keep_alive=True, retries=3, backoff_factor=0.5,
+                 max_backoff=30, max_host_concurrency=10):
         self.module = module
         self.username = self.module.params['username']
         self.password = self.module.params['password']
         self.hostname = self.module.params['hostname']
         self.verify = self.module.params['validate_certs']
         self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        # retry policy for throttled requests, the module options take precedence
+        self.retries = self.get_option('http_retries', retries)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        max_host_concurrency = self.get_option('http_max_concurrency', max_host_concurrency)
+        self.host_semaphore = get_host_semaphore(self.hostname, max_host_concurrency)
+        self.session = None
+        self.session_lock = threading.Lock()
+        self.stats = dict(requests=0, retries=0, request_time=0.0, max_request_time=0.0)
+        self.stats_lock = threading.Lock()
         if self.module.params.get('http_port') is not None:
             self.url = 'https://%s:%d/api/' % (self.hostname, self.module.params['http_port'])
         else:
@@ -77,10 +132,79 @@ class UMRestAPI(object):
         self.debug_logs = list()
         self.check_required_library()
 
+    def get_option(self, name, default):
+        value = self.module.params.get(name)
+        return default if value is None else value
+
     def check_required_library(self):
         if not HAS_REQUESTS:
             self.module.fail_json(msg=missing_required_lib('requests'))
 
+    def get_session(self):
+        ''' create a pooled session on first use, shared by the page workers '''
+        with self.session_lock:
+            if self.session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount('https://', adapter)
+                session.verify = self.verify
+                session.auth = (self.username, self.password)
+                if not self.keep_alive:
+                    session.headers['Connection'] = 'close'
+                self.session = session
+        return self.session
+
+    def get_stats(self):
+        ''' report requests, retries, and time spent in requests, and how many connections were opened or reused '''
+        with self.stats_lock:
+            stats = dict(self.stats)
+        stats['new_connections'] = 0
+        stats['reused_connections'] = 0
+        if self.session is None:
+            return stats
+        pools = self.session.get_adapter(self.url).poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats['new_connections'] += pool.num_connections
+            stats['reused_connections'] += max(0, pool.num_requests - pool.num_connections)
+        return stats
+
+    def update_stats(self, elapsed, retry=False):
+        with self.stats_lock:
+            if retry:
+                self.stats['retries'] += 1
+                return
+            self.stats['requests'] += 1
+            self.stats['request_time'] += elapsed
+            self.stats['max_request_time'] = max(self.stats['max_request_time'], elapsed)
+
+    def request_with_retry(self, method, url, **kwargs):
+        ''' send a request, and send it again with a jittered backoff when throttled
+            connection errors are only retried for GET, as the request may have been processed
+        '''
+        session = self.get_session()
+        attempt = 0
+        while True:
+            start = time.time()
+            try:
+                with self.host_semaphore:
+                    response = session.request(method, url, **kwargs)
+            except requests.exceptions.ConnectionError:
+                if method != 'GET' or attempt >= self.retries:
+                    raise
+                delay = get_retry_delay(attempt, self.backoff_factor, self.max_backoff)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.retries:
+                    return response
+                delay = get_retry_delay(attempt, self.backoff_factor, self.max_backoff, response.headers.get('Retry-After'))
+            finally:
+                self.update_stats(time.time() - start)
+            attempt += 1
+            self.update_stats(0, retry=True)
+            time.sleep(delay)
+
     def send_request(self, method, api, params, json=None, return_status_code=False, accept=None):
         ''' send http request and process response, including error conditions '''
         url = self.url + api
@@ -106,8 +230,7 @@ class UMRestAPI(object):
             return json, error
 
         try:
-            response = requests.request(method, url, verify=self.verify, auth=(self.username, self.password),
-                                        params=params, timeout=self.timeout, json=json, headers=headers)
+            response = self.request_with_retry(method, url, params=params, timeout=self.timeout, json=json, headers=headers)
             content = response.content  # for debug purposes
             status_code = response.status_code
             # If the response was successful, no Exception will be raised
@@ -137,6 +260,101 @@ class UMRestAPI(object):
         method = 'GET'
         return self.send_request(method, api, params)
 
+    def get_records(self, api, params=None):
+        ''' return all records, following _links.next, or fetching the remaining pages in parallel
+            fields, query, max_records and max_concurrency are read from the module parameters if present
+        '''
+        params = dict(params or {})
+        if self.module.params.get('fields'):
+            params['fields'] = ','.join(self.module.params['fields'])
+        if self.module.params.get('query'):
+            params.update(self.module.params['query'])
+        max_records = self.module.params.get('max_records')
+        if max_records:
+            params['max_records'] = max_records
+        max_concurrency = self.module.params.get('max_concurrency') or 1
+
+        message, error = self.get(api, params)
+        if error or message is None:
+            return None, error or self.no_response_error(api)
+        records = list(message.get('records') or [])
+        total_records = message.get('total_records')
+        next_api = self.get_next_api(message)
+        if next_api is None:
+            return records, None
+        if max_concurrency > 1 and max_records and total_records is not None and records:
+            parallel_records, error = self.get_pages_in_parallel(api, params, records, total_records, max_concurrency)
+            if error or len(parallel_records) == total_records:
+                return parallel_records, error
+            # a page was short, or the collection changed while paging, use the next links instead
+        return self.get_pages_sequentially(records, next_api)
+
+    def get_pages_sequentially(self, records, next_api):
+        ''' fetch the remaining pages following _links.next, the first page was already fetched '''
+        records = list(records)
+        while next_api is not None:
+            message, error = self.get(next_api, None)
+            if error or message is None:
+                return None, error or self.no_response_error(next_api)
+            records.extend(message.get('records') or [])
+            previous_api, next_api = next_api, self.get_next_api(message)
+            if next_api == previous_api:
+                break
+        return records, None
+
+    @staticmethod
+    def no_response_error(api):
+        return 'Error: no response received for %s' % api
+
+    @staticmethod
+    def get_next_api(message):
+        ''' return the next page api and query string, relative to /api/, or None '''
+        try:
+            href = message['_links']['next']['href']
+        except (KeyError, TypeError):
+            return None
+        if not href:
+            return None
+        index = href.find('/api/')
+        return href[index + len('/api/'):] if index >= 0 else href.lstrip('/')
+
+    def page_worker(self, api, params, tasks, results):
+        ''' fetch pages until a None offset is received '''
+        while True:
+            offset = tasks.get()
+            if offset is None:
+                return
+            params = dict(params)
+            params['offset'] = offset
+            results[offset] = self.get(api, params)
+
+    def get_pages_in_parallel(self, api, params, records, total_records, max_concurrency):
+        ''' fetch the remaining pages using offset, the first page was already fetched
+            the server may return fewer records than max_records, so offsets step by the size of the first page
+        '''
+        offsets = list(range(len(records), total_records, len(records)))
+        records = list(records)
+        tasks = queue.Queue()
+        results = dict()
+        workers = list()
+        for dummy in range(min(max_concurrency, len(offsets))):
+            worker = threading.Thread(target=self.page_worker, args=(api, params, tasks, results))
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+        for offset in offsets:
+            tasks.put(offset)
+        for dummy in workers:
+            tasks.put(None)
+        for worker in workers:
+            worker.join()
+        for offset in offsets:
+            message, error = results[offset]
+            if error or message is None:
+                return None, error or self.no_response_error('%s at offset %d' % (api, offset))
+            records.extend(message.get('records') or [])
+        return records, None
+
     def log_error(self, status_code, message):
         self.errors.append(message)
         self.debug_logs.append((status_code, message))
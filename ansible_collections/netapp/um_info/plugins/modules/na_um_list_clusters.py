@@ -17,6 +17,7 @@ module: na_um_list_clusters
 short_description: NetApp Unified Manager list cluster.
 extends_documentation_fragment:
     - netapp.um_info.netapp.um
+    - netapp.um_info.netapp.um_list
 version_added: '20.5.0'
 author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
 
@@ -87,6 +88,13 @@ records:
             'uuid': '...'
             }
             ]
+http_stats:
+    description:
+    - Statistics for the REST requests sent by the module, including the number of retries after throttling.
+    - request_time and max_request_time are in seconds.
+    returned: always
+    type: dict
+    sample: {"requests": 4, "retries": 1, "request_time": 1.2, "max_request_time": 0.6, "new_connections": 1, "reused_connections": 3}
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -100,6 +108,7 @@ class NetAppUMCluster(object):
 
     def __init__(self):
         self.argument_spec = netapp_utils.na_um_host_argument_spec()
+        self.argument_spec.update(netapp_utils.na_um_list_argument_spec())
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
             supports_check_mode=True
@@ -117,14 +126,11 @@ class NetAppUMCluster(object):
             Dictionary of current details if clusters found
             None if clusters is not found
         """
-        data = {}
         api = "datacenter/cluster/clusters"
-        message, error = self.restApi.get(api, data)
+        records, error = self.restApi.get_records(api)
         if error:
             self.module.fail_json(msg=error)
-        if message['total_records'] != 0:
-            return message['records']
-        return []
+        return records
 
     def apply(self):
         """
@@ -134,7 +140,7 @@ class NetAppUMCluster(object):
         current = self.get_clusters()
         if current is not None:
             self.na_helper.changed = True
-        self.module.exit_json(changed=self.na_helper.changed, msg=current)
+        self.module.exit_json(changed=self.na_helper.changed, msg=current, http_stats=self.restApi.get_stats())
 
 
 def main():
@@ -17,6 +17,7 @@ module: na_um_list_nodes
 short_description: NetApp Unified Manager list nodes.
 extends_documentation_fragment:
     - netapp.um_info.netapp.um
+    - netapp.um_info.netapp.um_list
 version_added: '20.5.0'
 author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
 
@@ -80,6 +81,13 @@ records:
               'health': ...,
               'name': '...'
             }]
+http_stats:
+    description:
+    - Statistics for the REST requests sent by the module, including the number of retries after throttling.
+    - request_time and max_request_time are in seconds.
+    returned: always
+    type: dict
+    sample: {"requests": 4, "retries": 1, "request_time": 1.2, "max_request_time": 0.6, "new_connections": 1, "reused_connections": 3}
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -93,6 +101,7 @@ class NetAppUMNode(object):
 
     def __init__(self):
         self.argument_spec = netapp_utils.na_um_host_argument_spec()
+        self.argument_spec.update(netapp_utils.na_um_list_argument_spec())
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
             supports_check_mode=True
@@ -110,14 +119,11 @@ class NetAppUMNode(object):
             Dictionary of current details if nodes found
             None if nodes is not found
         """
-        data = {}
         api = "datacenter/cluster/nodes"
-        message, error = self.restApi.get(api, data)
+        records, error = self.restApi.get_records(api)
         if error:
             self.module.fail_json(msg=error)
-        if message['total_records'] != 0:
-            return message['records']
-        return []
+        return records
 
     def apply(self):
         """
@@ -127,7 +133,7 @@ class NetAppUMNode(object):
         current = self.get_nodes()
         if current is not None:
             self.na_helper.changed = True
-        self.module.exit_json(changed=self.na_helper.changed, msg=current)
+        self.module.exit_json(changed=self.na_helper.changed, msg=current, http_stats=self.restApi.get_stats())
 
 
 def main():
@@ -17,6 +17,7 @@ module: na_um_list_volumes
 short_description: NetApp Unified Manager list volumes.
 extends_documentation_fragment:
     - netapp.um_info.netapp.um
+    - netapp.um_info.netapp.um_list
 version_added: '20.6.0'
 author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
 
@@ -30,6 +31,17 @@ EXAMPLES = """
     hostname: "{{ hostname }}"
     username: "{{ username }}"
     password: "{{ password }}"
+
+- name: List online volumes of a cluster, returning a few fields
+  na_um_list_volumes:
+    hostname: "{{ hostname }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    fields: ['name', 'svm.name', 'space.size']
+    query:
+      cluster.name: cluster1
+      state: online
+    max_concurrency: 4
 """
 
 RETURN = """
@@ -68,6 +80,13 @@ records:
               'type': '...',
               'uuid': '...'
               }]
+http_stats:
+    description:
+    - Statistics for the REST requests sent by the module, including the number of retries after throttling.
+    - request_time and max_request_time are in seconds.
+    returned: always
+    type: dict
+    sample: {"requests": 4, "retries": 1, "request_time": 1.2, "max_request_time": 0.6, "new_connections": 1, "reused_connections": 3}
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -81,6 +100,7 @@ class NetAppUMVolume(object):
 
     def __init__(self):
         self.argument_spec = netapp_utils.na_um_host_argument_spec()
+        self.argument_spec.update(netapp_utils.na_um_list_argument_spec())
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
             supports_check_mode=True
@@ -98,14 +118,11 @@ class NetAppUMVolume(object):
             Dictionary of current details if volumes found
             None if volumes is not found
         """
-        data = {}
         api = "datacenter/storage/volumes"
-        message, error = self.restApi.get(api, data)
+        records, error = self.restApi.get_records(api)
         if error:
             self.module.fail_json(msg=error)
-        if message['total_records'] != 0:
-            return message['records']
-        return []
+        return records
 
     def apply(self):
         """
@@ -115,7 +132,7 @@ class NetAppUMVolume(object):
         current = self.get_volumes()
         if current is not None:
             self.na_helper.changed = True
-        self.module.exit_json(changed=self.na_helper.changed, msg=current)
+        self.module.exit_json(changed=self.na_helper.changed, msg=current, http_stats=self.restApi.get_stats())
 
 
 def main():
@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 import json
 import pytest
+import requests
 
 from ansible_collections.netapp.um_info.tests.unit.compat import unittest
 from ansible_collections.netapp.um_info.tests.unit.compat.mock import patch, Mock
@@ -24,7 +25,12 @@ SRR = {
     'end_of_sequence': (None, "Unexpected call to send_request"),
     'generic_error': (None, "Expected error"),
     # module specific responses
-    'get_volumes': {'name': 'ansible'}
+    'get_volumes': {'name': 'ansible'},
+    'get_page_1': ({'records': [{'name': 'vol1'}, {'name': 'vol2'}], 'total_records': 5,
+                    '_links': {'next': {'href': '/api/datacenter/storage/volumes?max_records=2&offset=2'}}}, None),
+    'get_page_2': ({'records': [{'name': 'vol3'}, {'name': 'vol4'}], 'total_records': 5,
+                    '_links': {'next': {'href': '/api/datacenter/storage/volumes?max_records=2&offset=4'}}}, None),
+    'get_page_3': ({'records': [{'name': 'vol5'}], 'total_records': 5, '_links': {}}, None),
 }
 
 
@@ -117,3 +123,156 @@ class TestMyModule(unittest.TestCase):
         my_obj = my_module()
         my_obj.get_volumes = Mock(return_value=SRR['get_volumes'])
         assert my_obj.get_volumes() is not None
+
+    @patch('ansible_collections.netapp.um_info.plugins.module_utils.netapp.UMRestAPI.send_request')
+    def test_get_volumes_follows_next_links(self, mock_request):
+        ''' all pages are collected, fields and query are passed to the first call '''
+        args = self.set_default_args()
+        args.update(dict(max_records=2, fields=['name', 'svm.name'], query={'cluster.name': 'cluster1'}))
+        set_module_args(args)
+        mock_request.side_effect = [SRR['get_page_1'], SRR['get_page_2'], SRR['get_page_3'], SRR['end_of_sequence']]
+        my_obj = my_module()
+        records = my_obj.get_volumes()
+        assert [record['name'] for record in records] == ['vol1', 'vol2', 'vol3', 'vol4', 'vol5']
+        assert mock_request.call_count == 3
+        mock_request.assert_any_call('GET', 'datacenter/storage/volumes',
+                                     {'fields': 'name,svm.name', 'cluster.name': 'cluster1', 'max_records': 2})
+        mock_request.assert_called_with('GET', 'datacenter/storage/volumes?max_records=2&offset=4', None)
+
+    @patch('ansible_collections.netapp.um_info.plugins.module_utils.netapp.UMRestAPI.send_request')
+    def test_get_volumes_in_parallel(self, mock_request):
+        ''' remaining pages are fetched using offset, and records are kept in order '''
+        args = self.set_default_args()
+        args.update(dict(max_records=2, max_concurrency=2))
+        set_module_args(args)
+
+        def send_request(method, api, params):
+            return {None: SRR['get_page_1'], 2: SRR['get_page_2'], 4: SRR['get_page_3']}[params.get('offset')]
+
+        mock_request.side_effect = send_request
+        my_obj = my_module()
+        records = my_obj.get_volumes()
+        assert [record['name'] for record in records] == ['vol1', 'vol2', 'vol3', 'vol4', 'vol5']
+        assert mock_request.call_count == 3
+
+    @patch('ansible_collections.netapp.um_info.plugins.module_utils.netapp.UMRestAPI.send_request')
+    def test_get_volumes_in_parallel_capped_pages(self, mock_request):
+        ''' offsets step by the size of the first page when the server returns fewer records than requested '''
+        args = self.set_default_args()
+        args.update(dict(max_records=1000, max_concurrency=2))
+        set_module_args(args)
+
+        def send_request(method, api, params):
+            return {None: SRR['get_page_1'], 2: SRR['get_page_2'], 4: SRR['get_page_3']}[params.get('offset')]
+
+        mock_request.side_effect = send_request
+        my_obj = my_module()
+        records = my_obj.get_volumes()
+        assert [record['name'] for record in records] == ['vol1', 'vol2', 'vol3', 'vol4', 'vol5']
+        assert sorted(str(call[0][2].get('offset')) for call in mock_request.call_args_list) == ['2', '4', 'None']
+
+    @patch('ansible_collections.netapp.um_info.plugins.module_utils.netapp.UMRestAPI.send_request')
+    def test_get_volumes_in_parallel_count_mismatch(self, mock_request):
+        ''' next links are followed when the records fetched in parallel do not match total_records '''
+        args = self.set_default_args()
+        args.update(dict(max_records=2, max_concurrency=2))
+        set_module_args(args)
+
+        def send_request(method, api, params):
+            if params is None:
+                return {'datacenter/storage/volumes?max_records=2&offset=2': SRR['get_page_2'],
+                        'datacenter/storage/volumes?max_records=2&offset=4': SRR['get_page_3']}[api]
+            # a short page
+            return {None: SRR['get_page_1'], 2: SRR['get_page_3'], 4: SRR['get_page_3']}[params.get('offset')]
+
+        mock_request.side_effect = send_request
+        my_obj = my_module()
+        records = my_obj.get_volumes()
+        assert [record['name'] for record in records] == ['vol1', 'vol2', 'vol3', 'vol4', 'vol5']
+
+    @patch('ansible_collections.netapp.um_info.plugins.module_utils.netapp.UMRestAPI.send_request')
+    def test_get_volumes_no_response(self, mock_request):
+        ''' an empty response is reported as an error '''
+        args = self.set_default_args()
+        args.update(dict(max_records=2))
+        set_module_args(args)
+        mock_request.side_effect = [SRR['get_page_1'], (None, None)]
+        my_obj = my_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.get_volumes()
+        assert exc.value.args[0]['msg'] == \
+            'Error: no response received for datacenter/storage/volumes?max_records=2&offset=2'
+
+    @patch('ansible_collections.netapp.um_info.plugins.module_utils.netapp.UMRestAPI.send_request')
+    def test_get_volumes_page_error(self, mock_request):
+        ''' an error on any page is reported '''
+        args = self.set_default_args()
+        args.update(dict(max_records=2))
+        set_module_args(args)
+        mock_request.side_effect = [SRR['get_page_1'], SRR['generic_error']]
+        my_obj = my_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.get_volumes()
+        assert exc.value.args[0]['msg'] == 'Expected error'
+
+    @patch('time.sleep')
+    def test_send_request_retries_when_throttled(self, mock_sleep):
+        ''' 429 and 503 are retried with a backoff, Retry-After is honored, and the session is reused '''
+        set_module_args(self.set_default_args())
+        my_obj = my_module()
+        responses = [Mock(status_code=429, headers={'Retry-After': '2'}), Mock(status_code=503, headers={}),
+                     Mock(status_code=200, headers={}, content='{}')]
+        responses[2].json.return_value = {'records': [{'name': 'vol1'}]}
+        session = my_obj.restApi.get_session()
+        with patch.object(session, 'request', side_effect=responses) as mock_request:
+            message, error = my_obj.restApi.get('datacenter/storage/volumes', None)
+        assert error is None
+        assert message['records'] == [{'name': 'vol1'}]
+        assert mock_request.call_count == 3
+        assert my_obj.restApi.get_session() is session
+        assert mock_sleep.call_args_list[0][0][0] == 2
+        assert mock_sleep.call_args_list[1][0][0] <= 1
+        stats = my_obj.restApi.get_stats()
+        assert stats['requests'] == 3
+        assert stats['retries'] == 2
+
+    @patch('time.sleep')
+    def test_send_request_retry_limit(self, mock_sleep):
+        ''' the last response is reported once the retries are exhausted '''
+        set_module_args(self.set_default_args())
+        my_obj = my_module()
+        response = Mock(status_code=503, headers={}, content='')
+        response.json.return_value = {'error': 'busy'}
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError('503 Server Error')
+        with patch.object(my_obj.restApi.get_session(), 'request', return_value=response) as mock_request:
+            message, error = my_obj.restApi.get('datacenter/storage/volumes', None)
+        assert error == 'busy'
+        assert mock_request.call_count == my_obj.restApi.retries + 1
+        assert mock_sleep.call_count == my_obj.restApi.retries
+
+    @patch('time.sleep')
+    def test_send_request_http_retries_option(self, mock_sleep):
+        ''' http_retries overrides the default retry policy '''
+        args = self.set_default_args()
+        args['http_retries'] = 1
+        set_module_args(args)
+        my_obj = my_module()
+        response = Mock(status_code=429, headers={}, content='')
+        response.json.return_value = {'error': 'busy'}
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError('429 Too Many Requests')
+        with patch.object(my_obj.restApi.get_session(), 'request', return_value=response) as mock_request:
+            message, error = my_obj.restApi.get('datacenter/storage/volumes', None)
+        assert error == 'busy'
+        assert mock_request.call_count == 2
+        assert mock_sleep.call_count == 1
+
+    @patch('ansible_collections.netapp.um_info.plugins.modules.na_um_list_volumes.NetAppUMVolume.get_volumes')
+    def test_apply_reports_http_stats(self, get_volumes):
+        ''' the request statistics are returned '''
+        set_module_args(self.set_default_args())
+        my_obj = my_module()
+        get_volumes.return_value = SRR['get_volumes']
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['http_stats']['requests'] == 0
+        assert exc.value.args[0]['http_stats']['retries'] == 0